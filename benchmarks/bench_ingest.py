@@ -0,0 +1,61 @@
+"""
+Benchmark bitemporal ingestion into an in-memory AxiusMEM™ graph.
+
+Compares the per-triple path (``graph.add`` plus one temporal helper call per triple) with the
+batched :func:`axiusmem.temporal.add_temporal_triples` path used by ``AxiusMEM.add_triples``.
+
+Each path ingests into its own graph, one after the other. With the temporal index attached, the
+in-memory store takes about 7.5 KB per bitemporal triple (the triple, its reification node and the
+index entries), so the default of 1M triples needs about 8 GB of memory; pass a smaller --triples
+on smaller machines.
+
+Usage:
+    python benchmarks/bench_ingest.py [--triples 1000000] [--no-index]
+"""
+import argparse
+import time
+from rdflib import Graph, Literal, Namespace
+from axiusmem.temporal import add_bitemporal, add_temporal_triples, attach_temporal_index
+
+EX = Namespace("http://example.org/")
+VALID_FROM, TRANSACTION_FROM = "2024-01-01", "2024-01-02T09:00:00Z"
+
+
+def make_triples(n):
+    return [(EX[f"s{i}"], EX[f"p{i % 16}"], Literal(i)) for i in range(n)]
+
+
+def per_triple(graph, triples):
+    for triple in triples:
+        graph.add(triple)
+        add_bitemporal(graph, triple, VALID_FROM, TRANSACTION_FROM)
+
+
+def batched(graph, triples):
+    add_temporal_triples(graph, triples, valid_from=VALID_FROM, transaction_from=TRANSACTION_FROM)
+
+
+def run(name, ingest, triples, index):
+    graph = Graph()
+    if index:
+        attach_temporal_index(graph)
+    start = time.perf_counter()
+    ingest(graph, triples)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {len(triples):>10,} triples  {elapsed:8.2f} s  {len(triples) / elapsed:>10,.0f} triples/s  ({len(graph):,} stored)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--triples", type=int, default=1_000_000, help="Triples per batch")
+    parser.add_argument("--no-index", action="store_true", help="Do not attach a temporal index")
+    args = parser.parse_args()
+    triples = make_triples(args.triples)
+    baseline = run("per-triple", per_triple, triples, not args.no_index)
+    fast = run("batched", batched, triples, not args.no_index)
+    print(f"speedup      {baseline / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ setup(
     install_requires=[
         "rdflib>=6.0.0",
         "requests>=2.25.0",
+        "httpx>=0.23.0",
         "pandas>=1.3.0",
         "python-dotenv>=0.19.0",
         "langchain>=0.1.0",
@@ -5,6 +5,8 @@ Supports RDF, SPARQL, OWL, bi-temporal data, and GraphDB integration.
 from .core import AxiusMEM
 from .graphdb_adapter import GraphDBAdapter
 from .temporal import *
+from .temporal_index import *
+from .ingest import *
 from .agent_utils import *
 from .orm import *
 from .query_engine import *
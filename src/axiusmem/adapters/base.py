@@ -1,4 +1,16 @@
 import abc
+import asyncio
+import contextlib
+import inspect
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock
+
+# Default number of pooled HTTP connections kept per triplestore host
+DEFAULT_POOL_SIZE = 10
+# Default cap on concurrent connections opened by an async adapter
+DEFAULT_MAX_CONNECTIONS = 100
 
 class BaseTriplestoreAdapter(abc.ABC):
     """
@@ -82,20 +94,566 @@ class BaseTriplestoreAdapter(abc.ABC):
         """Run a SPARQL query against a named graph and return results."""
         pass
 
+    def sparql_select_iter(self, query: str, **kwargs):
+        """
+        Execute a SPARQL SELECT query, yielding SPARQL JSON bindings one at a time.
+
+        Adapters that can stream the response override this; the default runs
+        :meth:`sparql_select` and iterates over its bindings.
+        """
+        from axiusmem.adapters.sparql_results import result_bindings
+        yield from result_bindings(self.sparql_select(query, **kwargs))
+
+    # Transaction-scoped writes
+    def transaction_add(self, tx_id, triples, graph_uri=None, **kwargs):
+        """
+        Add (s, p, o) triples inside an open transaction; they become visible on commit.
+
+        Adapters without a transaction protocol raise NotImplementedError.
+
+        Args:
+            tx_id: Transaction ID from :meth:`begin_transaction`.
+            triples (Iterable): Triples of rdflib terms or plain values.
+            graph_uri (str, optional): Named graph (default graph if None).
+        """
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    def transaction_remove(self, tx_id, triples, graph_uri=None, **kwargs):
+        """Remove (s, p, o) triples inside an open transaction (see :meth:`transaction_add`)."""
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    def transaction_update(self, tx_id, update_query: str, **kwargs):
+        """Execute a SPARQL UPDATE inside an open transaction (see :meth:`transaction_add`)."""
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Context manager running a block in one transaction: committed if the block completes,
+        rolled back if it raises.
+
+        Example:
+            >>> with adapter.transaction() as tx_id:
+            ...     adapter.transaction_add(tx_id, triples, graph_uri="http://ex.org/g")
+            ...     adapter.transaction_update(tx_id, "DELETE WHERE { ?s <http://ex.org/stale> ?o }")
+        """
+        tx_id = self.begin_transaction()
+        try:
+            yield tx_id
+        except BaseException:
+            try:
+                self.rollback_transaction(tx_id)
+            except Exception as e:
+                logging.getLogger("axiusmem.adapters").warning(f"Rollback of transaction {tx_id} failed: {e}")
+            raise
+        self.commit_transaction(tx_id)
+
+    # Temporal queries
+    def sparql_select_temporal(self, query: str, valid_time=None, as_of=None, valid_interval=None, transaction_interval=None, **kwargs):
+        """
+        Execute a SPARQL SELECT restricted to triples valid/known at the given times, server-side.
+
+        The query is rewritten by :func:`axiusmem.query_engine.rewrite_temporal_query` to join
+        against the reified temporal statements, then run with :meth:`sparql_select`.
+        """
+        from axiusmem.query_engine import rewrite_temporal_query
+        rewritten = rewrite_temporal_query(
+            query,
+            valid_time=valid_time,
+            as_of=as_of,
+            valid_interval=valid_interval,
+            transaction_interval=transaction_interval,
+        )
+        return self.sparql_select(rewritten, **kwargs)
+
+
+class AsyncBaseTriplestoreAdapter(abc.ABC):
+    """
+    Abstract base class for asyncio triplestore adapters in AxiusMEM™.
+    Mirrors :class:`BaseTriplestoreAdapter` with coroutine methods, so many triplestore calls can
+    be in flight on one event loop.
+    """
+    @abc.abstractmethod
+    async def connect(self):
+        """Establish a connection to the triplestore."""
+        pass
+
+    @abc.abstractmethod
+    async def close(self):
+        """Close the connection to the triplestore."""
+        pass
+
+    @abc.abstractmethod
+    async def sparql_select(self, query: str, **kwargs):
+        """Execute a SPARQL SELECT query."""
+        pass
+
+    @abc.abstractmethod
+    async def sparql_update(self, update_query: str, **kwargs):
+        """Execute a SPARQL UPDATE query."""
+        pass
+
+    @abc.abstractmethod
+    async def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle"):
+        """Bulk load RDF data into the triplestore."""
+        pass
+
+    @abc.abstractmethod
+    async def test_connection(self):
+        """Test the connection to the triplestore."""
+        pass
+
+    # Transaction support
+    @abc.abstractmethod
+    async def begin_transaction(self):
+        """Begin a new transaction. Returns a transaction ID or handle."""
+        pass
+
+    @abc.abstractmethod
+    async def commit_transaction(self, tx_id):
+        """Commit the transaction with the given ID."""
+        pass
+
+    @abc.abstractmethod
+    async def rollback_transaction(self, tx_id):
+        """Rollback the transaction with the given ID."""
+        pass
+
+    # Named graph management
+    @abc.abstractmethod
+    async def list_named_graphs(self):
+        """List all named graphs in the triplestore."""
+        pass
+
+    @abc.abstractmethod
+    async def create_named_graph(self, graph_uri):
+        """Create a new named graph (may be a no-op for some stores)."""
+        pass
+
+    @abc.abstractmethod
+    async def delete_named_graph(self, graph_uri):
+        """Delete a named graph and all its triples."""
+        pass
+
+    @abc.abstractmethod
+    async def clear_named_graph(self, graph_uri):
+        """Remove all triples from a named graph, but keep the graph itself."""
+        pass
+
+    @abc.abstractmethod
+    async def add_triples_to_named_graph(self, graph_uri, triples):
+        """Add triples to a named graph."""
+        pass
+
+    @abc.abstractmethod
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        """Run a SPARQL query against a named graph and return results."""
+        pass
+
+    async def sparql_select_iter(self, query: str, **kwargs):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.sparql_select_iter`."""
+        from axiusmem.adapters.sparql_results import result_bindings
+        for binding in result_bindings(await self.sparql_select(query, **kwargs)):
+            yield binding
+
+    # Transaction-scoped writes
+    async def transaction_add(self, tx_id, triples, graph_uri=None, **kwargs):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.transaction_add`."""
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    async def transaction_remove(self, tx_id, triples, graph_uri=None, **kwargs):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.transaction_remove`."""
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    async def transaction_update(self, tx_id, update_query: str, **kwargs):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.transaction_update`."""
+        raise NotImplementedError(f"{type(self).__name__}: transaction-scoped writes are not supported.")
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.transaction`."""
+        tx_id = await self.begin_transaction()
+        try:
+            yield tx_id
+        except BaseException:
+            try:
+                await self.rollback_transaction(tx_id)
+            except Exception as e:
+                logging.getLogger("axiusmem.adapters").warning(f"Rollback of transaction {tx_id} failed: {e}")
+            raise
+        await self.commit_transaction(tx_id)
+
+    # Temporal queries
+    async def sparql_select_temporal(self, query: str, valid_time=None, as_of=None, valid_interval=None, transaction_interval=None, **kwargs):
+        """Async counterpart of :meth:`BaseTriplestoreAdapter.sparql_select_temporal`."""
+        from axiusmem.query_engine import rewrite_temporal_query
+        rewritten = rewrite_temporal_query(
+            query,
+            valid_time=valid_time,
+            as_of=as_of,
+            valid_interval=valid_interval,
+            transaction_interval=transaction_interval,
+        )
+        return await self.sparql_select(rewritten, **kwargs)
+
+
+class DelegatingAdapter(BaseTriplestoreAdapter):
+    """
+    Base for adapter decorators: forwards every adapter method, and any other attribute, to the
+    wrapped adapter. Subclasses override only the methods they change.
+
+    Args:
+        adapter (BaseTriplestoreAdapter): The adapter to wrap.
+    """
+    def __init__(self, adapter):
+        self.adapter = adapter
+
+    def __getattr__(self, name):
+        return getattr(self.adapter, name)
+
+    def connect(self):
+        return self.adapter.connect()
+
+    def close(self):
+        return self.adapter.close()
+
+    def sparql_select(self, query: str, **kwargs):
+        return self.adapter.sparql_select(query, **kwargs)
+
+    def sparql_select_iter(self, query: str, **kwargs):
+        return self.adapter.sparql_select_iter(query, **kwargs)
+
+    def sparql_update(self, update_query: str, **kwargs):
+        return self.adapter.sparql_update(update_query, **kwargs)
+
+    def bulk_load(self, rdf_path: str, *args, **kwargs):
+        return self.adapter.bulk_load(rdf_path, *args, **kwargs)
+
+    def test_connection(self):
+        return self.adapter.test_connection()
+
+    def begin_transaction(self):
+        return self.adapter.begin_transaction()
+
+    def commit_transaction(self, tx_id):
+        return self.adapter.commit_transaction(tx_id)
+
+    def rollback_transaction(self, tx_id):
+        return self.adapter.rollback_transaction(tx_id)
+
+    def list_named_graphs(self):
+        return self.adapter.list_named_graphs()
+
+    def create_named_graph(self, graph_uri):
+        return self.adapter.create_named_graph(graph_uri)
+
+    def delete_named_graph(self, graph_uri):
+        return self.adapter.delete_named_graph(graph_uri)
+
+    def clear_named_graph(self, graph_uri):
+        return self.adapter.clear_named_graph(graph_uri)
+
+    def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        return self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs)
+
+    def get_triples_from_named_graph(self, graph_uri, query):
+        return self.adapter.get_triples_from_named_graph(graph_uri, query)
+
+    def transaction_add(self, tx_id, triples, graph_uri=None, **kwargs):
+        return self.adapter.transaction_add(tx_id, triples, graph_uri, **kwargs)
+
+    def transaction_remove(self, tx_id, triples, graph_uri=None, **kwargs):
+        return self.adapter.transaction_remove(tx_id, triples, graph_uri, **kwargs)
+
+    def transaction_update(self, tx_id, update_query: str, **kwargs):
+        return self.adapter.transaction_update(tx_id, update_query, **kwargs)
+
+
+class AsyncDelegatingAdapter(AsyncBaseTriplestoreAdapter):
+    """Async counterpart of :class:`DelegatingAdapter`, wrapping an :class:`AsyncBaseTriplestoreAdapter`."""
+    def __init__(self, adapter):
+        self.adapter = adapter
+
+    def __getattr__(self, name):
+        return getattr(self.adapter, name)
+
+    async def connect(self):
+        return await self.adapter.connect()
+
+    async def close(self):
+        return await self.adapter.close()
+
+    async def sparql_select(self, query: str, **kwargs):
+        return await self.adapter.sparql_select(query, **kwargs)
+
+    async def sparql_select_iter(self, query: str, **kwargs):
+        async for binding in self.adapter.sparql_select_iter(query, **kwargs):
+            yield binding
+
+    async def sparql_update(self, update_query: str, **kwargs):
+        return await self.adapter.sparql_update(update_query, **kwargs)
+
+    async def bulk_load(self, rdf_path: str, *args, **kwargs):
+        return await self.adapter.bulk_load(rdf_path, *args, **kwargs)
+
+    async def test_connection(self):
+        return await self.adapter.test_connection()
+
+    async def begin_transaction(self):
+        return await self.adapter.begin_transaction()
+
+    async def commit_transaction(self, tx_id):
+        return await self.adapter.commit_transaction(tx_id)
+
+    async def rollback_transaction(self, tx_id):
+        return await self.adapter.rollback_transaction(tx_id)
+
+    async def list_named_graphs(self):
+        return await self.adapter.list_named_graphs()
+
+    async def create_named_graph(self, graph_uri):
+        return await self.adapter.create_named_graph(graph_uri)
+
+    async def delete_named_graph(self, graph_uri):
+        return await self.adapter.delete_named_graph(graph_uri)
+
+    async def clear_named_graph(self, graph_uri):
+        return await self.adapter.clear_named_graph(graph_uri)
+
+    async def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        return await self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs)
+
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        return await self.adapter.get_triples_from_named_graph(graph_uri, query)
+
+    async def transaction_add(self, tx_id, triples, graph_uri=None, **kwargs):
+        return await self.adapter.transaction_add(tx_id, triples, graph_uri, **kwargs)
+
+    async def transaction_remove(self, tx_id, triples, graph_uri=None, **kwargs):
+        return await self.adapter.transaction_remove(tx_id, triples, graph_uri, **kwargs)
+
+    async def transaction_update(self, tx_id, update_query: str, **kwargs):
+        return await self.adapter.transaction_update(tx_id, update_query, **kwargs)
+
+
+def mount_connection_pool(session, pool_size=None):
+    """
+    Size the HTTP connection pool of a requests session.
+
+    Args:
+        session (requests.Session): The session to configure.
+        pool_size (int, optional): Connections kept alive per host. Defaults to the
+            TRIPLESTORE_POOL_SIZE env var, or DEFAULT_POOL_SIZE.
+
+    Returns:
+        requests.Session: The session.
+    """
+    from requests.adapters import HTTPAdapter
+    if pool_size is None:
+        pool_size = int(os.getenv("TRIPLESTORE_POOL_SIZE", DEFAULT_POOL_SIZE))
+    http_adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", http_adapter)
+    session.mount("https://", http_adapter)
+    return session
+
+
+def async_connection_limits(pool_size=None):
+    """
+    Connection limits for the ``httpx.AsyncClient`` of an async adapter.
+
+    Args:
+        pool_size (int, optional): Keep-alive connections per host. Defaults to the
+            TRIPLESTORE_POOL_SIZE env var, or DEFAULT_POOL_SIZE.
+
+    Returns:
+        httpx.Limits: Limits allowing up to TRIPLESTORE_MAX_CONNECTIONS (default
+        DEFAULT_MAX_CONNECTIONS) concurrent connections.
+    """
+    import httpx
+    if pool_size is None:
+        pool_size = int(os.getenv("TRIPLESTORE_POOL_SIZE", DEFAULT_POOL_SIZE))
+    max_connections = max(pool_size, int(os.getenv("TRIPLESTORE_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)))
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=pool_size)
+
+
+class UnknownRepositoryError(ValueError):
+    """Raised by :class:`AdapterRegistry` for a repository that is not in its allow-list."""
+
+
+class AdapterRegistry:
+    """
+    Thread-safe registry holding one long-lived adapter per repository/dataset.
+
+    Adapters are built by the factory on first use and then shared, so their HTTP sessions and
+    pooled connections are reused across requests. A factory failure is not cached; the next
+    lookup tries again.
+
+    Repository names often come from clients, so the registry can be bounded: only repositories
+    in ``allowed`` (plus the default, None) are accepted, and at most ``maxsize`` adapters are
+    kept, the least recently used one being dropped to make room. Callers take a :meth:`lease`
+    on the adapter while they use it; a dropped adapter is closed once its last lease is
+    released, so eviction never closes a session under a request in flight.
+
+    Args:
+        factory (callable): Called as ``factory(repository=...)`` to build an adapter.
+        maxsize (int, optional): Adapters kept at most (unbounded if None).
+        allowed (iterable of str, optional): Repository names accepted besides the default
+            (any if None, none if empty).
+
+    Raises:
+        UnknownRepositoryError: From :meth:`get` and :meth:`lease`, for a repository not in ``allowed``.
+
+    Example:
+        >>> registry = AdapterRegistry(get_triplestore_adapter_from_env, maxsize=8, allowed=["repo-a", "repo-b"])
+        >>> with registry.lease("repo-a") as adapter:
+        ...     rows = adapter.sparql_select("SELECT * WHERE { ?s ?p ?o } LIMIT 1")
+        >>> registry.close()
+    """
+    def __init__(self, factory, maxsize=None, allowed=None):
+        self.factory = factory
+        self.maxsize = maxsize
+        self.allowed = frozenset(allowed) if allowed is not None else None
+        self._adapters = OrderedDict()
+        # Leases held per adapter (by id), and evicted adapters waiting for theirs to end
+        self._leases = {}
+        self._retired = {}
+        self._lock = Lock()
+        self._closing = set()
+
+    def get(self, repository=None):
+        """
+        Return the adapter for a repository (None for the configured default), building it if needed.
+
+        The adapter is not leased: it may be closed if it is evicted while still in use.
+        """
+        return self._lookup(repository, lease=False)
+
+    def acquire(self, repository=None):
+        """Return the adapter for a repository, leased until :meth:`release` is called with it."""
+        return self._lookup(repository, lease=True)
+
+    def release(self, adapter):
+        """End a lease taken with :meth:`acquire`, closing the adapter if it was evicted meanwhile."""
+        with self._lock:
+            key = id(adapter)
+            self._leases[key] -= 1
+            if self._leases[key]:
+                return
+            del self._leases[key]
+            idle = self._retired.pop(key, None)
+        if idle is not None:
+            self._close_evicted(idle)
+
+    @contextlib.contextmanager
+    def lease(self, repository=None):
+        """Context manager yielding the adapter for a repository, leased for the block."""
+        adapter = self.acquire(repository)
+        try:
+            yield adapter
+        finally:
+            self.release(adapter)
+
+    def _lookup(self, repository, lease):
+        if repository is not None and self.allowed is not None and repository not in self.allowed:
+            raise UnknownRepositoryError(f"Unknown repository: {repository}")
+        idle = []
+        with self._lock:
+            adapter = self._adapters.get(repository)
+            if adapter is None:
+                adapter = self.factory(repository=repository)
+                self._adapters[repository] = adapter
+                while self.maxsize is not None and len(self._adapters) > self.maxsize:
+                    old = self._adapters.popitem(last=False)[1]
+                    if id(old) in self._leases:
+                        self._retired[id(old)] = old
+                    else:
+                        idle.append(old)
+            else:
+                self._adapters.move_to_end(repository)
+            if lease:
+                self._leases[id(adapter)] = self._leases.get(id(adapter), 0) + 1
+        for old in idle:
+            self._close_evicted(old)
+        return adapter
+
+    def _close_evicted(self, adapter):
+        close = getattr(adapter, "close", None)
+        if close is None:
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                try:
+                    task = asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    asyncio.run(result)
+                else:
+                    # Keep a reference until the close finishes
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+        except Exception as e:
+            logging.getLogger("axiusmem.adapters").warning(f"Closing evicted adapter failed: {e}")
+
+    def __len__(self):
+        return len(self._adapters)
+
+    def values(self):
+        """Return the adapters built so far."""
+        with self._lock:
+            return list(self._adapters.values())
+
+    def _drain(self):
+        # On shutdown, leased or not
+        with self._lock:
+            adapters = list(self._adapters.values()) + list(self._retired.values())
+            self._adapters, self._retired = OrderedDict(), {}
+        return adapters
+
+    def close(self):
+        """Close and forget all (synchronous) adapters."""
+        for adapter in self._drain():
+            close = getattr(adapter, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    async def aclose(self):
+        """Close and forget all adapters, awaiting the close of async adapters."""
+        for adapter in self._drain():
+            close = getattr(adapter, "close", None)
+            if close is not None:
+                try:
+                    result = close()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    pass
+
 
-def get_triplestore_adapter_from_env(repository=None):
+def get_triplestore_adapter_from_env(repository=None, asynchronous=False):
     """
     Factory to instantiate the correct triplestore adapter based on environment variables or explicit repository/dataset.
 
     Args:
         repository (str, optional): Repository or dataset name. If not provided, falls back to TRIPLESTORE_REPOSITORY env var.
+        asynchronous (bool, optional): Return an :class:`AsyncBaseTriplestoreAdapter` (default False;
+            ignored for the in-process rdflib adapter).
 
     Reads:
-        TRIPLESTORE_TYPE: 'graphdb', 'jena', etc.
+        TRIPLESTORE_TYPE: 'graphdb', 'jena', 'rdflib', etc.
         TRIPLESTORE_URL: base URL or host
         TRIPLESTORE_USER: username (optional)
         TRIPLESTORE_PASSWORD: password (optional)
         TRIPLESTORE_REPOSITORY: repository or dataset name (optional, used as fallback)
+        TRIPLESTORE_POOL_SIZE: pooled HTTP connections per host (optional)
+        TRIPLESTORE_PATH: on-disk location of the rdflib store (optional, in memory if unset)
+        TRIPLESTORE_STORE: rdflib store plugin name (optional)
+        TRIPLESTORE_CACHE_SIZE: cache up to this many SELECT results (optional, default 0 = no cache)
+        TRIPLESTORE_CACHE_TTL: seconds a cached result stays valid (optional, default 60)
+        TRIPLESTORE_COALESCE: share one request between identical concurrent queries to GraphDB
+            or Jena (optional, default true)
 
     Returns:
         An instance of the appropriate triplestore adapter.
@@ -103,7 +661,6 @@ def get_triplestore_adapter_from_env(repository=None):
     Raises:
         ValueError: If TRIPLESTORE_TYPE is unknown or required variables are missing.
     """
-    import os
     try:
         from dotenv import load_dotenv
         load_dotenv()
@@ -114,14 +671,17 @@ def get_triplestore_adapter_from_env(repository=None):
     user = os.getenv("TRIPLESTORE_USER")
     password = os.getenv("TRIPLESTORE_PASSWORD")
     repo = repository or os.getenv("TRIPLESTORE_REPOSITORY")
+    pool_size = os.getenv("TRIPLESTORE_POOL_SIZE")
+    pool_size = int(pool_size) if pool_size else None
     # Import adapters here to avoid circular imports
-    from axiusmem.graphdb_adapter import GraphDBAdapter
-    from axiusmem.adapters.jena_adapter import JenaAdapter
+    from axiusmem.graphdb_adapter import GraphDBAdapter, AsyncGraphDBAdapter
+    from axiusmem.adapters.jena_adapter import JenaAdapter, AsyncJenaAdapter
     # Add more imports as adapters are implemented
     if ttype == "graphdb":
         if not url:
             raise ValueError("TRIPLESTORE_URL must be set for GraphDB.")
-        return GraphDBAdapter(url, user, password, repository=repo)
+        adapter_cls = AsyncGraphDBAdapter if asynchronous else GraphDBAdapter
+        adapter = adapter_cls(url, user, password, repository=repo, pool_size=pool_size)
     elif ttype == "jena":
         if not url or not repo:
             raise ValueError("TRIPLESTORE_URL and repository/dataset must be set for Jena.")
@@ -131,6 +691,17 @@ def get_triplestore_adapter_from_env(repository=None):
         host = m.group(1) if m else url
         port = int(m.group(2)) if m and m.group(2) else 3030
         protocol = "https" if url.startswith("https://") else "http"
-        return JenaAdapter(host=host, port=port, dataset=repo, username=user, password=password, protocol=protocol)
+        adapter_cls = AsyncJenaAdapter if asynchronous else JenaAdapter
+        adapter = adapter_cls(host=host, port=port, dataset=repo, username=user, password=password, protocol=protocol, pool_size=pool_size)
+    elif ttype == "rdflib":
+        # In-process store; blocking calls are cheap, so there is no async variant
+        from axiusmem.adapters.rdflib_adapter import RDFLibAdapter
+        adapter = RDFLibAdapter(path=os.getenv("TRIPLESTORE_PATH"), store=os.getenv("TRIPLESTORE_STORE"), repository=repo)
     else:
-        raise ValueError(f"Unknown TRIPLESTORE_TYPE: {ttype}") 
\ No newline at end of file
+        raise ValueError(f"Unknown TRIPLESTORE_TYPE: {ttype}")
+    if ttype != "rdflib":
+        # Identical concurrent queries share one HTTP request (the cache, if any, sits in front)
+        from axiusmem.adapters.coalesce import coalescing_adapter_from_env
+        adapter = coalescing_adapter_from_env(adapter)
+    from axiusmem.adapters.cache import cached_adapter_from_env
+    return cached_adapter_from_env(adapter) 
\ No newline at end of file
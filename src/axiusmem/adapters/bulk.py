@@ -0,0 +1,285 @@
+"""Chunked N-Triples writes and streamed file uploads to triplestore endpoints for AxiusMEM™ adapters."""
+import asyncio
+import os
+import re
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from rdflib.term import BNode, Literal, URIRef
+from axiusmem.ingest import NQUADS_FORMATS, NTRIPLES_FORMATS, _segments
+
+# Default number of triples per request
+DEFAULT_CHUNK_SIZE = 10000
+# Default number of chunk requests in flight at once
+DEFAULT_MAX_IN_FLIGHT = 4
+
+NTRIPLES_MEDIA_TYPE = "application/n-triples"
+
+# Suggested bytes of an N-Triples/N-Quads file per bulk_load request, when segmenting is asked for
+DEFAULT_SEGMENT_SIZE = 1 << 26
+# Bytes read from disk per chunk of a streamed upload
+UPLOAD_READ_SIZE = 1 << 20
+
+# Called with (bytes uploaded so far, total bytes)
+UploadProgressCallback = Callable[[int, int], None]
+
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+_IRI_ESCAPES = str.maketrans({c: f"\\u{ord(c):04X}" for c in '<>"{}|^`\\ \t\n\r'})
+
+# Quoted literals and IRIs of an N-Triples/N-Quads line: a "_:" outside them is a blank node label
+_QUOTED_TERMS = re.compile(rb'"(?:[^"\\]|\\.)*"|<[^>]*>')
+
+
+def _iri(value: str) -> str:
+    return f"<{value.translate(_IRI_ESCAPES)}>"
+
+
+def ntriples_term(term, position: str = "object") -> str:
+    """
+    Serialize one triple term as N-Triples.
+
+    rdflib terms are written as they are. Plain strings follow the adapters' conventions: a
+    ``_:`` prefix marks a blank node subject, predicates are IRIs, and objects are IRIs only when
+    they start with ``http://`` or ``https://`` (otherwise they are plain literals).
+
+    Args:
+        term: An rdflib ``URIRef``, ``BNode`` or ``Literal``, or a plain value.
+        position (str): "subject", "predicate" or "object".
+
+    Returns:
+        str: The term in N-Triples syntax, with literal quotes, backslashes and line breaks escaped.
+
+    Example:
+        >>> ntriples_term('say "hi"')
+        '"say \\\\"hi\\\\""'
+    """
+    if isinstance(term, URIRef):
+        return _iri(str(term))
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    if isinstance(term, Literal):
+        text = f'"{str(term).translate(_LITERAL_ESCAPES)}"'
+        if term.language:
+            return f"{text}@{term.language}"
+        if term.datatype:
+            return f"{text}^^{_iri(str(term.datatype))}"
+        return text
+    value = str(term)
+    if position == "subject":
+        return value if value.startswith("_:") else _iri(value)
+    if position == "predicate" or value.startswith(("http://", "https://")):
+        return _iri(value)
+    return f'"{value.translate(_LITERAL_ESCAPES)}"'
+
+
+def rdflib_term(term, position: str = "object"):
+    """Convert a triple term to an rdflib term, reading plain strings as :func:`ntriples_term` does."""
+    if isinstance(term, (URIRef, BNode, Literal)):
+        return term
+    value = str(term)
+    if position == "subject":
+        return BNode(value[2:]) if value.startswith("_:") else URIRef(value)
+    if position == "predicate" or value.startswith(("http://", "https://")):
+        return URIRef(value)
+    return Literal(value)
+
+
+def ntriples_line(triple) -> str:
+    """Serialize an (s, p, o) triple as one N-Triples line, including the trailing newline."""
+    s, p, o = triple
+    return f"{ntriples_term(s, 'subject')} {ntriples_term(p, 'predicate')} {ntriples_term(o)} .\n"
+
+
+def iter_ntriples_chunks(triples: Iterable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Serialize triples lazily into UTF-8 N-Triples documents of at most chunk_size triples each.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    triples = iter(triples)
+    while True:
+        chunk = list(islice(triples, chunk_size))
+        if not chunk:
+            return
+        yield "".join(map(ntriples_line, chunk)).encode("utf-8")
+
+
+def send_chunks(send: Callable[[bytes], object], chunks: Iterable[bytes], max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> int:
+    """
+    Send chunks with a bounded number of requests in flight.
+
+    Chunks are pulled from the iterable only as slots free up, so at most max_in_flight chunks
+    are held in memory. The first failure cancels the chunks not yet sent and is re-raised.
+
+    Args:
+        send (Callable[[bytes], object]): Sends one chunk (called from worker threads).
+        chunks (Iterable[bytes]): The request bodies.
+        max_in_flight (int): Maximum concurrent requests (1 sends sequentially).
+
+    Returns:
+        int: The number of chunks sent.
+    """
+    if max_in_flight <= 1:
+        count = 0
+        for chunk in chunks:
+            send(chunk)
+            count += 1
+        return count
+    chunks = iter(chunks)
+    in_flight = deque()
+    count = 0
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        try:
+            while True:
+                for chunk in islice(chunks, max_in_flight - len(in_flight)):
+                    in_flight.append(pool.submit(send, chunk))
+                if not in_flight:
+                    return count
+                in_flight.popleft().result()
+                count += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+async def asend_chunks(send: Callable[[bytes], Awaitable], chunks: Iterable[bytes], max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> int:
+    """Async counterpart of :func:`send_chunks`; ``send`` is a coroutine function."""
+    chunks = iter(chunks)
+    pending = set()
+    count = 0
+    try:
+        while True:
+            for chunk in islice(chunks, max(max_in_flight, 1) - len(pending)):
+                pending.add(asyncio.ensure_future(send(chunk)))
+            if not pending:
+                return count
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+                count += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def upload_segments(path: str, rdf_format: str, segment_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a file into the (start, end) byte ranges uploaded as separate requests.
+
+    With a segment_size, N-Triples and N-Quads files are cut at line boundaries into segments of
+    about segment_size bytes; other formats (and a segment_size of None) are sent as one range.
+
+    Raises:
+        ValueError: If a file to be segmented contains blank node labels: a label only names the
+            same node within one request, so a node used on both sides of a cut would be split in two.
+    """
+    if segment_size and (rdf_format in NTRIPLES_FORMATS or rdf_format in NQUADS_FORMATS):
+        if has_blank_nodes(path):
+            raise ValueError(f"{path} contains blank nodes and cannot be split into segments; load it with segment_size=None")
+        return list(_segments(path, segment_size))
+    return [(0, os.path.getsize(path))]
+
+
+def has_blank_nodes(path: str) -> bool:
+    """True if an N-Triples/N-Quads file uses a blank node label (``_:``) outside a literal."""
+    with open(path, "rb") as f:
+        for line in f:
+            if b"_:" in line and b"_:" in _QUOTED_TERMS.sub(b"", line):
+                return True
+    return False
+
+
+def upload_headers(rdf_format: str, compress: bool = False) -> Dict[str, str]:
+    """Request headers for an upload of rdf_format content, gzip-encoded if compress is set."""
+    headers = {"Content-Type": rdf_format}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def iter_file_range(path: str, start: int, end: int, compress: bool = False, read_size: int = UPLOAD_READ_SIZE) -> Iterator[bytes]:
+    """
+    Read bytes [start, end) of a file as a stream of chunks, optionally gzip-compressed on the fly.
+
+    Passed as a request body, the generator is sent with chunked transfer encoding, so no more
+    than one chunk of the file is held in memory.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(read_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    if compressor:
+        yield compressor.flush()
+
+
+async def aiter_file_range(path: str, start: int, end: int, compress: bool = False, read_size: int = UPLOAD_READ_SIZE) -> AsyncIterator[bytes]:
+    """Async counterpart of :func:`iter_file_range`; file reads run in a worker thread."""
+    chunks = iter_file_range(path, start, end, compress, read_size)
+    sentinel = object()
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, sentinel)
+        if chunk is sentinel:
+            return
+        yield chunk
+
+
+def upload_file(
+    send: Callable[[int, int], object],
+    path: str,
+    rdf_format: str,
+    segment_size: Optional[int] = None,
+    progress: Optional[UploadProgressCallback] = None,
+) -> int:
+    """
+    Upload a file segment by segment.
+
+    Args:
+        send (Callable[[int, int], object]): Sends bytes [start, end) of the file in one request,
+            retrying on its own, so a failure only resends that segment.
+        path (str): The file.
+        rdf_format (str): Media type of the file, used to decide whether it can be split.
+        segment_size (Optional[int]): Approximate bytes per request (see :func:`upload_segments`).
+        progress (Optional[Callable[[int, int], None]]): Called after each segment with the bytes
+            uploaded so far and the file size.
+
+    Returns:
+        int: The number of requests sent.
+    """
+    segments = upload_segments(path, rdf_format, segment_size)
+    total = segments[-1][1] if segments else 0
+    for start, end in segments:
+        send(start, end)
+        if progress:
+            progress(end, total)
+    return len(segments)
+
+
+async def aupload_file(
+    send: Callable[[int, int], Awaitable],
+    path: str,
+    rdf_format: str,
+    segment_size: Optional[int] = None,
+    progress: Optional[UploadProgressCallback] = None,
+) -> int:
+    """Async counterpart of :func:`upload_file`; ``send`` is a coroutine function."""
+    segments = await asyncio.to_thread(upload_segments, path, rdf_format, segment_size)
+    total = segments[-1][1] if segments else 0
+    for start, end in segments:
+        await send(start, end)
+        if progress:
+            progress(end, total)
+    return len(segments)
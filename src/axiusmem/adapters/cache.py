@@ -0,0 +1,322 @@
+"""SPARQL result caching in front of AxiusMEM™ triplestore adapters."""
+import os
+import re
+from threading import Lock
+from typing import FrozenSet, Optional, Tuple
+from axiusmem.utils import LRUCache
+from .base import AsyncBaseTriplestoreAdapter, AsyncDelegatingAdapter, DelegatingAdapter
+
+# Default number of cached query results per adapter
+DEFAULT_CACHE_SIZE = 1024
+# Default seconds a cached result stays valid
+DEFAULT_CACHE_TTL = 60.0
+
+# Graph dependency of queries that may read any graph (default graph, GRAPH ?g, ...)
+ALL_GRAPHS = "*"
+
+# String literals and IRIs are kept verbatim; comments are dropped and other whitespace collapsed
+_QUERY_TOKENS = re.compile(
+    r'("""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^\'\\]|\\.|\'(?!\'\'))*\'\'\''
+    r'|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|<[^<>"{}|^`\\\s]*>)'
+    r'|#[^\n]*|\s+'
+)
+_DATASET_CLAUSE = re.compile(r"\bFROM\s+(?:NAMED\s+)?<([^>]*)>", re.IGNORECASE)
+_GRAPH_BLOCK = re.compile(r"\{\s*GRAPH\s*<([^>]*)>\s*\{", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize SPARQL query text for use as a cache key.
+
+    Comments are removed and runs of whitespace collapsed to one space, except inside string
+    literals and IRIs, so formatting differences map to the same key.
+
+    Example:
+        >>> normalize_query("SELECT ?s\\n  WHERE { ?s ?p 'a  b' }  # all")
+        "SELECT ?s WHERE { ?s ?p 'a  b' }"
+    """
+    return _QUERY_TOKENS.sub(lambda m: m.group(1) or ("" if m.group(0).startswith("#") else " "), query).strip()
+
+
+def query_key(repository, method: str, query: str, kwargs: dict) -> Tuple:
+    """Key identifying a read: repository, adapter method, normalized query and call options."""
+    return (repository, method, normalize_query(query), tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+
+
+def query_graphs(query: str) -> FrozenSet[str]:
+    """
+    Named graphs a query may read, for cache invalidation.
+
+    Only two shapes are narrowed to specific graphs: queries with a ``FROM``/``FROM NAMED``
+    dataset clause, and queries whose whole pattern is one ``GRAPH <g> { ... }`` block (as built
+    by ``get_triples_from_named_graph``). Anything else may read the default graph, which is the
+    union of all graphs in GraphDB, so it depends on every graph.
+
+    Returns:
+        frozenset: Graph IRIs, or ``{ALL_GRAPHS}``.
+    """
+    # Blank out literal contents so braces and keywords inside strings are ignored
+    text = _QUERY_TOKENS.sub(lambda m: (m.group(1) if m.group(1).startswith("<") else '""') if m.group(1) else " ", query)
+    dataset = _DATASET_CLAUSE.findall(text)
+    if dataset:
+        return frozenset(dataset)
+    block = _GRAPH_BLOCK.search(text, text.find("{")) if "{" in text else None
+    if block and block.start() == text.find("{"):
+        depth, i = 1, block.end()
+        while depth and i < len(text):
+            depth += {"{": 1, "}": -1}.get(text[i], 0)
+            i += 1
+        inner = text[block.end():i - 1]
+        if not depth and re.match(r"\s*\}", text[i:]) and not re.search(r"\b(GRAPH|SERVICE)\b", inner, re.IGNORECASE):
+            return frozenset([block.group(1)])
+    return frozenset([ALL_GRAPHS])
+
+
+class QueryCache:
+    """
+    TTL + LRU cache of SPARQL results keyed by repository and normalized query text.
+
+    Each entry remembers the named graphs its query reads, so writes to one graph only evict the
+    results that could see it. One QueryCache may be shared by the caching adapters of several
+    repositories.
+
+    Args:
+        maxsize (int): Maximum number of cached results.
+        ttl (float, optional): Seconds a result stays valid (no expiry if None).
+    """
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        self.results = LRUCache(maxsize, ttl)
+        self.hits = 0
+        self.misses = 0
+        # Bumped per repository on every invalidation, so a result fetched while a write was
+        # running is not stored after the write evicted its key
+        self._generations = {}
+        self._lock = Lock()
+
+    def key(self, repository, method: str, query: str, kwargs: dict) -> Tuple:
+        return query_key(repository, method, query, kwargs)
+
+    def lookup(self, key):
+        """
+        Look a key up, counting the hit or miss.
+
+        Returns:
+            tuple: (hit, result, generation); pass the generation to :meth:`store` after a miss.
+        """
+        entry = self.results.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return False, None, self._generations.get(key[0], 0)
+            self.hits += 1
+        return True, entry[1], None
+
+    def store(self, key, graphs: FrozenSet[str], result, generation: int) -> None:
+        """Cache a result read from the given graphs, unless the repository was invalidated since the lookup."""
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                return
+            self.results.put(key, (graphs, result))
+
+    def invalidate(self, repository, graph_uri: Optional[str] = None) -> int:
+        """
+        Evict the results of a repository: all of them, or only those that may read graph_uri.
+
+        Returns:
+            int: The number of evicted results.
+        """
+        with self._lock:
+            self._generations[repository] = self._generations.get(repository, 0) + 1
+        if graph_uri is None:
+            return self.results.discard_where(lambda key, entry: key[0] == repository)
+        return self.results.discard_where(
+            lambda key, entry: key[0] == repository and (ALL_GRAPHS in entry[0] or graph_uri in entry[0])
+        )
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the current number of entries."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self.results)}
+
+
+def _repository(adapter):
+    # GraphDB names its repository, Jena its dataset (RDFLibAdapter.dataset is the rdflib Dataset)
+    name = getattr(adapter, "repository", None) or getattr(adapter, "dataset", None)
+    return name if isinstance(name, str) else None
+
+
+class CachingAdapter(DelegatingAdapter):
+    """
+    Adapter decorator caching SPARQL SELECT results of any :class:`BaseTriplestoreAdapter`.
+
+    ``sparql_select`` (and so ``sparql_select_temporal``) and ``get_triples_from_named_graph``
+    results are cached by repository and normalized query. Writes made through the wrapper
+    invalidate them: named graph writes evict the results that may read that graph, while
+    ``sparql_update``, ``bulk_load`` and ``commit_transaction`` evict the whole repository.
+    Writes made to the store by other clients are only picked up when entries expire, so keep the
+    TTL short if the store is shared. Cached results are returned as-is and must not be mutated.
+    Other methods and attributes are delegated to the wrapped adapter.
+
+    Args:
+        adapter (BaseTriplestoreAdapter): The adapter to wrap.
+        maxsize (int): Maximum number of cached results.
+        ttl (float, optional): Seconds a result stays valid (no expiry if None).
+        cache (QueryCache, optional): A cache to share between wrappers (maxsize/ttl are then ignored).
+
+    Example:
+        >>> adapter = CachingAdapter(GraphDBAdapter(url, repository="repo"), maxsize=1000, ttl=30)
+        >>> adapter.sparql_select(query)  # HTTP round-trip
+        >>> adapter.sparql_select(query)  # served from the cache
+        >>> adapter.cache_stats()
+        {'hits': 1, 'misses': 1, 'entries': 1}
+    """
+    def __init__(self, adapter, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = DEFAULT_CACHE_TTL, cache: Optional[QueryCache] = None):
+        super().__init__(adapter)
+        self.cache = cache or QueryCache(maxsize, ttl)
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    def _cached(self, method: str, query: str, graphs: FrozenSet[str], kwargs: dict, call):
+        key = self.cache.key(_repository(self.adapter), method, query, kwargs)
+        hit, result, generation = self.cache.lookup(key)
+        if not hit:
+            result = call()
+            self.cache.store(key, graphs, result, generation)
+        return result
+
+    def _invalidate(self, graph_uri=None):
+        self.cache.invalidate(_repository(self.adapter), graph_uri)
+
+    def close(self):
+        self._invalidate()
+        return self.adapter.close()
+
+    def sparql_select(self, query: str, **kwargs):
+        return self._cached("select", query, query_graphs(query), kwargs, lambda: self.adapter.sparql_select(query, **kwargs))
+
+    # Streamed results (sparql_select_iter) are large by intent; they bypass the cache
+
+    def sparql_update(self, update_query: str, **kwargs):
+        try:
+            return self.adapter.sparql_update(update_query, **kwargs)
+        finally:
+            self._invalidate()
+
+    def bulk_load(self, rdf_path: str, *args, **kwargs):
+        try:
+            return self.adapter.bulk_load(rdf_path, *args, **kwargs)
+        finally:
+            self._invalidate()
+
+    def commit_transaction(self, tx_id):
+        try:
+            return self.adapter.commit_transaction(tx_id)
+        finally:
+            self._invalidate()
+
+    def delete_named_graph(self, graph_uri):
+        try:
+            return self.adapter.delete_named_graph(graph_uri)
+        finally:
+            self._invalidate(graph_uri)
+
+    def clear_named_graph(self, graph_uri):
+        try:
+            return self.adapter.clear_named_graph(graph_uri)
+        finally:
+            self._invalidate(graph_uri)
+
+    def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        try:
+            return self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs)
+        finally:
+            self._invalidate(graph_uri)
+
+    def get_triples_from_named_graph(self, graph_uri, query):
+        return self._cached("graph", f"<{graph_uri}> {query}", frozenset([graph_uri]), {},
+                            lambda: self.adapter.get_triples_from_named_graph(graph_uri, query))
+
+
+class AsyncCachingAdapter(AsyncDelegatingAdapter):
+    """Async counterpart of :class:`CachingAdapter`, wrapping an :class:`AsyncBaseTriplestoreAdapter`."""
+    def __init__(self, adapter, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = DEFAULT_CACHE_TTL, cache: Optional[QueryCache] = None):
+        super().__init__(adapter)
+        self.cache = cache or QueryCache(maxsize, ttl)
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    async def _cached(self, method: str, query: str, graphs: FrozenSet[str], kwargs: dict, call):
+        key = self.cache.key(_repository(self.adapter), method, query, kwargs)
+        hit, result, generation = self.cache.lookup(key)
+        if not hit:
+            result = await call()
+            self.cache.store(key, graphs, result, generation)
+        return result
+
+    def _invalidate(self, graph_uri=None):
+        self.cache.invalidate(_repository(self.adapter), graph_uri)
+
+    async def close(self):
+        self._invalidate()
+        return await self.adapter.close()
+
+    async def sparql_select(self, query: str, **kwargs):
+        return await self._cached("select", query, query_graphs(query), kwargs, lambda: self.adapter.sparql_select(query, **kwargs))
+
+    async def sparql_update(self, update_query: str, **kwargs):
+        try:
+            return await self.adapter.sparql_update(update_query, **kwargs)
+        finally:
+            self._invalidate()
+
+    async def bulk_load(self, rdf_path: str, *args, **kwargs):
+        try:
+            return await self.adapter.bulk_load(rdf_path, *args, **kwargs)
+        finally:
+            self._invalidate()
+
+    async def commit_transaction(self, tx_id):
+        try:
+            return await self.adapter.commit_transaction(tx_id)
+        finally:
+            self._invalidate()
+
+    async def delete_named_graph(self, graph_uri):
+        try:
+            return await self.adapter.delete_named_graph(graph_uri)
+        finally:
+            self._invalidate(graph_uri)
+
+    async def clear_named_graph(self, graph_uri):
+        try:
+            return await self.adapter.clear_named_graph(graph_uri)
+        finally:
+            self._invalidate(graph_uri)
+
+    async def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        try:
+            return await self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs)
+        finally:
+            self._invalidate(graph_uri)
+
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        return await self._cached("graph", f"<{graph_uri}> {query}", frozenset([graph_uri]), {},
+                                  lambda: self.adapter.get_triples_from_named_graph(graph_uri, query))
+
+
+def cached_adapter_from_env(adapter):
+    """
+    Wrap an adapter in a (sync or async) caching adapter if TRIPLESTORE_CACHE_SIZE is set.
+
+    Reads:
+        TRIPLESTORE_CACHE_SIZE: maximum cached results (0 or unset leaves the adapter unwrapped)
+        TRIPLESTORE_CACHE_TTL: seconds a result stays valid (default 60; 0 never expires)
+    """
+    maxsize = int(os.getenv("TRIPLESTORE_CACHE_SIZE") or 0)
+    if maxsize <= 0:
+        return adapter
+    ttl = float(os.getenv("TRIPLESTORE_CACHE_TTL") or DEFAULT_CACHE_TTL) or None
+    wrapper_cls = AsyncCachingAdapter if isinstance(adapter, AsyncBaseTriplestoreAdapter) else CachingAdapter
+    return wrapper_cls(adapter, maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,142 @@
+"""Single-flight coalescing of identical concurrent SPARQL queries for AxiusMEM™ adapters."""
+import os
+from itertools import count
+from axiusmem.utils import AsyncSingleFlight, SingleFlight
+from .base import AsyncBaseTriplestoreAdapter, AsyncDelegatingAdapter, DelegatingAdapter
+from .cache import _repository, query_key
+
+
+class CoalescingAdapter(DelegatingAdapter):
+    """
+    Adapter decorator sharing one in-flight request between identical concurrent queries.
+
+    While a ``sparql_select`` (or ``get_triples_from_named_graph``) call is running, other threads
+    issuing the same query against the same repository wait for it instead of sending their own
+    request, and all receive its result or its exception. Nothing is kept once the call returns,
+    so results are never stale. The shared result must not be mutated.
+
+    Writes made through the wrapper (``sparql_update``, ``bulk_load``, ``commit_transaction`` and
+    the named graph writes) bump its write generation, which is part of the flight key: a query
+    sent after a write finished never joins a flight that started before it (read-your-writes).
+    Other methods and attributes are delegated to the wrapped adapter.
+
+    Args:
+        adapter (BaseTriplestoreAdapter): The adapter to wrap.
+
+    Example:
+        >>> adapter = CoalescingAdapter(GraphDBAdapter(url, repository="repo"))
+        >>> with ThreadPoolExecutor(8) as pool:
+        ...     results = list(pool.map(adapter.sparql_select, [query] * 8))  # one HTTP request
+        >>> adapter.coalesce_stats()
+        {'coalesced': 7}
+    """
+    def __init__(self, adapter):
+        super().__init__(adapter)
+        self.flights = SingleFlight()
+        # The wrapper serves one repository, so one write generation covers it
+        self._writes = count(1)
+        self.generation = 0
+
+    def coalesce_stats(self) -> dict:
+        return {"coalesced": self.flights.coalesced}
+
+    def _key(self, method: str, query: str, kwargs: dict):
+        return query_key(_repository(self.adapter), method, query, kwargs) + (self.generation,)
+
+    def _write(self, call):
+        try:
+            return call()
+        finally:
+            # next() on a count is atomic, so concurrent writers never reuse a generation
+            self.generation = next(self._writes)
+
+    def sparql_select(self, query: str, **kwargs):
+        return self.flights.do(self._key("select", query, kwargs),
+                               lambda: self.adapter.sparql_select(query, **kwargs))
+
+    def get_triples_from_named_graph(self, graph_uri, query):
+        return self.flights.do(self._key("graph", f"<{graph_uri}> {query}", {}),
+                               lambda: self.adapter.get_triples_from_named_graph(graph_uri, query))
+
+    def sparql_update(self, update_query: str, **kwargs):
+        return self._write(lambda: self.adapter.sparql_update(update_query, **kwargs))
+
+    def bulk_load(self, rdf_path: str, *args, **kwargs):
+        return self._write(lambda: self.adapter.bulk_load(rdf_path, *args, **kwargs))
+
+    def commit_transaction(self, tx_id):
+        return self._write(lambda: self.adapter.commit_transaction(tx_id))
+
+    def delete_named_graph(self, graph_uri):
+        return self._write(lambda: self.adapter.delete_named_graph(graph_uri))
+
+    def clear_named_graph(self, graph_uri):
+        return self._write(lambda: self.adapter.clear_named_graph(graph_uri))
+
+    def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        return self._write(lambda: self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs))
+
+
+class AsyncCoalescingAdapter(AsyncDelegatingAdapter):
+    """
+    Async counterpart of :class:`CoalescingAdapter`, wrapping an :class:`AsyncBaseTriplestoreAdapter`.
+
+    Identical queries awaited concurrently on one event loop share a single request. Cancelling
+    one caller does not cancel the request for the others.
+    """
+    def __init__(self, adapter):
+        super().__init__(adapter)
+        self.flights = AsyncSingleFlight()
+        self._writes = count(1)
+        self.generation = 0
+
+    def coalesce_stats(self) -> dict:
+        return {"coalesced": self.flights.coalesced}
+
+    def _key(self, method: str, query: str, kwargs: dict):
+        return query_key(_repository(self.adapter), method, query, kwargs) + (self.generation,)
+
+    async def _write(self, call):
+        try:
+            return await call()
+        finally:
+            self.generation = next(self._writes)
+
+    async def sparql_select(self, query: str, **kwargs):
+        return await self.flights.do(self._key("select", query, kwargs),
+                                     lambda: self.adapter.sparql_select(query, **kwargs))
+
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        return await self.flights.do(self._key("graph", f"<{graph_uri}> {query}", {}),
+                                     lambda: self.adapter.get_triples_from_named_graph(graph_uri, query))
+
+    async def sparql_update(self, update_query: str, **kwargs):
+        return await self._write(lambda: self.adapter.sparql_update(update_query, **kwargs))
+
+    async def bulk_load(self, rdf_path: str, *args, **kwargs):
+        return await self._write(lambda: self.adapter.bulk_load(rdf_path, *args, **kwargs))
+
+    async def commit_transaction(self, tx_id):
+        return await self._write(lambda: self.adapter.commit_transaction(tx_id))
+
+    async def delete_named_graph(self, graph_uri):
+        return await self._write(lambda: self.adapter.delete_named_graph(graph_uri))
+
+    async def clear_named_graph(self, graph_uri):
+        return await self._write(lambda: self.adapter.clear_named_graph(graph_uri))
+
+    async def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+        return await self._write(lambda: self.adapter.add_triples_to_named_graph(graph_uri, triples, **kwargs))
+
+
+def coalescing_adapter_from_env(adapter):
+    """
+    Wrap an adapter in a (sync or async) coalescing adapter unless TRIPLESTORE_COALESCE is false.
+
+    Reads:
+        TRIPLESTORE_COALESCE: "false", "0" or "no" sends every query on its own (default: coalesce)
+    """
+    if os.getenv("TRIPLESTORE_COALESCE", "true").strip().lower() in ("false", "0", "no"):
+        return adapter
+    wrapper_cls = AsyncCoalescingAdapter if isinstance(adapter, AsyncBaseTriplestoreAdapter) else CoalescingAdapter
+    return wrapper_cls(adapter)
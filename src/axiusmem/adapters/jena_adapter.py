@@ -1,16 +1,17 @@
 import requests
+import httpx
 from requests.auth import HTTPBasicAuth
-from .base import BaseTriplestoreAdapter
-import tenacity
-
-# Retry config: 3 attempts, exponential backoff, retry on network/HTTP 5xx
-retry_on_network = tenacity.retry(
-    stop=tenacity.stop_after_attempt(3),
-    wait=tenacity.wait_exponential(multiplier=0.5, min=1, max=8),
-    retry=tenacity.retry_if_exception_type((requests.exceptions.RequestException,)),
-    reraise=True,
-    before_sleep=tenacity.before_sleep_log(__import__('logging').getLogger("axiusmem.jena_adapter"), __import__('logging').WARNING)
+from .base import (
+    AsyncBaseTriplestoreAdapter, BaseTriplestoreAdapter,
+    async_connection_limits, mount_connection_pool,
 )
+from .bulk import (
+    DEFAULT_CHUNK_SIZE, DEFAULT_MAX_IN_FLIGHT, NTRIPLES_MEDIA_TYPE,
+    aiter_file_range, asend_chunks, aupload_file, iter_file_range, iter_ntriples_chunks,
+    send_chunks, upload_file, upload_headers,
+)
+from .resilience import guarded
+from .sparql_results import TSV_MEDIA_TYPE, aiter_tsv_bindings, iter_tsv_bindings
 
 # AxiusMEM™ Jena Adapter
 class JenaAdapter(BaseTriplestoreAdapter):
@@ -25,8 +26,9 @@ class JenaAdapter(BaseTriplestoreAdapter):
         username (str, optional): Username for authentication.
         password (str, optional): Password for authentication.
         protocol (str, optional): 'http' or 'https'.
+        pool_size (int, optional): Pooled HTTP connections kept alive (default TRIPLESTORE_POOL_SIZE env var or 10).
     """
-    def __init__(self, host='localhost', port=3030, dataset=None, username=None, password=None, protocol='http'):
+    def __init__(self, host='localhost', port=3030, dataset=None, username=None, password=None, protocol='http', pool_size=None):
         import os
         self.host = host
         self.port = port
@@ -34,13 +36,13 @@ class JenaAdapter(BaseTriplestoreAdapter):
         self.username = username
         self.password = password
         self.protocol = protocol
+        self.pool_size = pool_size
         self.session = None
-        self.base_url = None
+        self.base_url = f"{self.protocol}://{self.host}:{self.port}/{self.dataset}"
 
     def connect(self):
-        """Establish a connection to Jena Fuseki (sets up session and base URL)."""
-        self.base_url = f"{self.protocol}://{self.host}:{self.port}/{self.dataset}"
-        self.session = requests.Session()
+        """Establish a connection to Jena Fuseki (sets up the session)."""
+        self.session = mount_connection_pool(requests.Session(), self.pool_size)
         if self.username and self.password:
             self.session.auth = HTTPBasicAuth(self.username, self.password)
 
@@ -50,7 +52,7 @@ class JenaAdapter(BaseTriplestoreAdapter):
             self.session.close()
             self.session = None
 
-    @retry_on_network
+    @guarded("query")
     def sparql_select(self, query: str, **kwargs):
         """Execute a SPARQL SELECT query on Jena Fuseki."""
         if not self.session:
@@ -62,7 +64,32 @@ class JenaAdapter(BaseTriplestoreAdapter):
         response.raise_for_status()
         return response.json()
 
-    @retry_on_network
+    def sparql_select_iter(self, query: str, **kwargs):
+        """
+        Execute a SPARQL SELECT query on Jena Fuseki, streaming the result as TSV and yielding
+        SPARQL JSON bindings as rows arrive.
+        """
+        with self._open_select_stream(query, **kwargs) as response:
+            response.encoding = 'utf-8'
+            yield from iter_tsv_bindings(response.iter_content(chunk_size=65536, decode_unicode=True))
+
+    @guarded("query")
+    def _open_select_stream(self, query: str, **kwargs):
+        # Retried until the status is in; once rows are yielded, a failure is not retried
+        if not self.session:
+            self.connect()
+        endpoint = f"{self.base_url}/sparql"
+        headers = {'Accept': TSV_MEDIA_TYPE}
+        data = {'query': query}
+        response = self.session.post(endpoint, data=data, headers=headers, timeout=kwargs.get('timeout', 30), stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
+
+    @guarded("update", idempotent=False)
     def sparql_update(self, update_query: str, **kwargs):
         """Execute a SPARQL UPDATE query on Jena Fuseki."""
         if not self.session:
@@ -74,16 +101,24 @@ class JenaAdapter(BaseTriplestoreAdapter):
         response.raise_for_status()
         return response.text
 
-    @retry_on_network
-    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle"):
-        """Bulk load RDF data into Jena Fuseki using the /data endpoint."""
+    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle", compress=False, segment_size=None, progress=None):
+        """
+        Bulk load RDF data into Jena Fuseki using the /data endpoint, streamed from disk.
+
+        Takes the same options as :meth:`axiusmem.graphdb_adapter.GraphDBAdapter.bulk_load`:
+        chunked transfer encoding, optional on-the-fly gzip (``compress``), opt-in splitting of
+        N-Triples/N-Quads without blank nodes into segments of about ``segment_size`` bytes sent on
+        their own, and a ``progress(bytes_uploaded, total_bytes)`` callback. Returns True once every
+        segment is loaded.
+        """
         if not self.session:
             self.connect()
-        endpoint = f"{self.base_url}/data"
-        headers = {'Content-Type': rdf_format}
-        with open(rdf_path, 'rb') as f:
-            data = f.read()
-        response = self.session.post(endpoint, data=data, headers=headers)
+        upload_file(lambda start, end: self._post_file_range(rdf_path, start, end, rdf_format, compress), rdf_path, rdf_format, segment_size, progress)
+        return True
+
+    @guarded("data", idempotent=False)
+    def _post_file_range(self, rdf_path: str, start: int, end: int, rdf_format: str, compress: bool):
+        response = self.session.post(f"{self.base_url}/data", data=iter_file_range(rdf_path, start, end, compress), headers=upload_headers(rdf_format, compress))
         response.raise_for_status()
         return response.text
 
@@ -217,43 +252,187 @@ class JenaAdapter(BaseTriplestoreAdapter):
     def rollback_transaction(self, tx_id):
         raise NotImplementedError("JenaAdapter: Transactions are not supported via HTTP API.") 
         
-    @retry_on_network
     def list_named_graphs(self):
         query = "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } }"
         return self.sparql_select(query)
 
-    @retry_on_network
     def create_named_graph(self, graph_uri):
         # SPARQL 1.1 does not have explicit CREATE GRAPH in Jena, but INSERT DATA can create it
         return self.add_triples_to_named_graph(graph_uri, [])
 
-    @retry_on_network
     def delete_named_graph(self, graph_uri):
         update = f"DROP GRAPH <{graph_uri}>"
         return self.sparql_update(update)
 
-    @retry_on_network
     def clear_named_graph(self, graph_uri):
         update = f"CLEAR GRAPH <{graph_uri}>"
         return self.sparql_update(update)
 
-    @retry_on_network
-    def add_triples_to_named_graph(self, graph_uri, triples):
-        if not triples:
-            # No-op, but ensures graph exists
-            return True
-        triple_strs = []
-        for s, p, o in triples:
-            s_str = f"<{s}>" if not s.startswith("_") else s
-            p_str = f"<{p}>"
-            o_str = f'"{o}"' if not (str(o).startswith("http://") or str(o).startswith("https://")) else f"<{o}>"
-            triple_strs.append(f"{s_str} {p_str} {o_str} .")
-        update = f"INSERT DATA {{ GRAPH <{graph_uri}> {{ {' '.join(triple_strs)} }} }}"
-        return self.sparql_update(update)
+    def add_triples_to_named_graph(self, graph_uri, triples, chunk_size=DEFAULT_CHUNK_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """
+        Add triples to a named graph through the Graph Store Protocol ``/data?graph=`` endpoint.
+
+        The triples are serialized to N-Triples in chunks of chunk_size, with up to max_in_flight
+        chunks sent concurrently. Each chunk is retried on its own; chunks already stored are kept
+        if a later one fails.
+
+        Args:
+            graph_uri (str): The named graph.
+            triples (Iterable): (s, p, o) triples of rdflib terms or plain values
+                (see :func:`axiusmem.adapters.bulk.ntriples_term`).
+            chunk_size (int): Triples per request.
+            max_in_flight (int): Maximum concurrent requests.
+
+        Returns:
+            bool: True once every chunk is stored.
+        """
+        if not self.session:
+            self.connect()
+        send_chunks(lambda body: self._post_data(body, graph_uri), iter_ntriples_chunks(triples, chunk_size), max_in_flight)
+        return True
+
+    @guarded("data", idempotent=False)
+    def _post_data(self, body: bytes, graph_uri: str):
+        response = self.session.post(f"{self.base_url}/data", params={'graph': graph_uri}, data=body, headers={'Content-Type': NTRIPLES_MEDIA_TYPE})
+        response.raise_for_status()
+        return response.text
 
-    @retry_on_network
     def get_triples_from_named_graph(self, graph_uri, query):
         # Wrap the query in GRAPH <graph_uri> if not already
         wrapped_query = f"SELECT * WHERE {{ GRAPH <{graph_uri}> {{ {query} }} }}"
         return self.sparql_select(wrapped_query) 
-        
\ No newline at end of file
+        
+
+
+class AsyncJenaAdapter(AsyncBaseTriplestoreAdapter):
+    """
+    Asyncio adapter for Apache Jena (TDB/Fuseki), built on ``httpx.AsyncClient``.
+    Covers the AsyncBaseTriplestoreAdapter interface; results match :class:`JenaAdapter`.
+
+    Args:
+        host (str): Hostname for Jena Fuseki.
+        port (int): Port for Jena Fuseki.
+        dataset (str, optional): Dataset name. If not provided, falls back to TRIPLESTORE_REPOSITORY env var.
+        username (str, optional): Username for authentication.
+        password (str, optional): Password for authentication.
+        protocol (str, optional): 'http' or 'https'.
+        pool_size (int, optional): Keep-alive connections (default TRIPLESTORE_POOL_SIZE env var or 10).
+    """
+    def __init__(self, host='localhost', port=3030, dataset=None, username=None, password=None, protocol='http', pool_size=None):
+        import os
+        self.host = host
+        self.port = port
+        self.dataset = dataset or os.getenv("TRIPLESTORE_REPOSITORY")
+        self.username = username
+        self.password = password
+        self.protocol = protocol
+        self.pool_size = pool_size
+        self.base_url = f"{self.protocol}://{self.host}:{self.port}/{self.dataset}"
+        self.client = httpx.AsyncClient(
+            auth=(username, password) if username and password else None,
+            limits=async_connection_limits(pool_size),
+        )
+
+    async def connect(self):
+        """No-op: the HTTP client connects on first request."""
+        return None
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    @guarded("query")
+    async def sparql_select(self, query: str, **kwargs):
+        """Execute a SPARQL SELECT query on Jena Fuseki."""
+        headers = {'Accept': 'application/sparql-results+json'}
+        response = await self.client.post(f"{self.base_url}/sparql", data={'query': query}, headers=headers, timeout=kwargs.get('timeout', 30))
+        response.raise_for_status()
+        return response.json()
+
+    async def sparql_select_iter(self, query: str, **kwargs):
+        """Async counterpart of :meth:`JenaAdapter.sparql_select_iter`."""
+        response = await self._open_select_stream(query, **kwargs)
+        try:
+            async for binding in aiter_tsv_bindings(response.aiter_text()):
+                yield binding
+        finally:
+            await response.aclose()
+
+    @guarded("query")
+    async def _open_select_stream(self, query: str, **kwargs):
+        headers = {'Accept': TSV_MEDIA_TYPE}
+        request = self.client.build_request("POST", f"{self.base_url}/sparql", data={'query': query}, headers=headers, timeout=kwargs.get('timeout', 30))
+        response = await self.client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            await response.aclose()
+            raise
+        return response
+
+    @guarded("update", idempotent=False)
+    async def sparql_update(self, update_query: str, **kwargs):
+        """Execute a SPARQL UPDATE query on Jena Fuseki."""
+        response = await self.client.post(f"{self.base_url}/update", data={'update': update_query}, timeout=kwargs.get('timeout', 30))
+        response.raise_for_status()
+        return response.text
+
+    async def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle", compress=False, segment_size=None, progress=None):
+        """Async counterpart of :meth:`JenaAdapter.bulk_load`."""
+        await aupload_file(lambda start, end: self._post_file_range(rdf_path, start, end, rdf_format, compress), rdf_path, rdf_format, segment_size, progress)
+        return True
+
+    @guarded("data", idempotent=False)
+    async def _post_file_range(self, rdf_path: str, start: int, end: int, rdf_format: str, compress: bool):
+        response = await self.client.post(f"{self.base_url}/data", content=aiter_file_range(rdf_path, start, end, compress), headers=upload_headers(rdf_format, compress))
+        response.raise_for_status()
+        return response.text
+
+    async def test_connection(self):
+        """Test the connection to Jena Fuseki by running a simple ASK query."""
+        try:
+            result = await self.sparql_select("ASK {}")
+            return result.get('boolean', False)
+        except Exception:
+            return False
+
+    async def begin_transaction(self):
+        """Jena Fuseki does not support HTTP transactions in the standard setup (stub)."""
+        raise NotImplementedError("AsyncJenaAdapter: Transactions are not supported via HTTP API.")
+
+    async def commit_transaction(self, tx_id):
+        raise NotImplementedError("AsyncJenaAdapter: Transactions are not supported via HTTP API.")
+
+    async def rollback_transaction(self, tx_id):
+        raise NotImplementedError("AsyncJenaAdapter: Transactions are not supported via HTTP API.")
+
+    async def list_named_graphs(self):
+        query = "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } }"
+        return await self.sparql_select(query)
+
+    async def create_named_graph(self, graph_uri):
+        return await self.add_triples_to_named_graph(graph_uri, [])
+
+    async def delete_named_graph(self, graph_uri):
+        return await self.sparql_update(f"DROP GRAPH <{graph_uri}>")
+
+    async def clear_named_graph(self, graph_uri):
+        return await self.sparql_update(f"CLEAR GRAPH <{graph_uri}>")
+
+    async def add_triples_to_named_graph(self, graph_uri, triples, chunk_size=DEFAULT_CHUNK_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """Async counterpart of :meth:`JenaAdapter.add_triples_to_named_graph`."""
+        await asend_chunks(lambda body: self._post_data(body, graph_uri), iter_ntriples_chunks(triples, chunk_size), max_in_flight)
+        return True
+
+    @guarded("data", idempotent=False)
+    async def _post_data(self, body: bytes, graph_uri: str):
+        response = await self.client.post(f"{self.base_url}/data", params={'graph': graph_uri}, content=body, headers={'Content-Type': NTRIPLES_MEDIA_TYPE})
+        response.raise_for_status()
+        return response.text
+
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        wrapped_query = f"SELECT * WHERE {{ GRAPH <{graph_uri}> {{ {query} }} }}"
+        return await self.sparql_select(wrapped_query)
+
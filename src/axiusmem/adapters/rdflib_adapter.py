@@ -1,30 +1,310 @@
+import os
+from contextlib import contextmanager
+from threading import RLock
+from uuid import uuid4
+from rdflib import Dataset, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugin import PluginException
+from rdflib.plugins.sparql import prepareUpdate
 from .base import BaseTriplestoreAdapter
+from .bulk import rdflib_term
+from .sparql_results import term_to_json
 
+# AxiusMEM™ RDFLib Adapter
 class RDFLibAdapter(BaseTriplestoreAdapter):
     """
-    Adapter for RDFLib (stub).
+    In-process adapter over an rdflib ``Dataset``, with no network hop.
+
+    Without a path the data lives in memory for the lifetime of the adapter. With a path the
+    dataset is opened on a persistent rdflib store plugin (``BerkeleyDB`` by default, which needs
+    the ``berkeleydb`` package; any installed plugin such as ``Oxigraph`` or ``SQLAlchemy`` can be
+    named instead). The default graph is the union of all named graphs, as in GraphDB. Calls are
+    serialized with a lock, so one adapter can be shared across threads.
     See: https://rdflib.readthedocs.io/
+
+    Args:
+        path (str, optional): Location of the persistent store. If not provided, the store is in memory.
+        store (str, optional): rdflib store plugin name (default "BerkeleyDB" with a path, else "Memory").
+        repository (str, optional): Repository name; with a path, the store is kept in a
+            subdirectory of that name.
+
+    Example:
+        >>> adapter = RDFLibAdapter()
+        >>> adapter.sparql_update('INSERT DATA { GRAPH <http://ex.org/g> { <http://ex.org/a> <http://ex.org/p> "x" } }')
+        True
+        >>> adapter.sparql_select("SELECT ?o WHERE { ?s ?p ?o }")
+        [{'o': {'type': 'literal', 'value': 'x'}}]
     """
+    def __init__(self, path=None, store=None, repository=None):
+        self.repository = repository
+        self.path = os.path.join(path, repository) if path and repository else path
+        self.store = store or ("BerkeleyDB" if path else "Memory")
+        self.dataset = None
+        self._lock = RLock()
+        self._transactions = {}
+
     def connect(self):
-        """Establish a connection to RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.connect() not implemented.")
+        """Create the dataset, opening (and if needed creating) the persistent store."""
+        with self._lock:
+            if self.dataset is not None:
+                return
+            try:
+                dataset = Dataset(store=self.store, default_union=True)
+            except PluginException:
+                raise ValueError(
+                    f"rdflib store plugin {self.store!r} is not available"
+                    + (" (install the berkeleydb package)" if self.store == "BerkeleyDB" else "")
+                ) from None
+            if self.path:
+                dataset.open(self.path, create=True)
+            self.dataset = dataset
 
     def close(self):
-        """Close the connection to RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.close() not implemented.")
+        """Close the store, committing pending changes. An in-memory dataset is discarded."""
+        with self._lock:
+            if self.dataset is not None:
+                if self.path:
+                    self.dataset.close(commit_pending_transaction=True)
+                self.dataset = None
+                self._transactions.clear()
+
+    def _dataset(self):
+        if self.dataset is None:
+            self.connect()
+        return self.dataset
+
+    def _autocommit(self):
+        # Writes outside a transaction are committed to the store at once
+        self.dataset.commit()
 
     def sparql_select(self, query: str, **kwargs):
-        """Execute a SPARQL SELECT query on RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.sparql_select() not implemented.")
+        """
+        Execute a SPARQL SELECT (or ASK) query.
+
+        Returns:
+            A list of SPARQL JSON bindings for SELECT, as from the GraphDB adapter, or
+            ``{"head": {}, "boolean": ...}`` for ASK.
+        """
+        with self._lock:
+            result = self._dataset().query(query)
+            if result.type == "ASK":
+                return {"head": {}, "boolean": bool(result.askAnswer)}
+            if result.type != "SELECT":
+                raise ValueError(f"RDFLibAdapter.sparql_select() expects a SELECT or ASK query, got {result.type}")
+            names = [str(var) for var in result.vars]
+            return [
+                {name: term_to_json(term) for name, term in zip(names, row) if term is not None}
+                for row in result
+            ]
 
     def sparql_update(self, update_query: str, **kwargs):
-        """Execute a SPARQL UPDATE query on RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.sparql_update() not implemented.")
+        """Execute a SPARQL UPDATE against the dataset."""
+        with self._lock:
+            self._dataset().update(update_query)
+            self._autocommit()
+            return True
 
-    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle"):
-        """Bulk load RDF data into RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.bulk_load() not implemented.")
+    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle", graph_uri=None):
+        """
+        Parse an RDF file into the dataset.
+
+        Args:
+            rdf_path (str): Path to the RDF file.
+            rdf_format (str): Media type or rdflib format name. Quad formats (N-Quads, TriG) keep
+                their graph names.
+            graph_uri (str, optional): Named graph for triple formats (default graph if None).
+        """
+        with self._lock:
+            dataset = self._dataset()
+            target = dataset.graph(URIRef(graph_uri)) if graph_uri else dataset
+            target.parse(rdf_path, format=rdf_format)
+            self._autocommit()
+            return True
 
     def test_connection(self):
-        """Test the connection to RDFLib (not implemented)."""
-        raise NotImplementedError("RDFLibAdapter.test_connection() not implemented.") 
\ No newline at end of file
+        """Open the dataset; True if it is usable."""
+        try:
+            self._dataset()
+            return True
+        except Exception:
+            return False
+
+    # Transactions
+    def begin_transaction(self):
+        """
+        Begin a transaction.
+
+        Its writes are buffered and only applied, all together under the lock, when it is
+        committed: until then other clients do not see them, and rolling back just discards
+        them. Several transactions can be open at once.
+        """
+        with self._lock:
+            self._dataset()
+            tx_id = uuid4().hex
+            self._transactions[tx_id] = []
+            return tx_id
+
+    def _take_transaction(self, tx_id):
+        self._check_transaction(tx_id)
+        return self._transactions.pop(tx_id)
+
+    def commit_transaction(self, tx_id):
+        """
+        Apply the transaction's buffered writes and commit them.
+
+        If one of them fails, those already applied are undone from a log of the quads they
+        actually added and removed, so the transaction leaves no trace; writes made meanwhile
+        outside the transaction are kept.
+        """
+        with self._lock:
+            operations = self._take_transaction(tx_id)
+            dataset = self.dataset
+            graphs = {g.identifier for g in dataset.graphs()}
+            log = []
+            try:
+                with self._recording(log):
+                    for operation in operations:
+                        self._apply(*operation)
+            except Exception:
+                self._revert(log, graphs)
+                dataset.commit()
+                raise
+            dataset.commit()
+            return True
+
+    def rollback_transaction(self, tx_id):
+        """Roll back the transaction, discarding its buffered writes."""
+        with self._lock:
+            self._take_transaction(tx_id)
+            return True
+
+    def _check_transaction(self, tx_id):
+        if tx_id not in self._transactions:
+            raise KeyError(f"Unknown transaction: {tx_id}")
+
+    def _apply(self, kind, payload, graph_uri=None):
+        dataset = self.dataset
+        if kind == "update":
+            dataset.update(payload)
+        elif kind == "add":
+            graph = dataset.graph(URIRef(graph_uri)) if graph_uri else dataset.default_graph
+            dataset.addN((s, p, o, graph) for s, p, o in payload)
+        else:
+            # From every graph if graph_uri is None
+            target = dataset.graph(URIRef(graph_uri)) if graph_uri else dataset
+            for triple in payload:
+                target.remove(triple)
+
+    @contextmanager
+    def _recording(self, log):
+        """
+        Log every quad the enclosed writes add to or remove from the store, in order.
+
+        The store's own ``add``/``addN``/``remove`` are wrapped for the duration, so only the
+        quads that change are read, never the whole dataset. Callers must hold the lock.
+        """
+        store = self.dataset.store
+        add, add_n, remove = store.add, store.addN, store.remove
+
+        def absent(triple, context):
+            return next(iter(store.triples(triple, context)), None) is None
+
+        def record_add(triple, context, quoted=False):
+            if absent(triple, context):
+                log.append(("added", (*triple, context.identifier)))
+            return add(triple, context, quoted=quoted)
+
+        def record_add_n(quads):
+            quads = list(quads)
+            log.extend(("added", (s, p, o, c.identifier)) for s, p, o, c in quads if absent((s, p, o), c))
+            return add_n(quads)
+
+        def record_remove(pattern, context=None):
+            for triple, contexts in list(store.triples(pattern, context)):
+                for graph in ([context] if context is not None else list(contexts)):
+                    if graph is not None:
+                        log.append(("removed", (*triple, graph.identifier)))
+            return remove(pattern, context)
+
+        store.add, store.addN, store.remove = record_add, record_add_n, record_remove
+        try:
+            yield log
+        finally:
+            for name in ("add", "addN", "remove"):
+                vars(store).pop(name, None)
+
+    def _revert(self, log, graphs):
+        """Undo the logged changes, newest first, and restore the set of graphs to graphs."""
+        dataset = self.dataset
+        for change, (s, p, o, g) in reversed(log):
+            if change == "added":
+                dataset.graph(g).remove((s, p, o))
+            else:
+                dataset.graph(g).add((s, p, o))
+        current = {g.identifier for g in dataset.graphs()}
+        for identifier in current - graphs:
+            dataset.remove_graph(identifier)
+        for identifier in graphs - current:
+            dataset.graph(identifier)
+
+    def transaction_add(self, tx_id, triples, graph_uri=None, **kwargs):
+        """Add (s, p, o) triples in the transaction at commit (default graph if graph_uri is None)."""
+        triples = [(rdflib_term(s, "subject"), rdflib_term(p, "predicate"), rdflib_term(o)) for s, p, o in triples]
+        with self._lock:
+            self._check_transaction(tx_id)
+            self._transactions[tx_id].append(("add", triples, graph_uri))
+            return True
+
+    def transaction_remove(self, tx_id, triples, graph_uri=None, **kwargs):
+        """Remove (s, p, o) triples in the transaction at commit (from every graph if graph_uri is None)."""
+        triples = [(rdflib_term(s, "subject"), rdflib_term(p, "predicate"), rdflib_term(o)) for s, p, o in triples]
+        with self._lock:
+            self._check_transaction(tx_id)
+            self._transactions[tx_id].append(("remove", triples, graph_uri))
+            return True
+
+    def transaction_update(self, tx_id, update_query: str, **kwargs):
+        """Execute a SPARQL UPDATE in the transaction at commit; it is parsed now, so syntax errors surface at once."""
+        prepareUpdate(update_query)
+        with self._lock:
+            self._check_transaction(tx_id)
+            self._transactions[tx_id].append(("update", update_query))
+            return True
+
+    # Named graph management
+    def list_named_graphs(self):
+        with self._lock:
+            return [str(g.identifier) for g in self._dataset().graphs() if g.identifier != DATASET_DEFAULT_GRAPH_ID]
+
+    def create_named_graph(self, graph_uri):
+        with self._lock:
+            self._dataset().graph(URIRef(graph_uri))
+            return True
+
+    def delete_named_graph(self, graph_uri):
+        with self._lock:
+            self._dataset().remove_graph(URIRef(graph_uri))
+            self._autocommit()
+            return True
+
+    def clear_named_graph(self, graph_uri):
+        with self._lock:
+            self._dataset().graph(URIRef(graph_uri)).remove((None, None, None))
+            self._autocommit()
+            return True
+
+    def add_triples_to_named_graph(self, graph_uri, triples):
+        """Add (s, p, o) triples (rdflib terms or plain values) to a named graph."""
+        with self._lock:
+            dataset = self._dataset()
+            graph = dataset.graph(URIRef(graph_uri))
+            dataset.addN(
+                (rdflib_term(s, "subject"), rdflib_term(p, "predicate"), rdflib_term(o), graph)
+                for s, p, o in triples
+            )
+            self._autocommit()
+            return True
+
+    def get_triples_from_named_graph(self, graph_uri, query):
+        wrapped_query = f"SELECT * WHERE {{ GRAPH <{graph_uri}> {{ {query} }} }}"
+        return self.sparql_select(wrapped_query)
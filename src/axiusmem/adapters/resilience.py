@@ -0,0 +1,331 @@
+"""Retry policy, retry budgets and circuit breakers shared by AxiusMEM™ network adapters."""
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import random
+import time
+from threading import Lock
+from typing import Dict, Optional
+import httpx
+import requests
+from axiusmem.metrics import adapter_call
+
+logger = logging.getLogger("axiusmem.adapters.resilience")
+
+# HTTP statuses worth retrying: overload and gateway errors. Other 4xx/5xx responses fail at once.
+RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+# Errors raised before the request reached the server, so even non-idempotent calls can be retried
+_NOT_SENT = (requests.exceptions.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Transport errors after which the request may or may not have been applied
+_TRANSPORT = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, httpx.TransportError)
+
+# Set while a guarded call runs, so guarded calls made inside it do not retry on their own
+_guarded = contextvars.ContextVar("axiusmem_guarded_call", default=False)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without contacting the triplestore while an endpoint's circuit breaker is open.
+
+    Attributes:
+        endpoint (str): The endpoint name.
+        retry_after (float): Seconds until the breaker lets a probe request through.
+    """
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+def _status(exc) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_failure(exc) -> bool:
+    """True if an error says the endpoint is unhealthy: a transport error or a retryable status."""
+    status = _status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS or status >= 500
+    return isinstance(exc, _TRANSPORT)
+
+
+def is_retryable(exc, idempotent: bool = True) -> bool:
+    """
+    True if a failed call may be retried.
+
+    Errors raised before the request was sent are always retryable. Timeouts, dropped connections
+    and 429/502/503/504 responses are retried only for idempotent calls, since the server may
+    already have applied the request. Other HTTP errors (4xx, 500) are never retried.
+    """
+    if isinstance(exc, _NOT_SENT):
+        return True
+    if not idempotent:
+        return False
+    status = _status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return isinstance(exc, _TRANSPORT)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint.
+
+    After failure_threshold consecutive failures the breaker opens and calls fail fast with
+    :class:`CircuitOpenError`. Once reset_timeout seconds have passed, one probe call is let
+    through (half-open): its success closes the breaker, its failure opens it again.
+    """
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._probing = False
+        self._lock = Lock()
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or raise if the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe already in flight.
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+            now = time.monotonic()
+            if self.state == "open" and now - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(self.name, max(self.opened_at + self.reset_timeout - now, 0.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release(self) -> None:
+        """End a probe that neither succeeded nor failed (e.g. it was cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"Circuit breaker for {self.name} opened after {self.failures} failures")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries to a fraction of the calls made to an endpoint.
+
+    Each call deposits ratio tokens (up to capacity) and each retry spends one, so when most
+    calls fail, retries stop instead of multiplying the load on a struggling server. The bucket
+    starts with min_tokens so that a few retries are possible at low traffic.
+    """
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, capacity: float = 100.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = min_tokens
+        self.exhausted = 0
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        """Spend one token for a retry; False (no retry) if the budget is used up."""
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+
+class RetryPolicy:
+    """
+    The one retry policy applied to every triplestore call of the network adapters.
+
+    Retries use capped exponential backoff with full jitter, go through the endpoint's
+    :class:`RetryBudget`, and are counted by its :class:`CircuitBreaker`. Breakers and budgets
+    are kept per endpoint name, so one slow repository does not trip the others.
+
+    Args:
+        max_attempts (int): Attempts per call, including the first.
+        base_delay (float): Backoff before the first retry, doubled for each later one.
+        max_delay (float): Cap on the backoff.
+        failure_threshold (int): Consecutive failures that open an endpoint's breaker.
+        reset_timeout (float): Seconds an open breaker waits before letting a probe through.
+        budget_ratio (float): Retries allowed per call, on average.
+    """
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0, budget_ratio: float = 0.2):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.budget_ratio = budget_ratio
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._budgets: Dict[str, RetryBudget] = {}
+        self._lock = Lock()
+
+    def endpoint(self, name: str):
+        """Return the (breaker, budget) pair of an endpoint, creating it on first use."""
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, self.failure_threshold, self.reset_timeout)
+                self._budgets[name] = RetryBudget(self.budget_ratio)
+            return self._breakers[name], self._budgets[name]
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt (1-based): full jitter over the backoff."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def breakers(self) -> Dict[str, dict]:
+        """State, consecutive failures and rejected calls of every endpoint breaker."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in sorted(breakers.items())}
+
+    def reset(self) -> None:
+        """Forget all breakers and budgets."""
+        with self._lock:
+            self._breakers.clear()
+            self._budgets.clear()
+
+    def _retry(self, name: str, breaker: CircuitBreaker, budget: RetryBudget, exc, attempt: int, idempotent: bool) -> bool:
+        if is_failure(exc):
+            breaker.record_failure()
+        else:
+            # The server answered (e.g. 400 for a bad query): it is healthy
+            breaker.record_success()
+        if attempt >= self.max_attempts or not is_retryable(exc, idempotent) or not budget.withdraw():
+            return False
+        logger.warning(f"Retrying {name} after {type(exc).__name__}: {exc} (attempt {attempt}/{self.max_attempts})")
+        return True
+
+    def call(self, name: str, fn, *args, idempotent: bool = True, **kwargs):
+        """Run fn(*args, **kwargs) under the policy for endpoint name."""
+        if _guarded.get():
+            return fn(*args, **kwargs)
+        breaker, budget = self.endpoint(name)
+        token = _guarded.set(True)
+        try:
+            breaker.before_call()
+            budget.deposit()
+            attempt = 1
+            while True:
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    if not self._retry(name, breaker, budget, e, attempt, idempotent):
+                        raise
+                    time.sleep(self.delay(attempt))
+                    attempt += 1
+                    breaker.before_call()
+                    continue
+                except BaseException:
+                    breaker.release()
+                    raise
+                breaker.record_success()
+                return result
+        finally:
+            _guarded.reset(token)
+
+    async def acall(self, name: str, fn, *args, idempotent: bool = True, **kwargs):
+        """Async counterpart of :meth:`call`; fn is a coroutine function."""
+        if _guarded.get():
+            return await fn(*args, **kwargs)
+        breaker, budget = self.endpoint(name)
+        token = _guarded.set(True)
+        try:
+            breaker.before_call()
+            budget.deposit()
+            attempt = 1
+            while True:
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception as e:
+                    if not self._retry(name, breaker, budget, e, attempt, idempotent):
+                        raise
+                    await asyncio.sleep(self.delay(attempt))
+                    attempt += 1
+                    breaker.before_call()
+                    continue
+                except BaseException:
+                    breaker.release()
+                    raise
+                breaker.record_success()
+                return result
+        finally:
+            _guarded.reset(token)
+
+
+# Shared by all adapters
+DEFAULT_POLICY = RetryPolicy()
+
+
+def endpoint_name(adapter, operation: str) -> str:
+    """Breaker name for an adapter operation: the service URL plus the operation."""
+    base = getattr(adapter, "base_url", None) or getattr(adapter, "url", None) or type(adapter).__name__
+    return f"{base} {operation}"
+
+
+def guarded(operation: str, idempotent: bool = True, policy: Optional[RetryPolicy] = None):
+    """
+    Decorate an adapter method so that it runs under the retry policy and circuit breaker of its
+    endpoint (see :class:`RetryPolicy`).
+
+    Guarded methods called from inside another guarded call run once, without retrying, so
+    retries never stack. Works on both plain and ``async`` methods. Each call is also timed and
+    counted in the triplestore metrics of :mod:`axiusmem.metrics`.
+
+    Args:
+        operation (str): Endpoint operation, e.g. "query", "update" or "statements".
+        idempotent (bool): Whether repeating the call is harmless; if not, only errors raised
+            before the request was sent are retried.
+        policy (RetryPolicy, optional): Defaults to :data:`DEFAULT_POLICY`.
+
+    Example:
+        >>> class MyAdapter(BaseTriplestoreAdapter):
+        ...     @guarded("update", idempotent=False)
+        ...     def sparql_update(self, update_query, **kwargs): ...
+    """
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                with adapter_call(type(self).__name__, fn.__name__):
+                    return await (policy or DEFAULT_POLICY).acall(endpoint_name(self, operation), fn, self, *args, idempotent=idempotent, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            with adapter_call(type(self).__name__, fn.__name__):
+                return (policy or DEFAULT_POLICY).call(endpoint_name(self, operation), fn, self, *args, idempotent=idempotent, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,220 @@
+"""Incremental parsing of SPARQL SELECT result streams for AxiusMEM™ adapters."""
+import re
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+# Media type requested when streaming SELECT results
+TSV_MEDIA_TYPE = "text/tab-separated-values"
+
+_TSV_ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "\\": "\\", '"': '"', "'": "'"}
+_ESCAPE = re.compile(r"\\(.)")
+_LITERAL = re.compile(r'^"(?P<value>.*)"(?:@(?P<lang>[A-Za-z0-9-]+)|\^\^<(?P<datatype>[^>]*)>)?$', re.DOTALL)
+_INTEGER = re.compile(r"^[+-]?\d+$")
+_DECIMAL = re.compile(r"^[+-]?\d*\.\d+$")
+_DOUBLE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)[eE][+-]?\d+$")
+
+
+def _unescape(text: str) -> str:
+    return _ESCAPE.sub(lambda m: _TSV_ESCAPES.get(m.group(1), m.group(0)), text)
+
+
+def parse_tsv_term(field: str) -> Optional[Dict[str, str]]:
+    """
+    Convert one SPARQL TSV result field to its SPARQL JSON form.
+
+    Args:
+        field (str): The field, e.g. ``<http://ex.org/a>``, ``"chat"@fr``, ``_:b0`` or ``42``.
+
+    Returns:
+        Optional[dict]: The term as ``{"type": ..., "value": ...}`` (plus ``xml:lang`` or
+        ``datatype``), or None for an unbound variable.
+
+    Raises:
+        ValueError: If the field is not a valid TSV term.
+
+    Example:
+        >>> parse_tsv_term('"chat"@fr')
+        {'type': 'literal', 'value': 'chat', 'xml:lang': 'fr'}
+    """
+    if field == "":
+        return None
+    if field.startswith("<") and field.endswith(">"):
+        return {"type": "uri", "value": field[1:-1]}
+    if field.startswith("_:"):
+        return {"type": "bnode", "value": field[2:]}
+    match = _LITERAL.match(field)
+    if match:
+        term = {"type": "literal", "value": _unescape(match.group("value"))}
+        if match.group("lang"):
+            term["xml:lang"] = match.group("lang")
+        elif match.group("datatype"):
+            term["datatype"] = match.group("datatype")
+        return term
+    if field in ("true", "false"):
+        return {"type": "literal", "value": field, "datatype": XSD + "boolean"}
+    for pattern, datatype in ((_INTEGER, "integer"), (_DECIMAL, "decimal"), (_DOUBLE, "double")):
+        if pattern.match(field):
+            return {"type": "literal", "value": field, "datatype": XSD + datatype}
+    raise ValueError(f"Invalid SPARQL TSV term: {field!r}")
+
+
+class TSVBindingParser:
+    """
+    Incremental parser turning the lines of a SPARQL TSV result into SPARQL JSON bindings.
+
+    The first line fed is the header of variable names; every later non-empty line yields one
+    binding dict, omitting unbound variables, exactly as in the ``results.bindings`` array of a
+    SPARQL JSON result.
+
+    Example:
+        >>> parser = TSVBindingParser()
+        >>> parser.feed("?s\\t?o")
+        >>> parser.feed('<http://ex.org/a>\\t"x"')
+        {'s': {'type': 'uri', 'value': 'http://ex.org/a'}, 'o': {'type': 'literal', 'value': 'x'}}
+    """
+    def __init__(self):
+        self.variables: Optional[List[str]] = None
+
+    def feed(self, line: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Parse one line; returns its binding, or None for the header and blank lines."""
+        line = line.rstrip("\r")
+        if self.variables is None:
+            self.variables = [name.lstrip("?$") for name in line.split("\t")] if line else []
+            return None
+        if not line and len(self.variables) != 1:
+            return None
+        binding = {}
+        for name, field in zip(self.variables, line.split("\t")):
+            term = parse_tsv_term(field)
+            if term is not None:
+                binding[name] = term
+        return binding
+
+
+def iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Split a stream of text chunks into lines on ``\\n`` only (TSV escapes other line breaks)."""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        yield from lines
+    if pending:
+        yield pending
+
+
+async def aiter_lines(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Async counterpart of :func:`iter_lines`."""
+    pending = ""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def iter_tsv_bindings(chunks: Iterable[str]) -> Iterator[Dict[str, Dict[str, str]]]:
+    """
+    Yield SPARQL JSON bindings from the text chunks of a SPARQL TSV result as they arrive.
+
+    Args:
+        chunks (Iterable[str]): Decoded chunks of the response body.
+
+    Yields:
+        dict: One binding per result row.
+    """
+    parser = TSVBindingParser()
+    for line in iter_lines(chunks):
+        binding = parser.feed(line)
+        if binding is not None:
+            yield binding
+
+
+async def aiter_tsv_bindings(chunks: AsyncIterator[str]) -> AsyncIterator[Dict[str, Dict[str, str]]]:
+    """Async counterpart of :func:`iter_tsv_bindings`."""
+    parser = TSVBindingParser()
+    async for line in aiter_lines(chunks):
+        binding = parser.feed(line)
+        if binding is not None:
+            yield binding
+
+
+def term_to_json(term) -> Dict[str, str]:
+    """
+    Convert an rdflib term to its SPARQL JSON form.
+
+    Example:
+        >>> term_to_json(Literal("chat", lang="fr"))
+        {'type': 'literal', 'value': 'chat', 'xml:lang': 'fr'}
+    """
+    from rdflib.term import BNode, Literal
+    if isinstance(term, BNode):
+        return {"type": "bnode", "value": str(term)}
+    if isinstance(term, Literal):
+        value = {"type": "literal", "value": str(term)}
+        if term.language:
+            value["xml:lang"] = term.language
+        elif term.datatype:
+            value["datatype"] = str(term.datatype)
+        return value
+    return {"type": "uri", "value": str(term)}
+
+
+def json_to_term(value: Dict[str, str]):
+    """
+    Convert a SPARQL JSON term back to an rdflib term (the inverse of :func:`term_to_json`).
+
+    Example:
+        >>> json_to_term({"type": "literal", "value": "chat", "xml:lang": "fr"})
+        rdflib.term.Literal('chat', lang='fr')
+    """
+    from rdflib.term import BNode, Literal, URIRef
+    kind = value.get("type")
+    if kind == "bnode":
+        return BNode(value["value"])
+    if kind in ("literal", "typed-literal"):
+        datatype = value.get("datatype")
+        return Literal(value["value"], lang=value.get("xml:lang"), datatype=URIRef(datatype) if datatype else None)
+    return URIRef(value["value"])
+
+
+def query_variables(query: str) -> Optional[List[str]]:
+    """
+    The projected variables of a SELECT query, in order (for ``SELECT *``, all in-scope variables).
+
+    Returns:
+        Optional[List[str]]: Variable names, or None if the query is not a SELECT query rdflib can parse.
+
+    Example:
+        >>> query_variables("SELECT ?s (COUNT(?o) AS ?n) WHERE { ?s ?p ?o } GROUP BY ?s")
+        ['s', 'n']
+    """
+    from rdflib.plugins.sparql import prepareQuery
+    try:
+        algebra = prepareQuery(query).algebra
+    except Exception:
+        return None
+    if algebra.name != "SelectQuery":
+        return None
+    return [str(var) for var in algebra.get("PV", [])]
+
+
+def csv_value(term: Optional[Dict[str, str]]) -> str:
+    """
+    A SPARQL JSON term as a SPARQL 1.1 CSV results field: IRIs and literal values as they are,
+    blank nodes as ``_:label``, and unbound variables empty.
+    """
+    if term is None:
+        return ""
+    if term.get("type") == "bnode":
+        return f"_:{term['value']}"
+    return term["value"]
+
+
+def result_bindings(result) -> List[Dict[str, Dict[str, str]]]:
+    """Return the bindings of a SELECT result, whether given as a bindings list or a full SPARQL JSON document."""
+    if isinstance(result, dict):
+        return result.get("results", {}).get("bindings", [])
+    return result or []
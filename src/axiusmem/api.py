@@ -1,19 +1,71 @@
+import csv
+import io
+import json
 import os
+import tempfile
 from dotenv import load_dotenv
 load_dotenv()
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from pydantic import BaseModel
 from typing import List, Optional
 import rdflib
-from .user_management import UserManager, AXM
-from axiusmem.adapters.base import get_triplestore_adapter_from_env
+from .user_management import LoginThrottle, PasswordHasher, PasswordHasherBusy, UserManager
+from axiusmem.adapters.base import AdapterRegistry, UnknownRepositoryError, get_triplestore_adapter_from_env
+from axiusmem.adapters.resilience import DEFAULT_POLICY, CircuitOpenError
+from axiusmem.adapters.bulk import ntriples_line
+from axiusmem.adapters.sparql_results import csv_value, json_to_term, query_variables, result_bindings
+from axiusmem.tasks import TaskManager, TaskNotCancellable, TaskQueueFull
+from axiusmem.utils import LRUCache
 import logging
 from rdflib import Literal
 import time
-from threading import Lock
-import tenacity
+import inspect
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from axiusmem import metrics
+
+NDJSON = "application/x-ndjson"
+# /sparql response formats; the first is the default
+SPARQL_MEDIA_TYPES = ("application/json", NDJSON, "text/csv", "application/sparql-results+json")
+# Bytes of rows gathered into each chunk of a streamed SPARQL result
+STREAM_CHUNK_SIZE = 65536
+
+
+def negotiate_media_type(accept: Optional[str], offers) -> str:
+    """
+    Pick the offered media type the Accept header prefers (by q-value, then by order in the header).
+
+    Falls back to the first offer when the header is missing or matches none of them.
+
+    Example:
+        >>> negotiate_media_type("text/csv;q=0.5, application/x-ndjson", SPARQL_MEDIA_TYPES)
+        'application/x-ndjson'
+    """
+    best, best_q = offers[0], 0.0
+    for item in (accept or "").split(","):
+        media_range, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if media_range == "application/ndjson":
+            media_range = NDJSON
+        if q > best_q and media_range in offers:
+            best, best_q = media_range, q
+    return best
+
+
+def csv_row(values) -> str:
+    """One CSV record, quoted as needed, with the CRLF line ending of SPARQL 1.1 CSV results."""
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\r\n").writerow(values)
+    return out.getvalue()
+
 
 def create_app(graph=None):
     SECRET_KEY = os.getenv("AXIUSMEM_SECRET_KEY", "change_this_secret")
@@ -24,7 +76,12 @@ def create_app(graph=None):
     if graph is None:
         graph = rdflib.Graph()
     user_manager = UserManager(graph)
+    # bcrypt runs in its own process pool; logins are throttled per user before any hashing
+    hasher = PasswordHasher.from_env()
+    login_throttle = LoginThrottle.from_env()
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token")
+    # Verified tokens -> (username, expiry timestamp), so repeat requests skip the signature check
+    verified_tokens = LRUCache(maxsize=4096, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
 
     class Token(BaseModel):
         access_token: str
@@ -34,6 +91,18 @@ def create_app(graph=None):
         username: str
         roles: List[str]
 
+    class TransactionTriples(BaseModel):
+        triples: List[List[str]]
+        graph_uri: Optional[str] = None
+
+    class TransactionUpdate(BaseModel):
+        update: str
+
+    class BulkLoadJob(BaseModel):
+        rdf_path: str
+        rdf_format: str = "text/turtle"
+        repository: Optional[str] = None
+
     def create_access_token(data: dict):
         from datetime import datetime, timedelta
         to_encode = data.copy()
@@ -47,14 +116,22 @@ def create_app(graph=None):
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            username: str = payload.get("sub")
-            if username is None:
+        cached = verified_tokens.get(token)
+        if cached is None:
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+                username: str = payload.get("sub")
+                if username is None:
+                    raise credentials_exception
+            except JWTError:
                 raise credentials_exception
-        except JWTError:
+            cached = (username, payload.get("exp"))
+            verified_tokens.put(token, cached)
+        username, expires = cached
+        if expires is not None and expires <= time.time():
             raise credentials_exception
-        if username not in user_manager.list_users():
+        # Checked on every request, so deleting a user revokes their cached tokens at once
+        if not user_manager.has_user(username):
             raise credentials_exception
         return username
 
@@ -63,31 +140,24 @@ def create_app(graph=None):
             raise HTTPException(status_code=403, detail="Admin privileges required")
         return username
 
-    def ensure_initial_admin():
+    async def ensure_initial_admin():
         disable_bootstrap = os.getenv("AXIUSMEM_DISABLE_ADMIN_BOOTSTRAP", "0").lower() in ("1", "true", "yes")
         if disable_bootstrap:
             logging.info("Admin bootstrap is disabled by AXIUSMEM_DISABLE_ADMIN_BOOTSTRAP.")
             return
         admin_user = os.getenv("AXIUSMEM_ADMIN_USER", "admin")
         admin_password = os.getenv("AXIUSMEM_ADMIN_PASSWORD", "admin")
-        if admin_user in user_manager.list_users():
-            # Update password and roles for existing admin user
-            # Remove old password hash triple
-            user_uri = user_manager._user_uri(admin_user)
-            for p, o in list(user_manager.graph.predicate_objects(user_uri)):
-                if str(p) == str(AXM.hasPasswordHash):
-                    user_manager.graph.remove((user_uri, p, o))
-            # Add new password hash
-            import bcrypt
-            pw_hash = bcrypt.hashpw(admin_password.encode(), bcrypt.gensalt()).decode()
-            user_manager.graph.add((user_uri, AXM.hasPasswordHash, Literal(pw_hash)))
+        if user_manager.has_user(admin_user):
+            # Update password and roles for existing admin user; skip the re-hash if the password is unchanged
+            if not await hasher.verify(admin_password, user_manager.password_hash(admin_user)):
+                user_manager.set_password_hash(admin_user, await hasher.hash(admin_password))
             # Ensure admin role is present
             if "admin" not in user_manager.get_user_roles(admin_user):
                 user_manager.assign_role(admin_user, "admin")
             logging.info(f"Updated existing admin user '{admin_user}' with new credentials and roles.")
         else:
             try:
-                user_manager.create_user(admin_user, admin_password, roles=["admin"])
+                user_manager.create_user_with_hash(admin_user, await hasher.hash(admin_password), roles=["admin"])
                 if admin_password == "admin":
                     logging.warning(f"Default admin password is in use for user '{admin_user}'. Set AXIUSMEM_ADMIN_PASSWORD to secure your instance.")
                 else:
@@ -96,64 +166,119 @@ def create_app(graph=None):
             except Exception as e:
                 logging.error(f"Failed to create initial admin user: {e}")
 
-    # Track error count in ServerStats
+    # Track error count in ServerStats; the counters are sharded per thread, so logging takes no lock
     class ServerStats:
         def __init__(self, user_manager):
             self.start_time = time.time()
-            self.total_requests = 0
-            self.endpoint_counts = {}
-            self.auth_success = 0
-            self.auth_failure = 0
-            self.error_count = 0
+            self.requests = metrics.Counter("requests", "Requests by path.", ["path"])
+            self.events = metrics.Counter("events", "Auth results and errors.", ["event"])
             self.user_manager = user_manager
-            self.lock = Lock()
         def log_request(self, endpoint):
-            with self.lock:
-                self.total_requests += 1
-                self.endpoint_counts[endpoint] = self.endpoint_counts.get(endpoint, 0) + 1
+            self.requests.inc(path=endpoint)
         def log_auth(self, success):
-            with self.lock:
-                if success:
-                    self.auth_success += 1
-                else:
-                    self.auth_failure += 1
+            self.events.inc(event="auth_success" if success else "auth_failure")
         def log_error(self):
-            with self.lock:
-                self.error_count += 1
+            self.events.inc(event="error")
         def get_stats(self):
-            with self.lock:
-                return {
-                    "uptime_seconds": int(time.time() - self.start_time),
-                    "total_requests": self.total_requests,
-                    "endpoint_counts": dict(self.endpoint_counts),
-                    "auth_success": self.auth_success,
-                    "auth_failure": self.auth_failure,
-                    "error_count": self.error_count,
-                    "user_count": len(self.user_manager.list_users()),
-                }
+            endpoint_counts = {path: int(count) for (path,), count in self.requests.values().items()}
+            return {
+                "uptime_seconds": int(time.time() - self.start_time),
+                "total_requests": sum(endpoint_counts.values()),
+                "endpoint_counts": endpoint_counts,
+                "auth_success": int(self.events.value(event="auth_success")),
+                "auth_failure": int(self.events.value(event="auth_failure")),
+                "error_count": int(self.events.value(event="error")),
+                "user_count": len(self.user_manager.list_users()),
+            }
 
     stats = ServerStats(user_manager)
 
     # In-memory transaction tracking (tx_id -> info)
     open_transactions = {}
 
+    # One shared adapter per repository, built on first use and closed on shutdown. Clients pick the
+    # repository, so only allow-listed names are accepted (by default just TRIPLESTORE_REPOSITORY)
+    # and the number of adapters is bounded. Handlers lease the adapter they use, so an evicted
+    # adapter is only closed once no request is using it.
+    allowed_repositories = [r.strip() for r in os.getenv("TRIPLESTORE_REPOSITORIES", "").split(",") if r.strip()]
+    if os.getenv("TRIPLESTORE_REPOSITORY"):
+        allowed_repositories.append(os.getenv("TRIPLESTORE_REPOSITORY"))
+    adapters = AdapterRegistry(
+        lambda repository=None: get_triplestore_adapter_from_env(repository=repository, asynchronous=True),
+        maxsize=int(os.getenv("TRIPLESTORE_MAX_REPOSITORIES", 16)),
+        allowed=allowed_repositories,
+    )
+    app.state.adapters = adapters
+    # Background jobs for long operations (bulk loads, graph clears and exports)
+    task_manager = TaskManager.from_env()
+    app.state.tasks = task_manager
+
     @app.middleware("http")
     async def log_and_count_requests(request, call_next):
         endpoint = request.url.path
+        method = request.method
         stats.log_request(endpoint)
-        logging.info(f"Request: {request.method} {endpoint}")
-        response = await call_next(request)
+        logging.info(f"Request: {method} {endpoint}")
+        start = time.perf_counter()
+        metrics.HTTP_IN_FLIGHT.inc(method=method)
+
+        def observe(route, status_code, sent):
+            metrics.HTTP_IN_FLIGHT.dec(method=method)
+            metrics.HTTP_REQUESTS.inc(method=method, path=route, status=status_code)
+            metrics.HTTP_LATENCY.observe(time.perf_counter() - start, method=method, path=route)
+            metrics.HTTP_BYTES_IN.inc(int(request.headers.get("content-length") or 0), path=route)
+            metrics.HTTP_BYTES_OUT.inc(sent, path=route)
+
+        try:
+            response = await call_next(request)
+        except Exception:
+            observe("<unmatched>", 500, 0)
+            raise
+        # Label by route template rather than raw path, so path parameters do not multiply series
+        route = getattr(request.scope.get("route"), "path", "<unmatched>")
         logging.info(f"Response: {response.status_code} {endpoint}")
+        body = response.body_iterator
+
+        async def counted_body():
+            # Latency and bytes out are recorded once the body is fully sent, so streams count in full
+            sent = 0
+            try:
+                async for chunk in body:
+                    sent += len(chunk)
+                    yield chunk
+            finally:
+                observe(route, response.status_code, sent)
+
+        response.body_iterator = counted_body()
         return response
 
     @app.on_event("startup")
-    def startup_event():
-        ensure_initial_admin()
+    async def startup_event():
+        await ensure_initial_admin()
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        await task_manager.shutdown()
+        await adapters.aclose()
+        await run_in_threadpool(hasher.close)
+
+    async def call_adapter(method, *args, **kwargs):
+        """Await an async adapter method, or run a blocking one in the threadpool."""
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        return await run_in_threadpool(method, *args, **kwargs)
 
     # Patch login to log auth stats
     @app.post("/token", response_model=Token)
-    def login(form_data: OAuth2PasswordRequestForm = Depends()):
-        success = user_manager.authenticate_user(form_data.username, form_data.password)
+    async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+        retry_after = login_throttle.attempt(form_data.username)
+        if retry_after:
+            raise HTTPException(status_code=429, detail="Too many login attempts",
+                                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))})
+        try:
+            success = await hasher.verify(form_data.password, user_manager.password_hash(form_data.username))
+        except PasswordHasherBusy as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
         stats.log_auth(success)
         if not success:
             raise HTTPException(status_code=400, detail="Incorrect username or password")
@@ -161,9 +286,13 @@ def create_app(graph=None):
         return {"access_token": access_token, "token_type": "bearer"}
 
     @app.post("/users/", dependencies=[Depends(require_admin)])
-    def create_user(username: str, password: str, roles: Optional[List[str]] = None):
+    async def create_user(username: str, password: str, roles: Optional[List[str]] = None):
+        if user_manager.has_user(username):
+            raise HTTPException(status_code=400, detail="User already exists")
         try:
-            user_manager.create_user(username, password, roles)
+            user_manager.create_user_with_hash(username, await hasher.hash(password), roles)
+        except PasswordHasherBusy as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         return {"msg": "User created"}
@@ -188,138 +317,402 @@ def create_app(graph=None):
 
     # Health check endpoint (public)
     @app.get("/health")
-    def health_check(repository: Optional[str] = None):
-        """Public health check endpoint. Returns status and triplestore connectivity. Optionally accepts repository/dataset."""
+    async def health_check(repository: Optional[str] = None):
+        """
+        Public health check endpoint. Returns status, triplestore connectivity and the state of the
+        triplestore circuit breakers. Optionally accepts repository/dataset.
+        """
+        breakers = {name: breaker["state"] for name, breaker in DEFAULT_POLICY.breakers().items()}
         try:
-            adapter = get_triplestore_adapter_from_env(repository=repository)
-            triplestore_ok = False
-            try:
-                triplestore_ok = adapter.test_connection()
-            except Exception:
-                triplestore_ok = False
-            return {"status": "ok", "triplestore": "ok" if triplestore_ok else "unreachable"}
+            with adapters.lease(repository) as adapter:
+                try:
+                    triplestore_ok = await call_adapter(adapter.test_connection)
+                except Exception:
+                    triplestore_ok = False
+            return {"status": "ok", "triplestore": "ok" if triplestore_ok else "unreachable", "circuit_breakers": breakers}
+        except UnknownRepositoryError as e:
+            raise HTTPException(status_code=404, detail=str(e))
         except Exception:
-            return {"status": "ok", "triplestore": "unconfigured"}
+            return {"status": "ok", "triplestore": "unconfigured", "circuit_breakers": breakers}
 
     # Metrics endpoint (admin-only)
+    def metrics_snapshot():
+        data = stats.get_stats()
+        cache = {"hits": 0, "misses": 0, "entries": 0}
+        for adapter in adapters.values():
+            if hasattr(adapter, "cache_stats"):
+                for name, value in adapter.cache_stats().items():
+                    cache[name] += value
+        data["cache"] = cache
+        data["coalesced_queries"] = sum(
+            adapter.coalesce_stats()["coalesced"] for adapter in adapters.values() if hasattr(adapter, "coalesce_stats")
+        )
+        data["circuit_breakers"] = DEFAULT_POLICY.breakers()
+        data["password_hashing"] = {"pending": hasher.pending, "rejected": hasher.rejected}
+        data["login_throttled"] = login_throttle.throttled
+        data["tasks"] = task_manager.counts()
+        return data
+
+    def prometheus_metrics(data):
+        label = metrics.label_pairs
+        families = [
+            ("axiusmem_uptime_seconds", "gauge", "Seconds since the API started.", [("", "", data["uptime_seconds"])]),
+            ("axiusmem_users", "gauge", "Registered users.", [("", "", data["user_count"])]),
+            ("axiusmem_auth_total", "counter", "Login attempts by result.",
+             [("", label(result="success"), data["auth_success"]), ("", label(result="failure"), data["auth_failure"])]),
+            ("axiusmem_login_throttled_total", "counter", "Logins refused by the per-user throttle.", [("", "", data["login_throttled"])]),
+            ("axiusmem_password_hashing_pending", "gauge", "Password hashing calls running or queued.",
+             [("", "", data["password_hashing"]["pending"])]),
+            ("axiusmem_password_hashing_rejected_total", "counter", "Password hashing calls refused because the queue was full.",
+             [("", "", data["password_hashing"]["rejected"])]),
+            ("axiusmem_sparql_cache_hits_total", "counter", "SPARQL result cache hits.", [("", "", data["cache"]["hits"])]),
+            ("axiusmem_sparql_cache_misses_total", "counter", "SPARQL result cache misses.", [("", "", data["cache"]["misses"])]),
+            ("axiusmem_sparql_cache_entries", "gauge", "Cached SPARQL results.", [("", "", data["cache"]["entries"])]),
+            ("axiusmem_coalesced_queries_total", "counter", "SELECTs served by another caller's in-flight request.",
+             [("", "", data["coalesced_queries"])]),
+            ("axiusmem_circuit_breaker_open", "gauge", "1 if the endpoint's circuit breaker is open or half-open.",
+             [("", label(endpoint=name), int(b["state"] != "closed")) for name, b in data["circuit_breakers"].items()]),
+            ("axiusmem_circuit_breaker_rejected_total", "counter", "Calls refused by an open circuit breaker.",
+             [("", label(endpoint=name), b["rejected"]) for name, b in data["circuit_breakers"].items()]),
+            ("axiusmem_tasks", "gauge", "Background tasks by state (finished ones while retained).",
+             [("", label(state=state), count) for state, count in data["tasks"].items()]),
+        ]
+        return metrics.REGISTRY.render() + "".join(metrics.format_metric(*family) for family in families)
+
     @app.get("/metrics", dependencies=[Depends(require_admin)])
-    def metrics():
-        """Admin-only metrics endpoint. Returns server stats as JSON."""
-        return stats.get_stats()
+    def get_metrics(request: Request):
+        """
+        Admin-only metrics endpoint, in the Prometheus text format: request and triplestore latency
+        histograms, in-flight gauges, bytes in/out, triplestore errors, result cache, coalescing and
+        circuit breaker state. Send ``Accept: application/json`` for the server stats as JSON instead.
+        """
+        data = metrics_snapshot()
+        if "application/json" in request.headers.get("accept", ""):
+            return data
+        return PlainTextResponse(prometheus_metrics(data), media_type=metrics.CONTENT_TYPE)
 
-    # Tasks endpoint (admin-only, stub)
     @app.get("/tasks", dependencies=[Depends(require_admin)])
-    def tasks():
-        """Admin-only tasks endpoint. Returns a list of background/async tasks (stub for now)."""
-        # In the future, return real background/async tasks
-        return {"tasks": []}
+    def tasks(include_finished: bool = False):
+        """Admin-only tasks endpoint. Lists queued and running background tasks, and retained finished ones if include_finished."""
+        return {"tasks": [task.to_dict() for task in task_manager.list(include_finished)]}
+
+    @app.get("/tasks/{task_id}", dependencies=[Depends(require_admin)])
+    def get_task(task_id: str):
+        task = task_manager.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found.")
+        return task.to_dict()
+
+    @app.delete("/tasks/{task_id}", dependencies=[Depends(require_admin)])
+    def cancel_task(task_id: str):
+        """
+        Cancel a queued or running task. Work already done by the triplestore is not undone.
+        A running graph clear or delete cannot be interrupted: cancelling it returns 409.
+        """
+        try:
+            task = task_manager.cancel(task_id)
+        except TaskNotCancellable as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        if task is None:
+            raise HTTPException(status_code=404, detail=f"Task {task_id} not found.")
+        return task.to_dict()
+
+    def submit_task(name, job, **params):
+        try:
+            task = task_manager.submit(name, job, **params)
+        except TaskQueueFull as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        return JSONResponse(status_code=202, content={"task_id": task.id, "task": task.to_dict()})
+
+    def accepts_progress(adapter) -> bool:
+        # Decorating adapters forward **kwargs; ask the adapter that does the work
+        while hasattr(adapter, "adapter"):
+            adapter = adapter.adapter
+        return "progress" in inspect.signature(adapter.bulk_load).parameters
+
+    def import_path(rdf_path: str) -> str:
+        """
+        Resolve a bulk load path inside AXIUSMEM_IMPORT_DIR, following symlinks, so only files
+        placed there can be loaded. Relative paths are taken from the import directory.
+        """
+        import_dir = os.getenv("AXIUSMEM_IMPORT_DIR")
+        if not import_dir:
+            raise HTTPException(status_code=403, detail="Bulk loads from server files are disabled; set AXIUSMEM_IMPORT_DIR.")
+        root = os.path.realpath(import_dir)
+        path = os.path.realpath(os.path.join(root, rdf_path))
+        # The same answer whether the file is outside the directory or missing, so paths cannot be probed
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            raise HTTPException(status_code=400, detail="rdf_path must name a file in the import directory.")
+        return path
+
+    @app.post("/tasks/bulk_load", dependencies=[Depends(require_admin)], status_code=202)
+    async def submit_bulk_load(body: BulkLoadJob):
+        """
+        Bulk load a file from the server's import directory (AXIUSMEM_IMPORT_DIR), as a background
+        task reporting bytes uploaded.
+        """
+        rdf_path = import_path(body.rdf_path)
+        # An unknown repository gets 404 here rather than a failed task; the job leases the adapter
+        adapters.get(body.repository)
+
+        async def job(task):
+            task.report(0, os.path.getsize(rdf_path), "loading")
+            with adapters.lease(body.repository) as adapter:
+                kwargs = {"progress": lambda done, total: task.report(done, total)} if accepts_progress(adapter) else {}
+                await call_adapter(adapter.bulk_load, rdf_path, body.rdf_format, **kwargs)
+            task.report(task.total, message="loaded")
+            return {"loaded": body.rdf_path}
+
+        return submit_task("bulk_load", job, rdf_path=body.rdf_path, rdf_format=body.rdf_format, repository=body.repository)
+
+    def submit_graph_task(name, method, graph_uri, repository):
+        adapters.get(repository)
+
+        async def job(task):
+            task.report(0, 1, f"{name} {graph_uri}")
+            # One triplestore call: once sent it runs to completion, so it cannot be cancelled
+            with adapters.lease(repository) as adapter, task.uninterruptible():
+                await call_adapter(getattr(adapter, method), graph_uri)
+            task.report(1)
+            return {"graph_uri": graph_uri}
+        return submit_task(name, job, graph_uri=graph_uri, repository=repository)
+
+    @app.post("/tasks/graphs/{graph_uri}/clear", dependencies=[Depends(require_admin)], status_code=202)
+    async def submit_clear_named_graph(graph_uri: str, repository: Optional[str] = None):
+        """Clear a named graph as a background task."""
+        return submit_graph_task("clear_graph", "clear_named_graph", graph_uri, repository)
+
+    @app.post("/tasks/graphs/{graph_uri}/delete", dependencies=[Depends(require_admin)], status_code=202)
+    async def submit_delete_named_graph(graph_uri: str, repository: Optional[str] = None):
+        """Delete a named graph as a background task."""
+        return submit_graph_task("delete_graph", "delete_named_graph", graph_uri, repository)
+
+    @app.post("/tasks/graphs/{graph_uri}/export", dependencies=[Depends(require_admin)], status_code=202)
+    async def submit_graph_export(graph_uri: str, repository: Optional[str] = None):
+        """
+        Export a named graph to an N-Triples file on the server, as a background task reporting
+        triples written. The file is written to AXIUSMEM_EXPORT_DIR (default: the temp directory),
+        and its path is the task result.
+        """
+        adapters.get(repository)
+        export_dir = os.getenv("AXIUSMEM_EXPORT_DIR", tempfile.gettempdir())
+
+        async def job(task):
+            path = os.path.join(export_dir, f"axiusmem-export-{task.id}.nt")
+            query = f"SELECT ?s ?p ?o WHERE {{ GRAPH <{graph_uri}> {{ ?s ?p ?o }} }}"
+            written = 0
+            lines = []
+            try:
+                with open(path, "w", encoding="utf-8") as out, adapters.lease(repository) as adapter:
+                    if hasattr(adapter, "sparql_select_iter"):
+                        bindings = iterate_adapter(adapter.sparql_select_iter, query)
+                    else:
+                        bindings = iterate_in_threadpool(iter(result_bindings(await call_adapter(adapter.sparql_select, query))))
+                    async for binding in bindings:
+                        lines.append(ntriples_line(tuple(json_to_term(binding[name]) for name in ("s", "p", "o"))))
+                        if len(lines) >= 10000:
+                            await run_in_threadpool(out.writelines, lines)
+                            written += len(lines)
+                            lines = []
+                            task.report(written)
+                    await run_in_threadpool(out.writelines, lines)
+            except BaseException:
+                # Do not leave a partial export behind on failure or cancellation
+                os.remove(path)
+                raise
+            written += len(lines)
+            task.report(written, written)
+            return {"path": path, "triples": written}
+
+        return submit_task("export_graph", job, graph_uri=graph_uri, repository=repository)
+
+    @app.exception_handler(UnknownRepositoryError)
+    async def unknown_repository(request, exc):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
 
     def handle_adapter_error(e, operation: str = "operation"):
+        if isinstance(e, UnknownRepositoryError):
+            return HTTPException(status_code=404, detail=str(e))
         stats.log_error()
-        import tenacity
-        # Check exception chain for RetryError
-        exc = e
-        while exc:
-            if isinstance(exc, tenacity.RetryError):
-                last_exc = getattr(exc, 'last_attempt', None)
-                last_exc_msg = ''
-                if last_exc and hasattr(last_exc, 'exception'):
-                    last_exc_msg = last_exc.exception()
-                return HTTPException(
-                    status_code=503,
-                    detail=f"{operation} failed after multiple retries due to a transient error: {last_exc_msg}. Please try again later."
-                )
-            exc = getattr(exc, '__cause__', None) or getattr(exc, '__context__', None)
+        if isinstance(e, CircuitOpenError):
+            return HTTPException(
+                status_code=503,
+                detail=f"{operation} rejected: the triplestore is failing, retry in {e.retry_after:.0f}s.",
+                headers={"Retry-After": str(max(int(e.retry_after + 0.5), 1))},
+            )
         return HTTPException(status_code=500, detail=f"{operation} failed: {e}")
 
+    def iterate_adapter(method, *args, **kwargs):
+        """Async-iterate an adapter generator method, running blocking generators in the threadpool."""
+        # Calling a generator function does no work yet; only a blocking iterator needs the threadpool
+        result = method(*args, **kwargs)
+        if hasattr(result, "__anext__"):
+            return result
+        return iterate_in_threadpool(result)
+
+    async def open_bindings(adapter, query: str):
+        if hasattr(adapter, "sparql_select_iter"):
+            bindings = iterate_adapter(adapter.sparql_select_iter, query)
+        else:
+            bindings = iterate_in_threadpool(iter(result_bindings(await call_adapter(adapter.sparql_select, query))))
+        # Fetch the first row before responding so connection and query errors still map to an HTTP status
+        try:
+            first = await bindings.__anext__()
+        except StopAsyncIteration:
+            first = None
+        return first, bindings
+
+    async def stream_bindings(repository, query: str, media_type: str = "application/json"):
+        """
+        Stream a SELECT result in the given format, as the repository's adapter yields the rows.
+        The adapter stays leased until the stream ends.
+        """
+        adapter = adapters.acquire(repository)
+        try:
+            first, bindings = await open_bindings(adapter, query)
+        except BaseException:
+            adapters.release(adapter)
+            raise
+        head, separator, tail = "", "", ""
+        if media_type == "application/json":
+            head, separator, tail = '{"results": [', ",", "]}"
+            encode = json.dumps
+        elif media_type == NDJSON:
+            encode = lambda binding: json.dumps(binding) + "\n"
+        else:
+            variables = query_variables(query) or list(first or ())
+            if media_type == "text/csv":
+                head = csv_row(variables)
+                encode = lambda binding: csv_row([csv_value(binding.get(var)) for var in variables])
+            else:
+                head, separator, tail = '{"head": {"vars": %s}, "results": {"bindings": [' % json.dumps(variables), ",", "]}}"
+                encode = json.dumps
+
+        async def body():
+            try:
+                yield head
+                if first is not None:
+                    # The first row goes out on its own for a fast first byte; later rows in ~64 KB chunks
+                    yield encode(first)
+                    chunk, size = [], 0
+                    try:
+                        async for binding in bindings:
+                            row = separator + encode(binding)
+                            chunk.append(row)
+                            size += len(row)
+                            if size >= STREAM_CHUNK_SIZE:
+                                yield "".join(chunk)
+                                chunk, size = [], 0
+                    except Exception as e:
+                        stats.log_error()
+                        logging.error(f"SPARQL result stream aborted: {e}")
+                        raise
+                    yield "".join(chunk)
+                yield tail
+            finally:
+                adapters.release(adapter)
+
+        return StreamingResponse(body(), media_type=media_type)
+
     # Patch all endpoints that interact with the adapter to use handle_adapter_error
     @app.get("/sparql")
-    def sparql_get(query: str, repository: Optional[str] = None):
-        """Run a SPARQL SELECT query. Optionally accepts repository/dataset."""
+    async def sparql_get(request: Request, query: str, repository: Optional[str] = None, stream: bool = False):
+        """
+        Run a SPARQL SELECT query. Optionally accepts repository/dataset.
+
+        The response format follows the Accept header: ``application/x-ndjson`` (one binding per
+        line), ``text/csv`` (SPARQL 1.1 CSV results) or ``application/sparql-results+json``
+        are streamed to the client as the triplestore returns the rows. Otherwise the result is
+        returned as ``{"results": [...]}``, streamed in that shape with ``stream=true``.
+        """
         try:
-            adapter = get_triplestore_adapter_from_env(repository=repository)
-            if query.strip().lower().startswith("ask"):
-                result = adapter.sparql_select(query)
-            else:
-                result = adapter.sparql_select(query)
-            return {"results": result}
+            media_type = negotiate_media_type(request.headers.get("accept"), SPARQL_MEDIA_TYPES)
+            is_ask = query.strip().lower().startswith("ask")
+            if not is_ask and (stream or media_type != "application/json"):
+                return await stream_bindings(repository, query, media_type)
+            with adapters.lease(repository) as adapter:
+                result = await call_adapter(adapter.sparql_select, query)
+            if is_ask and media_type == "application/sparql-results+json" and isinstance(result, dict):
+                return JSONResponse(result, media_type=media_type)
+            # The result is plain JSON already: skip FastAPI's jsonable_encoder pass over it
+            return JSONResponse({"results": result})
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="SPARQL endpoint not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "SPARQL query")
 
     @app.get("/graphs/", dependencies=[Depends(require_admin)])
-    def list_named_graphs():
+    async def list_named_graphs():
         try:
-            adapter = get_triplestore_adapter_from_env()
-            return {"graphs": adapter.list_named_graphs()}
+            with adapters.lease() as adapter:
+                return {"graphs": await call_adapter(adapter.list_named_graphs)}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "List named graphs")
 
     @app.post("/graphs/", dependencies=[Depends(require_admin)])
-    def create_named_graph(graph_uri: str):
+    async def create_named_graph(graph_uri: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.create_named_graph(graph_uri)
-            return {"msg": f"Named graph {graph_uri} created."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.create_named_graph, graph_uri)
+                return {"msg": f"Named graph {graph_uri} created."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Create named graph")
 
     @app.delete("/graphs/{graph_uri}", dependencies=[Depends(require_admin)])
-    def delete_named_graph(graph_uri: str):
+    async def delete_named_graph(graph_uri: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.delete_named_graph(graph_uri)
-            return {"msg": f"Named graph {graph_uri} deleted."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.delete_named_graph, graph_uri)
+                return {"msg": f"Named graph {graph_uri} deleted."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Delete named graph")
 
     @app.post("/graphs/{graph_uri}/clear", dependencies=[Depends(require_admin)])
-    def clear_named_graph(graph_uri: str):
+    async def clear_named_graph(graph_uri: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.clear_named_graph(graph_uri)
-            return {"msg": f"Named graph {graph_uri} cleared."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.clear_named_graph, graph_uri)
+                return {"msg": f"Named graph {graph_uri} cleared."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Clear named graph")
 
     @app.post("/graphs/{graph_uri}/add", dependencies=[Depends(require_admin)])
-    def add_triples_to_named_graph(graph_uri: str, triples: list):
+    async def add_triples_to_named_graph(graph_uri: str, triples: list):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.add_triples_to_named_graph(graph_uri, triples)
-            return {"msg": f"Triples added to named graph {graph_uri}."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.add_triples_to_named_graph, graph_uri, triples)
+                return {"msg": f"Triples added to named graph {graph_uri}."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Add triples to named graph")
 
     @app.post("/graphs/{graph_uri}/query", dependencies=[Depends(require_admin)])
-    def query_named_graph(graph_uri: str, query: str):
+    async def query_named_graph(graph_uri: str, query: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            results = adapter.get_triples_from_named_graph(graph_uri, query)
-            return {"results": results}
+            with adapters.lease() as adapter:
+                results = await call_adapter(adapter.get_triples_from_named_graph, graph_uri, query)
+                return {"results": results}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Named graph management not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Query named graph")
 
     @app.post("/transactions/begin", dependencies=[Depends(require_admin)])
-    def begin_transaction():
+    async def begin_transaction():
         try:
-            adapter = get_triplestore_adapter_from_env()
-            tx_id = adapter.begin_transaction()
-            open_transactions[tx_id] = {"status": "open"}
-            return {"tx_id": tx_id}
+            with adapters.lease() as adapter:
+                tx_id = await call_adapter(adapter.begin_transaction)
+                open_transactions[tx_id] = {"status": "open"}
+                return {"tx_id": tx_id}
         except NotImplementedError as nie:
             raise HTTPException(status_code=501, detail="Transactions not supported by this adapter.") from nie
         except Exception as e:
@@ -331,25 +724,58 @@ def create_app(graph=None):
                 exc = getattr(exc, '__cause__', None) or getattr(exc, '__context__', None)
             raise handle_adapter_error(e, "Begin transaction")
 
+    @app.post("/transactions/{tx_id}/add", dependencies=[Depends(require_admin)])
+    async def add_in_transaction(tx_id: str, body: TransactionTriples):
+        try:
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.transaction_add, tx_id, body.triples, body.graph_uri)
+                return {"msg": f"{len(body.triples)} triples added in transaction {tx_id}."}
+        except NotImplementedError:
+            raise HTTPException(status_code=501, detail="Transaction-scoped writes not supported by this adapter.")
+        except Exception as e:
+            raise handle_adapter_error(e, "Add triples in transaction")
+
+    @app.post("/transactions/{tx_id}/remove", dependencies=[Depends(require_admin)])
+    async def remove_in_transaction(tx_id: str, body: TransactionTriples):
+        try:
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.transaction_remove, tx_id, body.triples, body.graph_uri)
+                return {"msg": f"{len(body.triples)} triples removed in transaction {tx_id}."}
+        except NotImplementedError:
+            raise HTTPException(status_code=501, detail="Transaction-scoped writes not supported by this adapter.")
+        except Exception as e:
+            raise handle_adapter_error(e, "Remove triples in transaction")
+
+    @app.post("/transactions/{tx_id}/update", dependencies=[Depends(require_admin)])
+    async def update_in_transaction(tx_id: str, body: TransactionUpdate):
+        try:
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.transaction_update, tx_id, body.update)
+                return {"msg": f"Update executed in transaction {tx_id}."}
+        except NotImplementedError:
+            raise HTTPException(status_code=501, detail="Transaction-scoped writes not supported by this adapter.")
+        except Exception as e:
+            raise handle_adapter_error(e, "Update in transaction")
+
     @app.post("/transactions/{tx_id}/commit", dependencies=[Depends(require_admin)])
-    def commit_transaction(tx_id: str):
+    async def commit_transaction(tx_id: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.commit_transaction(tx_id)
-            open_transactions.pop(tx_id, None)
-            return {"msg": f"Transaction {tx_id} committed."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.commit_transaction, tx_id)
+                open_transactions.pop(tx_id, None)
+                return {"msg": f"Transaction {tx_id} committed."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Transactions not supported by this adapter.")
         except Exception as e:
             raise handle_adapter_error(e, "Commit transaction")
 
     @app.post("/transactions/{tx_id}/rollback", dependencies=[Depends(require_admin)])
-    def rollback_transaction(tx_id: str):
+    async def rollback_transaction(tx_id: str):
         try:
-            adapter = get_triplestore_adapter_from_env()
-            adapter.rollback_transaction(tx_id)
-            open_transactions.pop(tx_id, None)
-            return {"msg": f"Transaction {tx_id} rolled back."}
+            with adapters.lease() as adapter:
+                await call_adapter(adapter.rollback_transaction, tx_id)
+                open_transactions.pop(tx_id, None)
+                return {"msg": f"Transaction {tx_id} rolled back."}
         except NotImplementedError:
             raise HTTPException(status_code=501, detail="Transactions not supported by this adapter.")
         except Exception as e:
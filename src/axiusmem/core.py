@@ -4,8 +4,12 @@ from dotenv import load_dotenv
 from rdflib.namespace import OWL, RDF, RDFS
 from typing import List, Tuple, Optional, Union
 from .utils import attach_provenance
-from .temporal import add_valid_time, add_transaction_time, query_point_in_time, query_as_of
+from .temporal import (
+    add_transaction_time, add_temporal_triples, close_transaction_time,
+    attach_temporal_index, invalidate_temporal_index, temporal_view, TimeValue,
+)
 from .query_engine import sparql_select, sparql_construct, sparql_update
+from .ingest import iter_triple_batches, ProgressCallback
 
 class AxiusMEM:
     """
@@ -34,6 +38,7 @@ class AxiusMEM:
         self.graph = rdflib.Graph()
         self.ontologies = set()
         self.load_ontology(self.ontology_path)
+        attach_temporal_index(self.graph)
         self.triplestore_type = os.getenv("TRIPLESTORE_TYPE")
         self.triplestore_url = os.getenv("TRIPLESTORE_URL")
         self.triplestore_user = os.getenv("TRIPLESTORE_USER")
@@ -51,6 +56,7 @@ class AxiusMEM:
         fmt = format or ("turtle" if ontology_path.endswith(".ttl") else "xml")
         self.graph.parse(ontology_path, format=fmt)
         self.ontologies.add(ontology_path)
+        invalidate_temporal_index(self.graph)
 
     def extend_ontology(self, triples: List[Tuple[rdflib.term.Identifier, rdflib.term.Identifier, rdflib.term.Identifier]]) -> None:
         """
@@ -118,23 +124,29 @@ class AxiusMEM:
         """
         Add triples to the graph, optionally with valid/transaction time and provenance.
 
+        The batch is written in a single ``addN`` call with shared time literals, and when both valid
+        and transaction time are given each triple gets a single reification node carrying both (see
+        :func:`axiusmem.temporal.add_temporal_triples`).
+
         Args:
             triples (List[Tuple]): List of (subject, predicate, object) triples to add.
-            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
-            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
+            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
+            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
             provenance (Optional[dict]): Provenance metadata.
 
         Example:
             >>> mem.add_triples([(s, p, o)], valid_time={"from": "2024-01-01"})
         """
-        for s, p, o in triples:
-            self.graph.add((s, p, o))
-            if valid_time:
-                add_valid_time(self.graph, (s, p, o), valid_time['from'], valid_time.get('to'))
-            if transaction_time:
-                add_transaction_time(self.graph, (s, p, o), transaction_time['from'], transaction_time.get('to'))
-            if provenance:
-                attach_provenance((s, p, o), **provenance)
+        valid_time = valid_time or {}
+        transaction_time = transaction_time or {}
+        add_temporal_triples(
+            self.graph, triples,
+            valid_from=valid_time.get('from'), valid_to=valid_time.get('to'),
+            transaction_from=transaction_time.get('from'), transaction_to=transaction_time.get('to'),
+        )
+        if provenance:
+            for triple in triples:
+                attach_provenance(triple, **provenance)
 
     def update_triple(
         self,
@@ -150,8 +162,8 @@ class AxiusMEM:
         Args:
             old_triple (Tuple): The triple to retract.
             new_triple (Tuple): The triple to add.
-            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
-            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
+            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
+            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
             provenance (Optional[dict]): Provenance metadata.
         """
         self.delete_triple(old_triple, transaction_time=transaction_time, provenance=provenance)
@@ -166,15 +178,20 @@ class AxiusMEM:
         """
         Delete a triple from the graph, optionally recording transaction time and provenance.
 
+        With a transaction time, the open transaction time intervals of the triple's statement nodes
+        are closed at ``transaction_time['from']`` (see
+        :func:`axiusmem.temporal.close_transaction_time`); if none is open, a new transaction time
+        statement is recorded instead.
+
         Args:
             triple (Tuple): The triple to delete.
-            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
+            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
             provenance (Optional[dict]): Provenance metadata.
         """
         s, p, o = triple
         if (s, p, o) in self.graph:
             self.graph.remove((s, p, o))
-            if transaction_time:
+            if transaction_time and not close_transaction_time(self.graph, (s, p, o), transaction_time['from']):
                 add_transaction_time(self.graph, (s, p, o), transaction_time['from'], transaction_time.get('to'))
             if provenance:
                 attach_provenance((s, p, o), **provenance)
@@ -186,25 +203,40 @@ class AxiusMEM:
         valid_time: Optional[dict] = None,
         transaction_time: Optional[dict] = None,
         provenance: Optional[dict] = None,
+        batch_size: int = 10000,
+        progress: Optional[ProgressCallback] = None,
+        workers: Optional[int] = None,
     ) -> int:
         """
         Batch ingest RDF data from a file. Optionally apply valid/transaction time and provenance to all loaded triples.
 
+        The file is streamed in batches of ``batch_size`` triples through :meth:`add_triples`, so
+        N-Triples, N-Quads and Turtle files larger than memory can be loaded (see
+        :func:`axiusmem.ingest.iter_triple_batches`).
+
         Args:
             file_path (str): Path to the RDF file.
-            format (str): RDF format ("turtle", "xml", etc.).
-            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
-            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings).
+            format (str): RDF format ("turtle", "nt", "nquads", "xml", etc.).
+            valid_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
+            transaction_time (Optional[dict]): Dict with 'from' and optional 'to' (ISO 8601 strings or datetimes).
             provenance (Optional[dict]): Provenance metadata.
+            batch_size (int): Number of triples ingested per batch.
+            progress (Optional[Callable[[int, int], None]]): Called after each batch with the number
+                of triples and bytes read so far.
+            workers (Optional[int]): Number of processes parsing N-Triples/N-Quads in parallel;
+                triples are still added in file order.
 
         Returns:
             int: Number of triples added.
+
+        Example:
+            >>> mem.bulk_load("dump.nt", format="nt", progress=lambda n, b: print(n, b))
         """
-        temp_graph = rdflib.Graph()
-        temp_graph.parse(file_path, format=format)
-        triples = list(temp_graph)
-        self.add_triples(triples, valid_time=valid_time, transaction_time=transaction_time, provenance=provenance)
-        return len(triples)
+        total = 0
+        for batch in iter_triple_batches(file_path, format=format, batch_size=batch_size, progress=progress, workers=workers):
+            self.add_triples(batch, valid_time=valid_time, transaction_time=transaction_time, provenance=provenance)
+            total += len(batch)
+        return total
 
     def get_graph(self) -> rdflib.Graph:
         """
@@ -259,135 +291,117 @@ class AxiusMEM:
         Args:
             query (str): The SPARQL UPDATE query to run.
         """
-        return sparql_update(self.graph, query)
+        result = sparql_update(self.graph, query)
+        invalidate_temporal_index(self.graph)
+        return result
 
-    def select_point_in_time(self, query: str, time: str):
+    def select_point_in_time(self, query: str, time: TimeValue):
         """
-        Run a SPARQL SELECT query on the subgraph valid at a specific valid time (ISO 8601 string).
+        Run a SPARQL SELECT query on the subgraph valid at a specific valid time (ISO 8601 string or datetime).
 
         Args:
             query (str): The SPARQL SELECT query to run.
-            time (str): The valid time (ISO 8601 string).
+            time (TimeValue): The valid time (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        subgraph = query_point_in_time(self.graph, time)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, time), query)
 
-    def select_as_of(self, query: str, transaction_time: str):
+    def select_as_of(self, query: str, transaction_time: TimeValue):
         """
-        Run a SPARQL SELECT query on the subgraph as known at a specific transaction time (ISO 8601 string).
+        Run a SPARQL SELECT query on the subgraph as known at a specific transaction time (ISO 8601 string or datetime).
 
         Args:
             query (str): The SPARQL SELECT query to run.
-            transaction_time (str): The transaction time (ISO 8601 string).
+            transaction_time (TimeValue): The transaction time (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        subgraph = query_as_of(self.graph, transaction_time)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, transaction_time, dimension="transaction"), query)
 
-    def select_interval_valid_time(self, query: str, start: str, end: str):
+    def select_interval_valid_time(self, query: str, start: TimeValue, end: TimeValue):
         """
-        Run a SPARQL SELECT query on the subgraph valid at any point during [start, end] (ISO 8601 strings).
+        Run a SPARQL SELECT query on the subgraph valid at any point during [start, end] (ISO 8601 strings or datetimes).
 
         Args:
             query (str): The SPARQL SELECT query to run.
-            start (str): Interval start (ISO 8601 string).
-            end (str): Interval end (ISO 8601 string).
+            start (TimeValue): Interval start (ISO 8601 string or datetime).
+            end (TimeValue): Interval end (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        from .temporal import query_interval_valid_time
-        subgraph = query_interval_valid_time(self.graph, start, end)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, start, end), query)
 
-    def select_interval_transaction_time(self, query: str, start: str, end: str):
+    def select_interval_transaction_time(self, query: str, start: TimeValue, end: TimeValue):
         """
-        Run a SPARQL SELECT query on the subgraph known at any point during [start, end] (ISO 8601 strings).
+        Run a SPARQL SELECT query on the subgraph known at any point during [start, end] (ISO 8601 strings or datetimes).
 
         Args:
             query (str): The SPARQL SELECT query to run.
-            start (str): Interval start (ISO 8601 string).
-            end (str): Interval end (ISO 8601 string).
+            start (TimeValue): Interval start (ISO 8601 string or datetime).
+            end (TimeValue): Interval end (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        from .temporal import query_interval_transaction_time
-        subgraph = query_interval_transaction_time(self.graph, start, end)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, start, end, dimension="transaction"), query)
 
-    def path_query_point_in_time(self, query: str, time: str):
+    def path_query_point_in_time(self, query: str, time: TimeValue):
         """
         Run a SPARQL path/traversal query on the subgraph valid at a specific valid time.
 
         Args:
             query (str): The SPARQL path/traversal query to run.
-            time (str): The valid time (ISO 8601 string).
+            time (TimeValue): The valid time (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        subgraph = query_point_in_time(self.graph, time)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, time), query)
 
-    def path_query_interval_valid_time(self, query: str, start: str, end: str):
+    def path_query_interval_valid_time(self, query: str, start: TimeValue, end: TimeValue):
         """
         Run a SPARQL path/traversal query on the subgraph valid at any point during [start, end].
 
         Args:
             query (str): The SPARQL path/traversal query to run.
-            start (str): Interval start (ISO 8601 string).
-            end (str): Interval end (ISO 8601 string).
+            start (TimeValue): Interval start (ISO 8601 string or datetime).
+            end (TimeValue): Interval end (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        from .temporal import query_interval_valid_time
-        subgraph = query_interval_valid_time(self.graph, start, end)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, start, end), query)
 
-    def aggregate_point_in_time(self, query: str, time: str):
+    def aggregate_point_in_time(self, query: str, time: TimeValue):
         """
         Run a SPARQL aggregation query on the subgraph valid at a specific valid time.
 
         Args:
             query (str): The SPARQL aggregation query to run.
-            time (str): The valid time (ISO 8601 string).
+            time (TimeValue): The valid time (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        subgraph = query_point_in_time(self.graph, time)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, time), query)
 
-    def aggregate_interval_valid_time(self, query: str, start: str, end: str):
+    def aggregate_interval_valid_time(self, query: str, start: TimeValue, end: TimeValue):
         """
         Run a SPARQL aggregation query on the subgraph valid at any point during [start, end].
 
         Args:
             query (str): The SPARQL aggregation query to run.
-            start (str): Interval start (ISO 8601 string).
-            end (str): Interval end (ISO 8601 string).
+            start (TimeValue): Interval start (ISO 8601 string or datetime).
+            end (TimeValue): Interval end (ISO 8601 string or datetime).
 
         Returns:
             Tuple[List[dict], pandas.DataFrame]: Query results as a list of dicts and a DataFrame.
         """
-        from .temporal import query_interval_valid_time
-        subgraph = query_interval_valid_time(self.graph, start, end)
-        from .query_engine import sparql_select
-        return sparql_select(subgraph, query)
+        return sparql_select(temporal_view(self.graph, start, end), query)
 
     # TODO: Add support for inferencing (local and GraphDB-backed)
     # TODO: Add more provenance utilities as needed 
\ No newline at end of file
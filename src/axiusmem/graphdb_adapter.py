@@ -2,17 +2,31 @@ import requests
 import logging
 from typing import Optional, Dict, Any, List, Union
 import os
-import tenacity
-from axiusmem.adapters.base import BaseTriplestoreAdapter
-
-# Retry config: 3 attempts, exponential backoff, retry on network/HTTP 5xx
-retry_on_network = tenacity.retry(
-    stop=tenacity.stop_after_attempt(3),
-    wait=tenacity.wait_exponential(multiplier=0.5, min=1, max=8),
-    retry=tenacity.retry_if_exception_type((requests.exceptions.RequestException,)),
-    reraise=True,
-    before_sleep=tenacity.before_sleep_log(logging.getLogger("axiusmem.graphdb_adapter"), logging.WARNING)
+import httpx
+from axiusmem.adapters.base import (
+    AsyncBaseTriplestoreAdapter, BaseTriplestoreAdapter,
+    async_connection_limits, mount_connection_pool,
 )
+from axiusmem.adapters.bulk import (
+    DEFAULT_CHUNK_SIZE, DEFAULT_MAX_IN_FLIGHT, NTRIPLES_MEDIA_TYPE,
+    aiter_file_range, asend_chunks, aupload_file, iter_file_range, iter_ntriples_chunks,
+    send_chunks, upload_file, upload_headers,
+)
+from axiusmem.adapters.resilience import guarded
+from axiusmem.adapters.sparql_results import TSV_MEDIA_TYPE, aiter_tsv_bindings, iter_tsv_bindings
+
+
+def transaction_id(resp) -> str:
+    """
+    Transaction ID from the response to ``POST /repositories/{id}/transactions``.
+
+    RDF4J (and GraphDB) return the transaction URL in the ``Location`` header; older setups that
+    answer with a ``{"transactionId": ...}`` body are accepted too.
+    """
+    location = resp.headers.get("Location")
+    if location:
+        return location.rstrip("/").rsplit("/", 1)[-1]
+    return resp.json()["transactionId"]
 
 # AxiusMEM™ GraphDB Adapter
 class GraphDBAdapter(BaseTriplestoreAdapter):
@@ -26,15 +40,17 @@ class GraphDBAdapter(BaseTriplestoreAdapter):
         password (str, optional): Password for authentication.
         repository (str, optional): Repository name. If not provided, falls back to TRIPLESTORE_REPOSITORY env var.
         use_https (bool, optional): Use HTTPS for requests (default True).
+        pool_size (int, optional): Pooled HTTP connections kept alive (default TRIPLESTORE_POOL_SIZE env var or 10).
     """
-    def __init__(self, url, user=None, password=None, repository=None, use_https=True):
+    def __init__(self, url, user=None, password=None, repository=None, use_https=True, pool_size=None):
         import os
         self.url = url.rstrip('/')
         self.user = user
         self.password = password
         self.repository = repository or os.getenv("TRIPLESTORE_REPOSITORY")
         self.use_https = use_https
-        self.session = requests.Session()
+        self.pool_size = pool_size
+        self.session = mount_connection_pool(requests.Session(), pool_size)
         if user and password:
             self.session.auth = (user, password)
 
@@ -47,7 +63,7 @@ class GraphDBAdapter(BaseTriplestoreAdapter):
             self.session.close()
             self.session = None
 
-    @retry_on_network
+    @guarded("query")
     def sparql_select(self, query: str, **kwargs):
         repo_id = self.repository
         params = {"infer": str(kwargs.get("infer", True)).lower(), "timeout": kwargs.get("timeout", 60)}
@@ -62,7 +78,37 @@ class GraphDBAdapter(BaseTriplestoreAdapter):
         resp.raise_for_status()
         return resp.json().get("results", {}).get("bindings", [])
 
-    @retry_on_network
+    def sparql_select_iter(self, query: str, **kwargs):
+        """
+        Execute a SPARQL SELECT query, streaming the result as TSV and yielding SPARQL JSON
+        bindings as rows arrive, without buffering the response.
+        """
+        with self._open_select_stream(query, **kwargs) as resp:
+            resp.encoding = "utf-8"
+            yield from iter_tsv_bindings(resp.iter_content(chunk_size=65536, decode_unicode=True))
+
+    @guarded("query")
+    def _open_select_stream(self, query: str, **kwargs):
+        # Retried until the status is in; once rows are yielded, a failure is not retried
+        repo_id = self.repository
+        params = {"infer": str(kwargs.get("infer", True)).lower(), "timeout": kwargs.get("timeout", 60)}
+        headers = {"Accept": TSV_MEDIA_TYPE}
+        resp = self.session.post(
+            f"{self.url}/repositories/{repo_id}",
+            data={"query": query},
+            params=params,
+            headers=headers,
+            timeout=kwargs.get("timeout", 60),
+            stream=True,
+        )
+        try:
+            resp.raise_for_status()
+        except Exception:
+            resp.close()
+            raise
+        return resp
+
+    @guarded("update", idempotent=False)
     def sparql_update(self, update_query: str, **kwargs):
         repo_id = self.repository
         headers = {"Content-Type": "application/sparql-update"}
@@ -75,21 +121,44 @@ class GraphDBAdapter(BaseTriplestoreAdapter):
         resp.raise_for_status()
         return resp.status_code == 204
 
-    @retry_on_network
-    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle"):
-        repo_id = self.repository
-        with open(rdf_path, "rb") as f:
-            data = f.read()
-        headers = {"Content-Type": rdf_format}
+    def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle", compress=False, segment_size=None, progress=None):
+        """
+        Bulk load an RDF file, streamed from disk.
+
+        The file is sent with chunked transfer encoding, optionally gzip-compressed on the fly, in
+        one request by default. With a segment_size, N-Triples/N-Quads files are split at line
+        boundaries into segments of about that many bytes (e.g. ``DEFAULT_SEGMENT_SIZE``), each
+        POSTed on its own, so a failure only resends that segment. Blank node labels only name the
+        same node within one request, so files with blank nodes are refused when segmenting.
+
+        Args:
+            rdf_path (str): Path to the RDF file.
+            rdf_format (str): Media type of the file.
+            compress (bool): Send the body gzip-encoded.
+            segment_size (Optional[int]): Approximate bytes per request for line-based formats
+                (default: the whole file in one request).
+            progress (Optional[Callable[[int, int], None]]): Called after each segment with the
+                bytes uploaded so far and the file size.
+
+        Returns:
+            bool: True once every segment is loaded.
+
+        Raises:
+            ValueError: If a segment_size is given and the file contains blank nodes.
+        """
+        upload_file(lambda start, end: self._post_file_range(rdf_path, start, end, rdf_format, compress), rdf_path, rdf_format, segment_size, progress)
+        return True
+
+    @guarded("statements", idempotent=False)
+    def _post_file_range(self, rdf_path: str, start: int, end: int, rdf_format: str, compress: bool):
         resp = self.session.post(
-            f"{self.url}/repositories/{repo_id}/statements",
-            data=data,
-            headers=headers
+            f"{self.url}/repositories/{self.repository}/statements",
+            data=iter_file_range(rdf_path, start, end, compress),
+            headers=upload_headers(rdf_format, compress),
         )
         resp.raise_for_status()
         return resp.status_code == 204
 
-    @retry_on_network
     def test_connection(self):
         try:
             resp = self.session.get(f"{self.url}/rest/repositories")
@@ -99,61 +168,340 @@ class GraphDBAdapter(BaseTriplestoreAdapter):
             print(f"GraphDB connection failed: {e}")
             return False
 
-    @retry_on_network
+    @guarded("transactions", idempotent=False)
     def begin_transaction(self):
+        """
+        Open an RDF4J protocol transaction.
+
+        Returns:
+            str: The transaction ID, taken from the ``Location`` header of the response.
+        """
         repo_id = self.repository
         resp = self.session.post(f"{self.url}/repositories/{repo_id}/transactions")
         resp.raise_for_status()
-        return resp.json()["transactionId"]
+        return transaction_id(resp)
 
-    @retry_on_network
+    def _transaction_url(self, tx_id):
+        return f"{self.url}/repositories/{self.repository}/transactions/{tx_id}"
+
+    @guarded("transactions", idempotent=False)
     def commit_transaction(self, tx_id):
-        repo_id = self.repository
-        resp = self.session.put(f"{self.url}/repositories/{repo_id}/transactions/{tx_id}")
+        resp = self.session.put(self._transaction_url(tx_id), params={"action": "COMMIT"})
         resp.raise_for_status()
         return resp.status_code == 200
 
-    @retry_on_network
+    @guarded("transactions")
     def rollback_transaction(self, tx_id):
-        repo_id = self.repository
-        resp = self.session.delete(f"{self.url}/repositories/{repo_id}/transactions/{tx_id}")
+        resp = self.session.delete(self._transaction_url(tx_id))
         resp.raise_for_status()
-        return resp.status_code == 200
+        return resp.status_code in (200, 204)
+
+    def transaction_add(self, tx_id, triples, graph_uri=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Add triples inside an open transaction, streamed as N-Triples batches.
+
+        Each batch of chunk_size triples is one ``PUT .../transactions/{tx_id}?action=ADD``
+        request. Batches are sent one after another, since the server applies the operations of a
+        transaction in order, and each is retried on its own (re-adding a batch is harmless).
+        Nothing is visible to other clients until :meth:`commit_transaction`.
+
+        Args:
+            tx_id (str): Transaction ID from :meth:`begin_transaction`.
+            triples (Iterable): (s, p, o) triples of rdflib terms or plain values.
+            graph_uri (str, optional): Named graph (default graph if None).
+            chunk_size (int): Triples per request.
+
+        Returns:
+            bool: True once every batch is sent.
+        """
+        send_chunks(lambda body: self._put_transaction_data(tx_id, "ADD", body, graph_uri), iter_ntriples_chunks(triples, chunk_size), 1)
+        return True
+
+    def transaction_remove(self, tx_id, triples, graph_uri=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Remove triples inside an open transaction, as :meth:`transaction_add` with ``action=DELETE``."""
+        send_chunks(lambda body: self._put_transaction_data(tx_id, "DELETE", body, graph_uri), iter_ntriples_chunks(triples, chunk_size), 1)
+        return True
+
+    @guarded("transactions")
+    def _put_transaction_data(self, tx_id, action: str, body: bytes, graph_uri=None):
+        params = {"action": action}
+        if graph_uri:
+            params["context"] = f"<{graph_uri}>"
+        resp = self.session.put(self._transaction_url(tx_id), params=params, data=body, headers={"Content-Type": NTRIPLES_MEDIA_TYPE})
+        resp.raise_for_status()
+        return True
+
+    @guarded("transactions", idempotent=False)
+    def transaction_update(self, tx_id, update_query: str, **kwargs):
+        """
+        Execute a SPARQL UPDATE inside an open transaction (``action=UPDATE``).
+
+        Not retried: an update is not necessarily idempotent, so a failure is left to the caller,
+        typically rolling the transaction back.
+        """
+        resp = self.session.put(
+            self._transaction_url(tx_id),
+            params={"action": "UPDATE"},
+            data=update_query.encode("utf-8"),
+            headers={"Content-Type": "application/sparql-update"},
+            timeout=kwargs.get("timeout", 60),
+        )
+        resp.raise_for_status()
+        return True
 
-    @retry_on_network
     def list_named_graphs(self):
         query = "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } }"
         results = self.sparql_select(query)
         return [r['g']['value'] for r in results] if results else []
 
-    @retry_on_network
     def create_named_graph(self, graph_uri):
         return self.add_triples_to_named_graph(graph_uri, [])
 
-    @retry_on_network
     def delete_named_graph(self, graph_uri):
         update = f"DROP GRAPH <{graph_uri}>"
         return self.sparql_update(update)
 
-    @retry_on_network
     def clear_named_graph(self, graph_uri):
         update = f"CLEAR GRAPH <{graph_uri}>"
         return self.sparql_update(update)
 
-    @retry_on_network
-    def add_triples_to_named_graph(self, graph_uri, triples):
-        if not triples:
-            return True
-        triple_strs = []
-        for s, p, o in triples:
-            s_str = f"<{s}>" if not s.startswith("_") else s
-            p_str = f"<{p}>"
-            o_str = f'"{o}"' if not (str(o).startswith("http://") or str(o).startswith("https://")) else f"<{o}>"
-            triple_strs.append(f"{s_str} {p_str} {o_str} .")
-        update = f"INSERT DATA {{ GRAPH <{graph_uri}> {{ {' '.join(triple_strs)} }} }}"
-        return self.sparql_update(update)
+    def add_triples_to_named_graph(self, graph_uri, triples, chunk_size=DEFAULT_CHUNK_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """
+        Add triples to a named graph through the RDF4J statements endpoint.
+
+        The triples are serialized to N-Triples in chunks of chunk_size and POSTed to
+        ``/statements?context=<graph_uri>``, with up to max_in_flight chunks sent concurrently.
+        Each chunk is retried on its own; chunks already stored are kept if a later one fails.
+
+        Args:
+            graph_uri (str): The named graph.
+            triples (Iterable): (s, p, o) triples of rdflib terms or plain values
+                (see :func:`axiusmem.adapters.bulk.ntriples_term`).
+            chunk_size (int): Triples per request.
+            max_in_flight (int): Maximum concurrent requests.
+
+        Returns:
+            bool: True once every chunk is stored.
+        """
+        send_chunks(lambda body: self._post_statements(body, graph_uri), iter_ntriples_chunks(triples, chunk_size), max_in_flight)
+        return True
+
+    @guarded("statements", idempotent=False)
+    def _post_statements(self, body: bytes, graph_uri: str):
+        resp = self.session.post(
+            f"{self.url}/repositories/{self.repository}/statements",
+            params={"context": f"<{graph_uri}>"},
+            data=body,
+            headers={"Content-Type": NTRIPLES_MEDIA_TYPE},
+        )
+        resp.raise_for_status()
+        return resp.status_code == 204
 
-    @retry_on_network
     def get_triples_from_named_graph(self, graph_uri, query):
         wrapped_query = f"SELECT * WHERE {{ GRAPH <{graph_uri}> {{ {query} }} }}"
-        return self.sparql_select(wrapped_query) 
\ No newline at end of file
+        return self.sparql_select(wrapped_query) 
+
+
+class AsyncGraphDBAdapter(AsyncBaseTriplestoreAdapter):
+    """
+    Asyncio adapter for Ontotext GraphDB via its REST API, built on ``httpx.AsyncClient``.
+    Inherits from AsyncBaseTriplestoreAdapter; results match :class:`GraphDBAdapter`.
+
+    Args:
+        url (str): Base URL for GraphDB.
+        user (str, optional): Username for authentication.
+        password (str, optional): Password for authentication.
+        repository (str, optional): Repository name. If not provided, falls back to TRIPLESTORE_REPOSITORY env var.
+        use_https (bool, optional): Use HTTPS for requests (default True).
+        pool_size (int, optional): Keep-alive connections (default TRIPLESTORE_POOL_SIZE env var or 10).
+    """
+    def __init__(self, url, user=None, password=None, repository=None, use_https=True, pool_size=None):
+        self.url = url.rstrip('/')
+        self.user = user
+        self.password = password
+        self.repository = repository or os.getenv("TRIPLESTORE_REPOSITORY")
+        self.use_https = use_https
+        self.pool_size = pool_size
+        self.client = httpx.AsyncClient(
+            auth=(user, password) if user and password else None,
+            limits=async_connection_limits(pool_size),
+        )
+
+    async def connect(self):
+        return await self.test_connection()
+
+    async def close(self):
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    @guarded("query")
+    async def sparql_select(self, query: str, **kwargs):
+        repo_id = self.repository
+        params = {"infer": str(kwargs.get("infer", True)).lower(), "timeout": kwargs.get("timeout", 60)}
+        headers = {"Accept": "application/sparql-results+json"}
+        resp = await self.client.post(
+            f"{self.url}/repositories/{repo_id}",
+            data={"query": query},
+            params=params,
+            headers=headers,
+            timeout=kwargs.get("timeout", 60)
+        )
+        resp.raise_for_status()
+        return resp.json().get("results", {}).get("bindings", [])
+
+    async def sparql_select_iter(self, query: str, **kwargs):
+        """Async counterpart of :meth:`GraphDBAdapter.sparql_select_iter`."""
+        resp = await self._open_select_stream(query, **kwargs)
+        try:
+            async for binding in aiter_tsv_bindings(resp.aiter_text()):
+                yield binding
+        finally:
+            await resp.aclose()
+
+    @guarded("query")
+    async def _open_select_stream(self, query: str, **kwargs):
+        repo_id = self.repository
+        params = {"infer": str(kwargs.get("infer", True)).lower(), "timeout": kwargs.get("timeout", 60)}
+        headers = {"Accept": TSV_MEDIA_TYPE}
+        request = self.client.build_request(
+            "POST",
+            f"{self.url}/repositories/{repo_id}",
+            data={"query": query},
+            params=params,
+            headers=headers,
+            timeout=kwargs.get("timeout", 60),
+        )
+        resp = await self.client.send(request, stream=True)
+        try:
+            resp.raise_for_status()
+        except Exception:
+            await resp.aclose()
+            raise
+        return resp
+
+    @guarded("update", idempotent=False)
+    async def sparql_update(self, update_query: str, **kwargs):
+        repo_id = self.repository
+        headers = {"Content-Type": "application/sparql-update"}
+        resp = await self.client.post(
+            f"{self.url}/repositories/{repo_id}/statements",
+            content=update_query.encode("utf-8"),
+            headers=headers,
+            timeout=kwargs.get("timeout", 60)
+        )
+        resp.raise_for_status()
+        return resp.status_code == 204
+
+    async def bulk_load(self, rdf_path: str, rdf_format: str = "text/turtle", compress=False, segment_size=None, progress=None):
+        """Async counterpart of :meth:`GraphDBAdapter.bulk_load`."""
+        await aupload_file(lambda start, end: self._post_file_range(rdf_path, start, end, rdf_format, compress), rdf_path, rdf_format, segment_size, progress)
+        return True
+
+    @guarded("statements", idempotent=False)
+    async def _post_file_range(self, rdf_path: str, start: int, end: int, rdf_format: str, compress: bool):
+        resp = await self.client.post(
+            f"{self.url}/repositories/{self.repository}/statements",
+            content=aiter_file_range(rdf_path, start, end, compress),
+            headers=upload_headers(rdf_format, compress),
+        )
+        resp.raise_for_status()
+        return resp.status_code == 204
+
+    async def test_connection(self):
+        try:
+            resp = await self.client.get(f"{self.url}/rest/repositories")
+            resp.raise_for_status()
+            return True
+        except Exception as e:
+            logging.getLogger("axiusmem.graphdb_adapter").warning(f"GraphDB connection failed: {e}")
+            return False
+
+    @guarded("transactions", idempotent=False)
+    async def begin_transaction(self):
+        repo_id = self.repository
+        resp = await self.client.post(f"{self.url}/repositories/{repo_id}/transactions")
+        resp.raise_for_status()
+        return transaction_id(resp)
+
+    def _transaction_url(self, tx_id):
+        return f"{self.url}/repositories/{self.repository}/transactions/{tx_id}"
+
+    @guarded("transactions", idempotent=False)
+    async def commit_transaction(self, tx_id):
+        resp = await self.client.put(self._transaction_url(tx_id), params={"action": "COMMIT"})
+        resp.raise_for_status()
+        return resp.status_code == 200
+
+    @guarded("transactions")
+    async def rollback_transaction(self, tx_id):
+        resp = await self.client.delete(self._transaction_url(tx_id))
+        resp.raise_for_status()
+        return resp.status_code in (200, 204)
+
+    async def transaction_add(self, tx_id, triples, graph_uri=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Async counterpart of :meth:`GraphDBAdapter.transaction_add`."""
+        await asend_chunks(lambda body: self._put_transaction_data(tx_id, "ADD", body, graph_uri), iter_ntriples_chunks(triples, chunk_size), 1)
+        return True
+
+    async def transaction_remove(self, tx_id, triples, graph_uri=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Async counterpart of :meth:`GraphDBAdapter.transaction_remove`."""
+        await asend_chunks(lambda body: self._put_transaction_data(tx_id, "DELETE", body, graph_uri), iter_ntriples_chunks(triples, chunk_size), 1)
+        return True
+
+    @guarded("transactions")
+    async def _put_transaction_data(self, tx_id, action: str, body: bytes, graph_uri=None):
+        params = {"action": action}
+        if graph_uri:
+            params["context"] = f"<{graph_uri}>"
+        resp = await self.client.put(self._transaction_url(tx_id), params=params, content=body, headers={"Content-Type": NTRIPLES_MEDIA_TYPE})
+        resp.raise_for_status()
+        return True
+
+    @guarded("transactions", idempotent=False)
+    async def transaction_update(self, tx_id, update_query: str, **kwargs):
+        """Async counterpart of :meth:`GraphDBAdapter.transaction_update`."""
+        resp = await self.client.put(
+            self._transaction_url(tx_id),
+            params={"action": "UPDATE"},
+            content=update_query.encode("utf-8"),
+            headers={"Content-Type": "application/sparql-update"},
+            timeout=kwargs.get("timeout", 60),
+        )
+        resp.raise_for_status()
+        return True
+
+    async def list_named_graphs(self):
+        query = "SELECT DISTINCT ?g WHERE { GRAPH ?g { ?s ?p ?o } }"
+        results = await self.sparql_select(query)
+        return [r['g']['value'] for r in results] if results else []
+
+    async def create_named_graph(self, graph_uri):
+        return await self.add_triples_to_named_graph(graph_uri, [])
+
+    async def delete_named_graph(self, graph_uri):
+        return await self.sparql_update(f"DROP GRAPH <{graph_uri}>")
+
+    async def clear_named_graph(self, graph_uri):
+        return await self.sparql_update(f"CLEAR GRAPH <{graph_uri}>")
+
+    async def add_triples_to_named_graph(self, graph_uri, triples, chunk_size=DEFAULT_CHUNK_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """Async counterpart of :meth:`GraphDBAdapter.add_triples_to_named_graph`."""
+        await asend_chunks(lambda body: self._post_statements(body, graph_uri), iter_ntriples_chunks(triples, chunk_size), max_in_flight)
+        return True
+
+    @guarded("statements", idempotent=False)
+    async def _post_statements(self, body: bytes, graph_uri: str):
+        resp = await self.client.post(
+            f"{self.url}/repositories/{self.repository}/statements",
+            params={"context": f"<{graph_uri}>"},
+            content=body,
+            headers={"Content-Type": NTRIPLES_MEDIA_TYPE},
+        )
+        resp.raise_for_status()
+        return resp.status_code == 204
+
+    async def get_triples_from_named_graph(self, graph_uri, query):
+        wrapped_query = f"SELECT * WHERE {{ GRAPH <{graph_uri}> {{ {query} }} }}"
+        return await self.sparql_select(wrapped_query)
+
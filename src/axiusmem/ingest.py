@@ -0,0 +1,260 @@
+"""Streaming RDF file readers for bulk ingestion in AxiusMEM™."""
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from uuid import uuid4
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+import rdflib
+from rdflib.plugins.parsers.notation3 import BadSyntax, RDFSink, SinkParser
+from rdflib.plugins.parsers.nquads import NQuadsParser
+from rdflib.plugins.parsers.ntriples import ParseError, W3CNTriplesParser
+
+# rdflib format names (and media types) read line by line
+NTRIPLES_FORMATS = {"nt", "nt11", "ntriples", "n-triples", "application/n-triples"}
+NQUADS_FORMATS = {"nquads", "n-quads", "application/n-quads"}
+# rdflib format names (and media types) read in chunks of whole statements
+TURTLE_FORMATS = {"turtle", "ttl", "text/turtle"}
+
+# Bytes of N-Triples/N-Quads handed to a worker process at a time
+SEGMENT_SIZE = 1 << 23
+# Characters of Turtle text read per chunk
+TURTLE_CHUNK_SIZE = 1 << 20
+# Unparseable Turtle text is carried into the next chunk until it grows past this many characters
+_MAX_STATEMENT_SIZE = 1 << 26
+
+# Called with (triples read so far, bytes read so far)
+ProgressCallback = Callable[[int, int], None]
+
+
+class _Collector:
+    """Parser sink that accumulates triples; also stands in for the dataset an N-Quads parser writes to."""
+    def __init__(self):
+        self.triples: List[Tuple] = []
+
+    def add(self, triple) -> None:
+        self.triples.append(triple)
+
+    def triple(self, s, p, o) -> None:
+        self.triples.append((s, p, o))
+
+    def get_context(self, identifier):
+        return self
+
+    @property
+    def default_context(self):
+        return self
+
+    def take(self) -> List[Tuple]:
+        triples, self.triples = self.triples, []
+        return triples
+
+
+class _BNodeLabels(dict):
+    """
+    Blank node context for the line parsers that derives each blank node's id from its label.
+
+    Every segment of a file parsed with the same prefix maps a label to the same BNode, whichever
+    process parses it, and no label table has to be kept.
+    """
+    def __init__(self, prefix: str):
+        super().__init__()
+        self.prefix = prefix
+
+    def get(self, label, default=None):
+        return self.prefix + label
+
+
+def _line_parser(format: str, collector: _Collector):
+    parser = W3CNTriplesParser() if format in NTRIPLES_FORMATS else NQuadsParser()
+    parser.sink = collector
+    return parser
+
+
+def _line_batches(parser, collector: _Collector, stream, batch_size: int, bnode_context: _BNodeLabels) -> Iterator[List[Tuple]]:
+    parser.file = stream
+    parser.buffer = ""
+    parser.skolemize = False
+    while True:
+        parser.line = line = parser.readline()
+        if line is None:
+            break
+        try:
+            parser.parseline(bnode_context)
+        except ParseError as e:
+            raise ParseError(f"Invalid line ({e}): {line!r}") from None
+        if len(collector.triples) >= batch_size:
+            yield collector.take()
+    if collector.triples:
+        yield collector.take()
+
+
+def _segments(file_path: str, segment_size: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) byte ranges of about segment_size bytes that begin and end at line boundaries."""
+    size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + segment_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def _parse_segment(file_path: str, format: str, start: int, end: int, bnode_prefix: str) -> List[Tuple]:
+    """Parse the lines in a byte range of an N-Triples/N-Quads file (runs in a worker process)."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8-sig")
+    collector = _Collector()
+    parser = _line_parser(format, collector)
+    batches = list(_line_batches(parser, collector, io.StringIO(text), sys.maxsize, _BNodeLabels(bnode_prefix)))
+    return batches[0] if batches else []
+
+
+def _parallel_batches(file_path: str, format: str, batch_size: int, workers: int, segment_size: int) -> Iterator[Tuple[List[Tuple], int]]:
+    bnode_prefix = f"b{uuid4().hex}"
+    in_flight = deque()
+    buffer: List[Tuple] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            segments = _segments(file_path, segment_size)
+            while True:
+                # Keep up to two segments per worker queued; merge results in file order.
+                for start, end in islice(segments, 2 * workers - len(in_flight)):
+                    in_flight.append((pool.submit(_parse_segment, file_path, format, start, end, bnode_prefix), end))
+                if not in_flight:
+                    break
+                future, end = in_flight.popleft()
+                buffer.extend(future.result())
+                while len(buffer) >= batch_size:
+                    batch, buffer = buffer[:batch_size], buffer[batch_size:]
+                    yield batch, end
+                if buffer and not in_flight:
+                    yield buffer, end
+                    buffer = []
+        finally:
+            for future, _ in in_flight:
+                future.cancel()
+
+
+def _turtle_batches(file_path: str, stream, batch_size: int, chunk_size: int) -> Iterator[List[Tuple]]:
+    collector = _Collector()
+    parser = SinkParser(RDFSink(collector), baseURI=Path(file_path).absolute().as_uri(), turtle=True)
+    parser.startDoc()
+    carry = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            chunk += stream.readline()
+        final = not chunk
+        text = carry + chunk
+        carry = ""
+        i = 0
+        while True:
+            j = parser.skipSpace(text, i)
+            if j < 0:
+                break
+            mark = len(collector.triples)
+            try:
+                i = parser.directiveOrStatement(text, j)
+                if i < 0:
+                    parser.BadSyntax(text, j, "expected directive or statement")
+                # A statement cut off by the chunk boundary may still parse; only a terminating
+                # '.' or more input after it proves it complete.
+                complete = final or text[i - 1] == "." or parser.skipSpace(text, i) >= 0
+            except BadSyntax:
+                if final or len(text) - j > _MAX_STATEMENT_SIZE:
+                    raise
+                complete = False
+            if not complete:
+                del collector.triples[mark:]
+                carry = text[j:]
+                break
+            if len(collector.triples) >= batch_size:
+                yield collector.take()
+        if final:
+            break
+    parser.endDoc()
+    if collector.triples:
+        yield collector.take()
+
+
+def iter_triple_batches(
+    file_path: str,
+    format: str = "turtle",
+    batch_size: int = 10000,
+    progress: Optional[ProgressCallback] = None,
+    chunk_size: int = TURTLE_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    segment_size: int = SEGMENT_SIZE,
+) -> Iterator[List[Tuple]]:
+    """
+    Read an RDF file as a stream of fixed-size batches of triples.
+
+    N-Triples and N-Quads are parsed line by line and Turtle one chunk of whole statements at a
+    time, so memory use is bounded by the batch and chunk size rather than the file size (apart
+    from the Turtle parser's table of blank node labels). Graph names in N-Quads are dropped. Other
+    formats are parsed in full with rdflib and then batched.
+
+    With ``workers`` > 1, N-Triples and N-Quads files are split at line boundaries into segments of
+    about ``segment_size`` bytes that are parsed in a process pool; at most two segments per worker
+    are in flight, and batches are yielded in file order. Blank node labels map to the same nodes
+    in every segment.
+
+    Args:
+        file_path (str): Path to the RDF file.
+        format (str): RDF format ("turtle", "nt", "nquads", "xml", etc.).
+        batch_size (int): Maximum number of triples per batch.
+        progress (Optional[Callable[[int, int], None]]): Called after each batch with the number
+            of triples and bytes read so far.
+        chunk_size (int): Characters of Turtle read per chunk.
+        workers (Optional[int]): Number of parser processes for N-Triples/N-Quads (None or 1 parses
+            in this process).
+        segment_size (int): Bytes of N-Triples/N-Quads per worker task.
+
+    Yields:
+        List[Tuple]: Batches of (subject, predicate, object) triples, in file order.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+
+    Example:
+        >>> for batch in iter_triple_batches("dump.nt", format="nt", batch_size=50000, workers=8):
+        ...     graph.addN((s, p, o, graph) for s, p, o in batch)
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    line_format = format in NTRIPLES_FORMATS or format in NQUADS_FORMATS
+    if line_format and workers and workers > 1:
+        batches = _parallel_batches(file_path, format, batch_size, workers, segment_size)
+    else:
+        batches = _serial_batches(file_path, format, batch_size, chunk_size)
+    total = 0
+    for batch, position in batches:
+        total += len(batch)
+        yield batch
+        if progress:
+            progress(total, position)
+
+
+def _serial_batches(file_path: str, format: str, batch_size: int, chunk_size: int) -> Iterator[Tuple[List[Tuple], int]]:
+    with open(file_path, "rb") as raw:
+        if format in NTRIPLES_FORMATS or format in NQUADS_FORMATS:
+            collector = _Collector()
+            stream = open(raw.fileno(), encoding="utf-8-sig", closefd=False)
+            batches = _line_batches(_line_parser(format, collector), collector, stream, batch_size, _BNodeLabels(f"b{uuid4().hex}"))
+        elif format in TURTLE_FORMATS:
+            stream = open(raw.fileno(), encoding="utf-8-sig", closefd=False)
+            batches = _turtle_batches(file_path, stream, batch_size, chunk_size)
+        else:
+            graph = rdflib.Graph()
+            graph.parse(raw, format=format, publicID=Path(file_path).absolute().as_uri())
+            triples = iter(graph)
+            batches = iter(lambda: list(islice(triples, batch_size)), [])
+        for batch in batches:
+            yield batch, os.lseek(raw.fileno(), 0, os.SEEK_CUR)
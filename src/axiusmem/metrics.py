@@ -0,0 +1,252 @@
+"""
+Counters, gauges and latency histograms for the AxiusMEM™ API and triplestore adapters,
+rendered in the Prometheus text exposition format.
+
+Updates take no lock: each thread accumulates into its own shard, and shards are only summed
+when the metrics are collected. Threads that run on the asyncio event loop share one shard.
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow SPARQL queries
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), registry: Optional["MetricsRegistry"] = None):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            # Taken once per thread, never on the update path
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _snapshot(self) -> List[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # Copy each shard: its owning thread may add keys while we read it
+        return [dict(shard) for shard in shards]
+
+    def _labels(self, key: Tuple[str, ...], extra: Iterable[Tuple[str, str]] = ()) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(name suffix, formatted labels, value) for every series."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    Monotonic counter.
+
+    Example:
+        >>> errors = Counter("axiusmem_errors_total", "Errors.", ["kind"])
+        >>> errors.inc(kind="timeout")
+        >>> errors.value(kind="timeout")
+        1.0
+    """
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        """Totals per label values tuple."""
+        totals: Dict[Tuple[str, ...], float] = {}
+        for shard in self._snapshot():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def value(self, **labels) -> float:
+        return self.values().get(self._key(labels), 0.0)
+
+    def samples(self):
+        return [("", self._labels(key), value) for key, value in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """Value that goes up and down, such as requests in flight; the shards hold deltas."""
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track(self, **labels):
+        """Count the enclosed block as in flight."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values (e.g. latencies in seconds) over fixed buckets.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the buckets, ascending; +Inf is added.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), registry: Optional["MetricsRegistry"] = None,
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames, registry)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        shard = self._shard()
+        key = self._key(labels)
+        series = shard.get(key)
+        if series is None:
+            # Per-bucket counts, then sum and count
+            series = shard[key] = [0] * len(self.buckets) + [0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+                break
+        series[-2] += value
+        series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def totals(self) -> Dict[Tuple[str, ...], list]:
+        """Per label values tuple: non-cumulative bucket counts, then sum and count."""
+        totals: Dict[Tuple[str, ...], list] = {}
+        for shard in self._snapshot():
+            for key, series in shard.items():
+                series = list(series)
+                if key in totals:
+                    series = [a + b for a, b in zip(totals[key], series)]
+                totals[key] = series
+        return totals
+
+    def samples(self):
+        samples = []
+        for key, series in sorted(self.totals().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                samples.append(("_bucket", self._labels(key, [("le", _format(bound))]), cumulative))
+            samples.append(("_bucket", self._labels(key, [("le", "+Inf")]), series[-1]))
+            samples.append(("_sum", self._labels(key), series[-2]))
+            samples.append(("_count", self._labels(key), series[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """A set of metrics rendered together."""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        return "".join(format_metric(m.name, m.kind, m.help, m.samples()) for m in self._metrics.values())
+
+
+def format_metric(name: str, kind: str, help: str, samples: Iterable[Tuple[str, str, float]]) -> str:
+    """
+    Render one metric family in the Prometheus text format.
+
+    Args:
+        samples: (name suffix, formatted labels, value) tuples, e.g. ``("", '{repo="x"}', 3)``.
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{suffix}{labels} {_format(value)}" for suffix, labels, value in samples)
+    return "\n".join(lines) + "\n"
+
+
+def label_pairs(**labels) -> str:
+    """Format label pairs for :func:`format_metric`."""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}" if labels else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = Counter(
+    "axiusmem_http_requests_total", "API requests by route, method and status.", ["method", "path", "status"], REGISTRY)
+HTTP_LATENCY = Histogram(
+    "axiusmem_http_request_duration_seconds", "API request latency, until the last body byte is sent.", ["method", "path"], REGISTRY)
+HTTP_IN_FLIGHT = Gauge(
+    "axiusmem_http_requests_in_flight", "API requests being served.", ["method"], REGISTRY)
+HTTP_BYTES_IN = Counter(
+    "axiusmem_http_request_bytes_total", "API request body bytes received.", ["path"], REGISTRY)
+HTTP_BYTES_OUT = Counter(
+    "axiusmem_http_response_bytes_total", "API response body bytes sent.", ["path"], REGISTRY)
+ADAPTER_LATENCY = Histogram(
+    "axiusmem_triplestore_request_duration_seconds", "Triplestore adapter call latency, retries included.", ["adapter", "method"], REGISTRY)
+ADAPTER_IN_FLIGHT = Gauge(
+    "axiusmem_triplestore_requests_in_flight", "Triplestore adapter calls in progress.", ["adapter"], REGISTRY)
+ADAPTER_ERRORS = Counter(
+    "axiusmem_triplestore_errors_total", "Failed triplestore adapter calls by error type.", ["adapter", "method", "error"], REGISTRY)
+
+
+@contextmanager
+def adapter_call(adapter: str, method: str):
+    """Time a triplestore adapter call and count it as in flight; count its error if it raises."""
+    ADAPTER_IN_FLIGHT.inc(adapter=adapter)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        ADAPTER_ERRORS.inc(adapter=adapter, method=method, error=type(e).__name__)
+        raise
+    finally:
+        ADAPTER_LATENCY.observe(time.perf_counter() - start, adapter=adapter, method=method)
+        ADAPTER_IN_FLIGHT.dec(adapter=adapter)
@@ -1,5 +1,13 @@
 """Query engine for SPARQL construction and execution in AxiusMEM™."""
 import pandas as pd
+from typing import Optional, Tuple
+from rdflib import BNode, Literal, Variable
+from rdflib.namespace import RDF, XSD
+from rdflib.paths import Path
+from rdflib.plugins.sparql.algebra import translateAlgebra, translateQuery, traverse
+from rdflib.plugins.sparql.parser import parseQuery
+from rdflib.plugins.sparql.parserutils import CompValue
+from .temporal import AXM, DCTERMS, TimeValue, parse_timestamp
 
 def sparql_select(graph, query):
     """
@@ -51,4 +59,110 @@ def sparql_update(graph, query):
     Example:
         >>> sparql_update(graph, 'INSERT DATA { <http://example.org/Alice> <http://example.org/knows> <http://example.org/Bob> }')
     """
-    graph.update(query) 
\ No newline at end of file
+    graph.update(query)
+
+def _time_literal(value: TimeValue) -> str:
+    return Literal(parse_timestamp(value).isoformat(), datatype=XSD.dateTime).n3()
+
+def _as_datetime(var: str) -> str:
+    # Retype the lexical form, so plain string timestamps compare as xsd:dateTime too
+    return f"STRDT(STR({var}), <{XSD.dateTime}>)"
+
+def _interval_constraint(stmt: str, n: int, start_prop, end_prop, start: TimeValue, end: TimeValue) -> str:
+    """SPARQL group constraining statement variable stmt to an interval overlapping [start, end]."""
+    begin, finish = f"?__axm_b{n}", f"?__axm_e{n}"
+    return (
+        f"{stmt} <{start_prop}> {begin} . FILTER({_as_datetime(begin)} <= {_time_literal(end)}) "
+        f"FILTER NOT EXISTS {{ {stmt} <{end_prop}> {finish} FILTER({_as_datetime(finish)} < {_time_literal(start)}) }} "
+    )
+
+def rewrite_temporal_query(
+    query: str,
+    valid_time: Optional[TimeValue] = None,
+    as_of: Optional[TimeValue] = None,
+    valid_interval: Optional[Tuple[TimeValue, TimeValue]] = None,
+    transaction_interval: Optional[Tuple[TimeValue, TimeValue]] = None,
+) -> str:
+    """
+    Rewrite a SPARQL SELECT so it only matches triples valid/known at the given times.
+
+    Each triple pattern is replaced by a ``SELECT DISTINCT`` subquery over the reification pattern
+    (``rdf:subject``/``rdf:predicate``/``rdf:object``) with FILTERs on ``axm:validFrom``/``axm:validTo``
+    and/or ``dcterms:created``/``dcterms:modified``, mirroring the local temporal queries. The result
+    is a single query that a remote triplestore can evaluate server-side.
+
+    Timestamps are compared as ``xsd:dateTime`` built from their lexical form (``STRDT(STR(?t), xsd:dateTime)``),
+    so plain string literals such as ``"2024-01-01T00:00:00Z"`` match as well as typed ones. A value that
+    is not a valid ``xsd:dateTime`` (e.g. a date without a time) may not compare on remote stores.
+
+    Patterns inside FILTER EXISTS/NOT EXISTS are left unchanged, and property paths are not supported.
+
+    Args:
+        query (str): The SPARQL SELECT query.
+        valid_time (Optional[TimeValue]): Match triples valid at this time.
+        as_of (Optional[TimeValue]): Match triples known at this transaction time.
+        valid_interval (Optional[Tuple]): (start, end) valid time interval to overlap.
+        transaction_interval (Optional[Tuple]): (start, end) transaction time interval to overlap.
+
+    Returns:
+        str: The rewritten SPARQL query.
+
+    Raises:
+        ValueError: If no time is given, the query is not a SELECT, or it uses property paths.
+
+    Example:
+        >>> rewrite_temporal_query('SELECT ?o WHERE { <http://example.org/Alice> <http://example.org/knows> ?o }', valid_time="2024-06-01")
+    """
+    constraints = []
+    if valid_time is not None:
+        constraints.append((AXM.validFrom, AXM.validTo, valid_time, valid_time))
+    if valid_interval is not None:
+        constraints.append((AXM.validFrom, AXM.validTo, valid_interval[0], valid_interval[1]))
+    if as_of is not None:
+        constraints.append((DCTERMS.created, DCTERMS.modified, as_of, as_of))
+    if transaction_interval is not None:
+        constraints.append((DCTERMS.created, DCTERMS.modified, transaction_interval[0], transaction_interval[1]))
+    if not constraints:
+        raise ValueError("At least one of valid_time, as_of, valid_interval or transaction_interval is required.")
+    parsed = translateQuery(parseQuery(query))
+    if parsed.algebra.name != "SelectQuery":
+        raise ValueError("Only SPARQL SELECT queries can be rewritten.")
+    counter = [0]
+    bnode_vars = {}
+
+    def as_term(term):
+        if isinstance(term, BNode):
+            return bnode_vars.setdefault(term, Variable(f"__axm_bn{len(bnode_vars)}"))
+        return term
+
+    def reified(triple):
+        s, p, o = (as_term(t) for t in triple)
+        if isinstance(p, Path):
+            raise ValueError("Property paths are not supported by the temporal query rewriter.")
+        body = ""
+        for start_prop, end_prop, start, end in constraints:
+            n = counter[0]
+            counter[0] += 1
+            stmt = f"?__axm_st{n}"
+            body += (
+                f"{stmt} <{RDF.subject}> {s.n3()} ; <{RDF.predicate}> {p.n3()} ; <{RDF.object}> {o.n3()} . "
+                + _interval_constraint(stmt, n, start_prop, end_prop, start, end)
+            )
+        variables = [t for t in (s, p, o) if isinstance(t, Variable)]
+        if variables:
+            projection = " ".join(dict.fromkeys(v.n3() for v in variables))
+            sub = translateQuery(parseQuery(f"SELECT DISTINCT {projection} WHERE {{ {body} }}")).algebra
+            return CompValue("ToMultiSet", p=sub.p)
+        return translateQuery(parseQuery(f"SELECT * WHERE {{ FILTER EXISTS {{ {body} }} }}")).algebra.p.p
+
+    def rewrite_bgp(node):
+        if isinstance(node, CompValue) and node.name == "BGP" and node.triples:
+            parts = [reified(triple) for triple in node.triples]
+            joined = parts[0]
+            for part in parts[1:]:
+                joined = CompValue("Join", p1=joined, p2=part)
+            return joined
+        return None
+
+    traverse(parsed.algebra, visitPost=rewrite_bgp)
+    return translateAlgebra(parsed)
@@ -0,0 +1,266 @@
+"""Background job queue for long-running AxiusMEM™ API operations (bulk loads, graph operations, exports)."""
+import asyncio
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger("axiusmem.tasks")
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+FINISHED_STATES = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+class TaskCancelled(Exception):
+    """Raised by :meth:`Task.report` once the task has been cancelled, to stop the job at a safe point."""
+
+
+class TaskQueueFull(RuntimeError):
+    """Raised by :meth:`TaskManager.submit` when the maximum number of live tasks is reached."""
+
+
+class TaskNotCancellable(RuntimeError):
+    """Raised by :meth:`TaskManager.cancel` while the task runs a block that cannot be stopped part way."""
+
+
+class Task:
+    """
+    One background job: its state, progress, and result or error once finished.
+
+    Attributes:
+        id (str): Task ID.
+        name (str): Operation name, e.g. "bulk_load".
+        params (dict): Parameters the task was submitted with.
+        state (str): "queued", "running", "succeeded", "failed" or "cancelled".
+        done (float): Units of work done so far (bytes, triples...).
+        total (Optional[float]): Units of work in total, if known.
+        message (Optional[str]): Latest progress message.
+        result: Return value of the job once it succeeded.
+        error (Optional[str]): Error message if it failed.
+    """
+    def __init__(self, name: str, params: Optional[dict] = None):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.params = params or {}
+        self.state = QUEUED
+        self.done = 0
+        self.total = None
+        self.message = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_requested = False
+        self.interruptible = True
+        self._future: Optional[asyncio.Future] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def report(self, done: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        """
+        Record progress. May be called from a worker thread.
+
+        Raises:
+            TaskCancelled: If the task has been cancelled, so the job stops at its next report.
+        """
+        if self.cancel_requested:
+            raise TaskCancelled(self.id)
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+
+    @contextmanager
+    def uninterruptible(self):
+        """
+        Run a block that cannot be stopped part way, such as one blocking triplestore call.
+
+        Cancelling the task while the block runs is refused with :class:`TaskNotCancellable`,
+        rather than reporting the task cancelled while its work still completes.
+
+        Raises:
+            TaskCancelled: If the task was cancelled before the block started.
+        """
+        self.report(self.done)
+        self.interruptible = False
+        try:
+            yield
+        finally:
+            self.interruptible = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        progress = self.done / self.total if self.total else (1.0 if self.state == SUCCEEDED else None)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "params": self.params,
+            "state": self.state,
+            "progress": {"done": self.done, "total": self.total, "fraction": progress, "message": self.message},
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class TaskManager:
+    """
+    Runs background jobs on the event loop, at most workers at a time.
+
+    A job is a coroutine function taking its :class:`Task`, which it uses to report progress;
+    blocking work should be handed to a thread (e.g. ``run_in_threadpool``). Jobs wait in the
+    queue until a worker slot is free. Finished tasks are kept for retention seconds (and at
+    most max_retained of them) so clients can poll for their result.
+
+    Cancelling a task cancels its coroutine, and makes its next :meth:`Task.report` raise
+    :class:`TaskCancelled`, which also stops work running in a thread at its next progress report.
+    A task inside a :meth:`Task.uninterruptible` block cannot be cancelled until the block ends.
+
+    Args:
+        workers (int): Jobs running at once.
+        max_pending (int): Queued plus running jobs allowed; submitting more raises :class:`TaskQueueFull`.
+        retention (float): Seconds finished tasks are kept.
+        max_retained (int): Finished tasks kept at most; the oldest are dropped first.
+
+    Example:
+        >>> async def job(task):
+        ...     for i in range(10):
+        ...         task.report(i + 1, 10)
+        ...         await asyncio.sleep(1)
+        ...     return "done"
+        >>> task = manager.submit("count", job)
+        >>> manager.get(task.id).state
+        'running'
+    """
+    def __init__(self, workers: int = 2, max_pending: int = 100, retention: float = 3600.0, max_retained: int = 1000):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retention = retention
+        self.max_retained = max_retained
+        self._tasks: Dict[str, Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_env(cls) -> "TaskManager":
+        """
+        Build a task manager from the environment.
+
+        Reads:
+            AXIUSMEM_TASK_WORKERS: jobs running at once (default: 2)
+            AXIUSMEM_TASK_QUEUE: queued plus running jobs allowed (default: 100)
+            AXIUSMEM_TASK_RETENTION: seconds finished tasks are kept (default: 3600)
+        """
+        return cls(
+            workers=int(os.getenv("AXIUSMEM_TASK_WORKERS", 2)),
+            max_pending=int(os.getenv("AXIUSMEM_TASK_QUEUE", 100)),
+            retention=float(os.getenv("AXIUSMEM_TASK_RETENTION", 3600)),
+        )
+
+    def submit(self, name: str, job: Callable[[Task], Awaitable[Any]], **params) -> Task:
+        """
+        Queue a job. Must be called from the event loop.
+
+        Args:
+            name (str): Operation name.
+            job: Coroutine function called with the task.
+            **params: Parameters shown in the task listing.
+
+        Raises:
+            TaskQueueFull: If max_pending jobs are already queued or running.
+        """
+        self._prune()
+        if len(self.list()) >= self.max_pending:
+            raise TaskQueueFull(f"{self.max_pending} tasks are already queued or running")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        task = Task(name, params)
+        self._tasks[task.id] = task
+        task._future = asyncio.ensure_future(self._run(task, job))
+        task._future.add_done_callback(lambda future: self._never_started(task))
+        return task
+
+    @staticmethod
+    def _never_started(task: Task) -> None:
+        # A task cancelled before its coroutine first ran never reaches _run's handlers
+        if not task.finished:
+            task.state = CANCELLED
+            task.finished_at = time.time()
+
+    async def _run(self, task: Task, job):
+        try:
+            async with self._slots:
+                if task.cancel_requested:
+                    raise asyncio.CancelledError()
+                task.state = RUNNING
+                task.started_at = time.time()
+                task.result = await job(task)
+                task.state = SUCCEEDED
+        except (asyncio.CancelledError, TaskCancelled):
+            task.state = CANCELLED
+        except Exception as e:
+            logger.error(f"Task {task.id} ({task.name}) failed: {e}")
+            task.state = FAILED
+            task.error = str(e)
+        finally:
+            task.finished_at = time.time()
+
+    def get(self, task_id: str) -> Optional[Task]:
+        self._prune()
+        return self._tasks.get(task_id)
+
+    def list(self, include_finished: bool = False) -> List[Task]:
+        """Queued and running tasks (and retained finished ones if include_finished), oldest first."""
+        return [t for t in self._tasks.values() if include_finished or not t.finished]
+
+    def cancel(self, task_id: str) -> Optional[Task]:
+        """
+        Cancel a queued or running task; finished tasks are left as they are.
+
+        Returns:
+            Optional[Task]: The task, or None if there is no such task.
+
+        Raises:
+            TaskNotCancellable: If the task is running an uninterruptible block.
+        """
+        task = self._tasks.get(task_id)
+        if task is not None and not task.finished:
+            if not task.interruptible:
+                raise TaskNotCancellable(f"Task {task_id} is running an operation that cannot be interrupted")
+            task.cancel_requested = True
+            task._future.cancel()
+        return task
+
+    def counts(self) -> Dict[str, int]:
+        """Number of retained tasks per state."""
+        counts = {state: 0 for state in (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)}
+        for task in self._tasks.values():
+            counts[task.state] += 1
+        return counts
+
+    async def shutdown(self) -> None:
+        """Cancel all live tasks and wait for them to stop; uninterruptible ones are waited for."""
+        live = [task for task in self._tasks.values() if not task.finished]
+        for task in live:
+            try:
+                self.cancel(task.id)
+            except TaskNotCancellable:
+                pass
+        await asyncio.gather(*(task._future for task in live), return_exceptions=True)
+
+    def _prune(self) -> None:
+        now = time.time()
+        finished = [t for t in self._tasks.values() if t.finished]
+        expired = {t.id for t in finished if now - t.finished_at > self.retention}
+        overflow = len(finished) - len(expired) - self.max_retained
+        if overflow > 0:
+            kept = sorted((t for t in finished if t.id not in expired), key=lambda t: t.finished_at)
+            expired.update(t.id for t in kept[:overflow])
+        for task_id in expired:
+            del self._tasks[task_id]
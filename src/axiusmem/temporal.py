@@ -1,48 +1,211 @@
 """Temporal logic helpers for bi-temporal data model in AxiusMEM™."""
+from datetime import date, datetime, time as dt_time, timedelta, timezone
 from rdflib import URIRef, BNode, Literal, Graph
-from rdflib.namespace import RDF, Namespace
-from typing import Optional, Tuple
+from rdflib.namespace import RDF, XSD, Namespace
+from typing import Iterable, List, Optional, Tuple, Union
+from .temporal_index import TemporalIndex, TemporalView
 
 # Namespaces
 DCTERMS = Namespace("http://purl.org/dc/terms/")
 AXM = Namespace("http://axiusmem.org/ontology#")  # Custom for valid time
 
-def add_valid_time(graph: Graph, triple: Tuple, valid_from: str, valid_to: Optional[str] = None) -> BNode:
+# A timestamp given as an ISO 8601 string, a datetime/date, or an RDF literal holding one
+TimeValue = Union[str, datetime, date, Literal]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def parse_timestamp(value: TimeValue) -> datetime:
     """
-    Attach valid time interval to a triple using RDF reification and custom properties.
+    Normalize a timestamp to a timezone-aware UTC datetime.
+
+    Dates and date-only strings map to midnight; naive datetimes are taken to be UTC.
+
+    Args:
+        value (TimeValue): ISO 8601 string (e.g. "2024-01-01", "2024-01-01T10:00:00Z"),
+            datetime, date, or RDF literal.
+
+    Returns:
+        datetime: The timestamp in UTC.
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 date or datetime.
+
+    Example:
+        >>> parse_timestamp("2024-01-01")
+        datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+    """
+    if isinstance(value, Literal):
+        value = value.toPython()
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, date):
+        dt = datetime.combine(value, dt_time())
+    else:
+        text = str(value).strip()
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            raise ValueError(f"Invalid ISO 8601 timestamp: {value!r}") from None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+def to_epoch(value: TimeValue) -> int:
+    """
+    Convert a timestamp to integer microseconds since the Unix epoch (UTC).
+
+    Args:
+        value (TimeValue): Timestamp accepted by :func:`parse_timestamp`.
+
+    Returns:
+        int: Microseconds since 1970-01-01T00:00:00Z.
+    """
+    return (parse_timestamp(value) - _EPOCH) // _MICROSECOND
+
+def _datetime_literal(value: TimeValue) -> Literal:
+    """Return value as a normalized ``xsd:dateTime`` literal."""
+    return Literal(parse_timestamp(value).isoformat(), datatype=XSD.dateTime)
+
+def _literal_epoch(literal: Optional[Literal]) -> Optional[int]:
+    """Epoch of a stored temporal literal, or None if it is missing or not a valid timestamp."""
+    if literal is None or str(literal) == "":
+        return None
+    try:
+        return to_epoch(literal)
+    except (ValueError, TypeError):
+        return None
+
+# Attribute under which a graph's TemporalIndex is attached
+_INDEX_ATTR = "_axiusmem_temporal_index"
+
+def attach_temporal_index(graph: Graph, as_of_cache_size: int = 128) -> TemporalIndex:
+    """
+    Build a temporal index over the reified statements in a graph and attach it to the graph.
+
+    Once attached, the index is kept current by :func:`add_valid_time` and
+    :func:`add_transaction_time`, and the temporal query functions use it instead of scanning every
+    ``rdf:Statement``. Results of :func:`query_as_of` are cached per transaction time until the
+    next transaction time write. Call this again (or
+    :func:`invalidate_temporal_index`) after changing reified statements by other means, e.g.
+    parsing a file or running a SPARQL update.
 
     Args:
         graph (Graph): The RDF graph.
-        triple (Tuple): The (subject, predicate, object) triple.
-        valid_from (str): Start of valid time (ISO 8601 string).
-        valid_to (Optional[str]): End of valid time (ISO 8601 string), or None for open-ended.
+        as_of_cache_size (int): Maximum number of as-of snapshots cached (0 disables the cache).
 
     Returns:
-        BNode: The reification node for the triple.
+        TemporalIndex: The attached index.
 
     Example:
-        >>> add_valid_time(graph, (s, p, o), "2024-01-01", "2024-12-31")
+        >>> index = attach_temporal_index(graph)
     """
+    index = TemporalIndex(as_of_cache_size=as_of_cache_size)
+    for stmt in graph.subjects(RDF.type, RDF.Statement):
+        valid_from = _literal_epoch(graph.value(stmt, AXM.validFrom))
+        created = _literal_epoch(graph.value(stmt, DCTERMS.created))
+        if valid_from is None and created is None:
+            continue
+        triple = (graph.value(stmt, RDF.subject), graph.value(stmt, RDF.predicate), graph.value(stmt, RDF.object))
+        if valid_from is not None:
+            index.add_valid_time(stmt, triple, valid_from, _literal_epoch(graph.value(stmt, AXM.validTo)))
+        if created is not None:
+            index.add_transaction_time(stmt, triple, created, _literal_epoch(graph.value(stmt, DCTERMS.modified)))
+    setattr(graph, _INDEX_ATTR, index)
+    return index
+
+def get_temporal_index(graph: Graph) -> Optional[TemporalIndex]:
+    """
+    Return the temporal index attached to a graph, rebuilding it first if it was invalidated.
+
+    The rebuilt index keeps the settings (as-of cache size) the stale one was attached with.
+
+    Args:
+        graph (Graph): The RDF graph.
+
+    Returns:
+        Optional[TemporalIndex]: The index, or None if no index is attached.
+    """
+    index = getattr(graph, _INDEX_ATTR, None)
+    if index is not None and index.stale:
+        index = attach_temporal_index(graph, as_of_cache_size=index.as_of_cache.maxsize)
+    return index
+
+def invalidate_temporal_index(graph: Graph) -> None:
+    """
+    Mark a graph's temporal index (if any) as stale so it is rebuilt on next use.
+
+    Args:
+        graph (Graph): The RDF graph.
+    """
+    index = getattr(graph, _INDEX_ATTR, None)
+    if index is not None:
+        index.invalidate()
+
+def _add_statement(
+    graph: Graph,
+    triple: Tuple,
+    valid_from: Optional[TimeValue] = None,
+    valid_to: Optional[TimeValue] = None,
+    transaction_from: Optional[TimeValue] = None,
+    transaction_to: Optional[TimeValue] = None,
+) -> BNode:
+    """Reify a triple as one statement node carrying whichever time intervals are given."""
     s, p, o = triple
     stmt = BNode()
     graph.add((stmt, RDF.type, RDF.Statement))
     graph.add((stmt, RDF.subject, s))
     graph.add((stmt, RDF.predicate, p))
     graph.add((stmt, RDF.object, o))
-    graph.add((stmt, AXM.validFrom, Literal(valid_from)))
-    if valid_to:
-        graph.add((stmt, AXM.validTo, Literal(valid_to)))
+    if valid_from:
+        graph.add((stmt, AXM.validFrom, _datetime_literal(valid_from)))
+        if valid_to:
+            graph.add((stmt, AXM.validTo, _datetime_literal(valid_to)))
+    if transaction_from:
+        graph.add((stmt, DCTERMS.created, _datetime_literal(transaction_from)))
+        if transaction_to:
+            graph.add((stmt, DCTERMS.modified, _datetime_literal(transaction_to)))
+    index = getattr(graph, _INDEX_ATTR, None)
+    if index is not None:
+        if valid_from:
+            index.add_valid_time(stmt, triple, to_epoch(valid_from), to_epoch(valid_to) if valid_to else None)
+        if transaction_from:
+            index.add_transaction_time(stmt, triple, to_epoch(transaction_from), to_epoch(transaction_to) if transaction_to else None)
     return stmt
 
-def add_transaction_time(graph: Graph, triple: Tuple, transaction_from: str, transaction_to: Optional[str] = None) -> BNode:
+def add_valid_time(graph: Graph, triple: Tuple, valid_from: TimeValue, valid_to: Optional[TimeValue] = None) -> BNode:
+    """
+    Attach valid time interval to a triple using RDF reification and custom properties.
+
+    Timestamps are normalized to UTC ``xsd:dateTime`` literals.
+
+    Args:
+        graph (Graph): The RDF graph.
+        triple (Tuple): The (subject, predicate, object) triple.
+        valid_from (TimeValue): Start of valid time (ISO 8601 string or datetime).
+        valid_to (Optional[TimeValue]): End of valid time (ISO 8601 string or datetime), or None for open-ended.
+
+    Returns:
+        BNode: The reification node for the triple.
+
+    Example:
+        >>> add_valid_time(graph, (s, p, o), "2024-01-01", "2024-12-31")
+    """
+    return _add_statement(graph, triple, valid_from=valid_from, valid_to=valid_to)
+
+def add_transaction_time(graph: Graph, triple: Tuple, transaction_from: TimeValue, transaction_to: Optional[TimeValue] = None) -> BNode:
     """
     Attach transaction time interval to a triple using RDF reification and dcterms properties.
 
+    Timestamps are normalized to UTC ``xsd:dateTime`` literals.
+
     Args:
         graph (Graph): The RDF graph.
         triple (Tuple): The (subject, predicate, object) triple.
-        transaction_from (str): Start of transaction time (ISO 8601 string).
-        transaction_to (Optional[str]): End of transaction time (ISO 8601 string), or None for open-ended.
+        transaction_from (TimeValue): Start of transaction time (ISO 8601 string or datetime).
+        transaction_to (Optional[TimeValue]): End of transaction time (ISO 8601 string or datetime), or None for open-ended.
 
     Returns:
         BNode: The reification node for the triple.
@@ -50,109 +213,327 @@ def add_transaction_time(graph: Graph, triple: Tuple, transaction_from: str, tra
     Example:
         >>> add_transaction_time(graph, (s, p, o), "2024-01-01")
     """
-    s, p, o = triple
-    stmt = BNode()
-    graph.add((stmt, RDF.type, RDF.Statement))
-    graph.add((stmt, RDF.subject, s))
-    graph.add((stmt, RDF.predicate, p))
-    graph.add((stmt, RDF.object, o))
-    graph.add((stmt, DCTERMS.created, Literal(transaction_from)))
-    if transaction_to:
-        graph.add((stmt, DCTERMS.modified, Literal(transaction_to)))
-    return stmt
+    return _add_statement(graph, triple, transaction_from=transaction_from, transaction_to=transaction_to)
 
-def query_point_in_time(graph: Graph, time: str) -> Graph:
+def add_bitemporal(
+    graph: Graph,
+    triple: Tuple,
+    valid_from: TimeValue,
+    transaction_from: TimeValue,
+    valid_to: Optional[TimeValue] = None,
+    transaction_to: Optional[TimeValue] = None,
+) -> BNode:
     """
-    Return a subgraph of triples valid at a specific valid time.
+    Attach both valid time and transaction time to a triple using a single reification node.
+
+    The node carries ``axm:validFrom``/``axm:validTo`` and ``dcterms:created``/``dcterms:modified``
+    side by side, so a bitemporal fact costs one set of ``rdf:subject``/``rdf:predicate``/
+    ``rdf:object`` triples instead of two. Queries over either dimension read it exactly like the
+    nodes created by :func:`add_valid_time` and :func:`add_transaction_time`.
 
     Args:
         graph (Graph): The RDF graph.
-        time (str): The valid time (ISO 8601 string).
+        triple (Tuple): The (subject, predicate, object) triple.
+        valid_from (TimeValue): Start of valid time (ISO 8601 string or datetime).
+        transaction_from (TimeValue): Start of transaction time (ISO 8601 string or datetime).
+        valid_to (Optional[TimeValue]): End of valid time, or None for open-ended.
+        transaction_to (Optional[TimeValue]): End of transaction time, or None for open-ended.
 
     Returns:
-        Graph: Subgraph of triples valid at the given time.
+        BNode: The reification node for the triple.
+
+    Example:
+        >>> add_bitemporal(graph, (s, p, o), "2024-01-01", "2024-01-02T09:00:00Z")
+    """
+    return _add_statement(graph, triple, valid_from, valid_to, transaction_from, transaction_to)
+
+def close_transaction_time(graph: Graph, triple: Tuple, transaction_to: TimeValue) -> List[BNode]:
     """
+    End the open transaction time intervals of a triple by setting ``dcterms:modified``.
+
+    Every statement node of the triple that has a ``dcterms:created`` no later than
+    ``transaction_to`` and no ``dcterms:modified`` is closed at ``transaction_to``. With a temporal
+    index attached the nodes are found through its triple lookup; otherwise the statements about
+    the triple's subject are scanned.
+
+    Args:
+        graph (Graph): The RDF graph.
+        triple (Tuple): The (subject, predicate, object) triple.
+        transaction_to (TimeValue): End of transaction time (ISO 8601 string or datetime).
+
+    Returns:
+        List[BNode]: The statement nodes that were closed.
+
+    Example:
+        >>> close_transaction_time(graph, (s, p, o), "2024-06-01")
+    """
+    end = to_epoch(transaction_to)
+    index = get_temporal_index(graph)
+    if index is not None:
+        closed = [stmt for stmt in index.open_transactions(triple) if index.transaction_time.get(stmt)[0] <= end]
+    else:
+        s, p, o = triple
+        closed = []
+        for stmt in graph.subjects(RDF.subject, s):
+            if (stmt, RDF.predicate, p) not in graph or (stmt, RDF.object, o) not in graph:
+                continue
+            created = _literal_epoch(graph.value(stmt, DCTERMS.created))
+            if created is not None and created <= end and (stmt, DCTERMS.modified, None) not in graph:
+                closed.append(stmt)
+    literal = _datetime_literal(transaction_to)
+    for stmt in closed:
+        graph.add((stmt, DCTERMS.modified, literal))
+        if index is not None:
+            index.add_transaction_time(stmt, triple, index.transaction_time.get(stmt)[0], end)
+    return closed
+
+def add_temporal_triples(
+    graph: Graph,
+    triples: Iterable[Tuple],
+    valid_from: Optional[TimeValue] = None,
+    valid_to: Optional[TimeValue] = None,
+    transaction_from: Optional[TimeValue] = None,
+    transaction_to: Optional[TimeValue] = None,
+) -> List[BNode]:
+    """
+    Assert a batch of triples and reify each with the same valid and/or transaction time.
+
+    Bulk counterpart of calling ``graph.add`` and :func:`add_bitemporal` (or :func:`add_valid_time`
+    / :func:`add_transaction_time`) per triple. The time literals are built once for the whole
+    batch, the asserted and reification triples are streamed to the store in a single
+    ``Graph.addN`` call, and the attached temporal index is updated in one pass. Triples are only
+    reified when a start time is given.
+
+    Args:
+        graph (Graph): The RDF graph.
+        triples (Iterable[Tuple]): The (subject, predicate, object) triples.
+        valid_from (Optional[TimeValue]): Start of valid time (ISO 8601 string or datetime).
+        valid_to (Optional[TimeValue]): End of valid time, or None for open-ended.
+        transaction_from (Optional[TimeValue]): Start of transaction time (ISO 8601 string or datetime).
+        transaction_to (Optional[TimeValue]): End of transaction time, or None for open-ended.
+
+    Returns:
+        List[BNode]: The reification nodes, in triple order (empty if no times were given).
+
+    Example:
+        >>> add_temporal_triples(graph, triples, valid_from="2024-01-01", transaction_from="2024-01-02")
+    """
+    annotations = []
+    if valid_from:
+        annotations.append((AXM.validFrom, _datetime_literal(valid_from)))
+        if valid_to:
+            annotations.append((AXM.validTo, _datetime_literal(valid_to)))
+    if transaction_from:
+        annotations.append((DCTERMS.created, _datetime_literal(transaction_from)))
+        if transaction_to:
+            annotations.append((DCTERMS.modified, _datetime_literal(transaction_to)))
+    reified = []
+
+    def quads():
+        for triple in triples:
+            s, p, o = triple
+            yield s, p, o, graph
+            if annotations:
+                stmt = BNode()
+                reified.append((stmt, triple))
+                yield stmt, RDF.type, RDF.Statement, graph
+                yield stmt, RDF.subject, s, graph
+                yield stmt, RDF.predicate, p, graph
+                yield stmt, RDF.object, o, graph
+                for prop, literal in annotations:
+                    yield stmt, prop, literal, graph
+
+    graph.addN(quads())
+    index = getattr(graph, _INDEX_ATTR, None)
+    if index is not None and reified:
+        index.add_statements(
+            reified,
+            valid_time=(to_epoch(valid_from), to_epoch(valid_to) if valid_to else None) if valid_from else None,
+            transaction_time=(
+                (to_epoch(transaction_from), to_epoch(transaction_to) if transaction_to else None)
+                if transaction_from else None
+            ),
+        )
+    return [stmt for stmt, _ in reified]
+
+_REIFICATION_PROPERTIES = (RDF.type, RDF.subject, RDF.predicate, RDF.object)
+
+def compact_reification(graph: Graph) -> int:
+    """
+    Merge separate valid time and transaction time reification nodes of the same triple.
+
+    Graphs written before :func:`add_bitemporal` existed hold two statement nodes per bitemporal
+    fact, one from :func:`add_valid_time` and one from :func:`add_transaction_time`. For each
+    triple, this pairs its valid-time-only nodes with its transaction-time-only nodes (in time
+    order), moves the transaction time (and any other) properties onto the valid time node, and deletes the
+    redundant node. The intervals seen by each dimension are unchanged. The graph's temporal index,
+    if any, is updated in place: each redundant node is dropped from it and its transaction time
+    interval moved to the node kept.
+
+    Args:
+        graph (Graph): The RDF graph.
+
+    Returns:
+        int: Number of statement nodes removed.
+
+    Example:
+        >>> removed = compact_reification(graph)
+    """
+    index = getattr(graph, _INDEX_ATTR, None)
+    if index is not None and index.stale:
+        # Rebuilt from the graph on next use anyway
+        index = None
+    valid_only, transaction_only = {}, {}
+    for stmt in graph.subjects(RDF.type, RDF.Statement):
+        has_valid = (stmt, AXM.validFrom, None) in graph
+        has_transaction = (stmt, DCTERMS.created, None) in graph
+        if has_valid == has_transaction:
+            continue
+        triple = (graph.value(stmt, RDF.subject), graph.value(stmt, RDF.predicate), graph.value(stmt, RDF.object))
+        if has_valid:
+            valid_only.setdefault(triple, []).append((_literal_epoch(graph.value(stmt, AXM.validFrom)) or 0, stmt))
+        else:
+            transaction_only.setdefault(triple, []).append((_literal_epoch(graph.value(stmt, DCTERMS.created)) or 0, stmt))
+    removed = 0
+    for triple, valid_nodes in valid_only.items():
+        transaction_nodes = transaction_only.get(triple)
+        if not transaction_nodes:
+            continue
+        valid_nodes.sort(key=lambda item: item[0])
+        transaction_nodes.sort(key=lambda item: item[0])
+        for (_, keep), (_, drop) in zip(valid_nodes, transaction_nodes):
+            for prop, value in list(graph.predicate_objects(drop)):
+                if prop not in _REIFICATION_PROPERTIES:
+                    graph.add((keep, prop, value))
+            graph.remove((drop, None, None))
+            if index is not None:
+                interval = index.transaction_time.get(drop)
+                index.discard(drop)
+                if interval is not None:
+                    index.add_transaction_time(keep, triple, *interval)
+            removed += 1
+    return removed
+
+def temporal_view(graph: Graph, start: TimeValue, end: Optional[TimeValue] = None, dimension: str = "valid") -> Graph:
+    """
+    Return a read-only graph over the triples valid (or known) during [start, end], without copying.
+
+    Unlike the ``query_*`` functions, which build a new graph, the view filters triples through the
+    temporal index as they are requested, so querying it costs time proportional to the triples
+    the query touches. The view reflects later writes made through the temporal helpers. An index
+    is attached to the graph first if none is.
+
+    Args:
+        graph (Graph): The RDF graph.
+        start (TimeValue): Point in time, or interval start (ISO 8601 string or datetime).
+        end (Optional[TimeValue]): Interval end, or None for a point-in-time view.
+        dimension (str): "valid" for valid time or "transaction" for transaction time (as-of).
+
+    Returns:
+        Graph: Read-only graph backed by a :class:`~axiusmem.temporal_index.TemporalView`.
+
+    Example:
+        >>> view = temporal_view(graph, "2024-06-01")
+        >>> results = view.query("SELECT ?s WHERE { ?s ?p ?o }")
+    """
+    index = get_temporal_index(graph) or attach_temporal_index(graph)
+    start = to_epoch(start)
+    end = to_epoch(end) if end is not None else start
+    return Graph(store=TemporalView(graph, index, start, end, dimension=dimension))
+
+def _scan_statements(graph: Graph, start_prop: URIRef, end_prop: URIRef, start: int, end: int) -> Graph:
+    """Scan every reified statement for intervals over (start_prop, end_prop) overlapping [start, end]."""
     result = Graph()
     for stmt in graph.subjects(RDF.type, RDF.Statement):
-        valid_from = graph.value(stmt, AXM.validFrom)
-        valid_to = graph.value(stmt, AXM.validTo)
-        if valid_from and valid_from <= Literal(time):
-            if not valid_to or Literal(time) <= valid_to:
+        interval_start = _literal_epoch(graph.value(stmt, start_prop))
+        interval_end = _literal_epoch(graph.value(stmt, end_prop))
+        # Overlap if (interval_start <= end) and (interval_end is None or interval_end >= start)
+        if interval_start is not None and interval_start <= end:
+            if interval_end is None or interval_end >= start:
                 s = graph.value(stmt, RDF.subject)
                 p = graph.value(stmt, RDF.predicate)
                 o = graph.value(stmt, RDF.object)
                 result.add((s, p, o))
     return result
 
-def query_as_of(graph: Graph, transaction_time: str) -> Graph:
+def query_point_in_time(graph: Graph, time: TimeValue) -> Graph:
+    """
+    Return a subgraph of triples valid at a specific valid time.
+
+    Args:
+        graph (Graph): The RDF graph.
+        time (TimeValue): The valid time (ISO 8601 string or datetime).
+
+    Returns:
+        Graph: Subgraph of triples valid at the given time.
+    """
+    point = to_epoch(time)
+    index = get_temporal_index(graph)
+    if index is None:
+        return _scan_statements(graph, AXM.validFrom, AXM.validTo, point, point)
+    result = Graph()
+    for triple in index.valid_during(point, point):
+        result.add(triple)
+    return result
+
+def query_as_of(graph: Graph, transaction_time: TimeValue) -> Graph:
     """
     Return a subgraph of triples as known at a specific transaction time.
 
     Args:
         graph (Graph): The RDF graph.
-        transaction_time (str): The transaction time (ISO 8601 string).
+        transaction_time (TimeValue): The transaction time (ISO 8601 string or datetime).
 
     Returns:
         Graph: Subgraph of triples as known at the given transaction time.
     """
+    point = to_epoch(transaction_time)
+    index = get_temporal_index(graph)
+    if index is None:
+        return _scan_statements(graph, DCTERMS.created, DCTERMS.modified, point, point)
     result = Graph()
-    for stmt in graph.subjects(RDF.type, RDF.Statement):
-        created = graph.value(stmt, DCTERMS.created)
-        modified = graph.value(stmt, DCTERMS.modified)
-        if created and created <= Literal(transaction_time):
-            if not modified or Literal(transaction_time) <= modified:
-                s = graph.value(stmt, RDF.subject)
-                p = graph.value(stmt, RDF.predicate)
-                o = graph.value(stmt, RDF.object)
-                result.add((s, p, o))
+    for triple in index.known_as_of(point):
+        result.add(triple)
     return result
 
-def query_interval_valid_time(graph: Graph, start: str, end: str) -> Graph:
+def query_interval_valid_time(graph: Graph, start: TimeValue, end: TimeValue) -> Graph:
     """
     Return a subgraph of triples valid at any point during [start, end].
 
     Args:
         graph (Graph): The RDF graph.
-        start (str): Interval start (ISO 8601 string).
-        end (str): Interval end (ISO 8601 string).
+        start (TimeValue): Interval start (ISO 8601 string or datetime).
+        end (TimeValue): Interval end (ISO 8601 string or datetime).
 
     Returns:
         Graph: Subgraph of triples valid at any point during the interval.
     """
+    start, end = to_epoch(start), to_epoch(end)
+    index = get_temporal_index(graph)
+    if index is None:
+        return _scan_statements(graph, AXM.validFrom, AXM.validTo, start, end)
     result = Graph()
-    for stmt in graph.subjects(RDF.type, RDF.Statement):
-        valid_from = graph.value(stmt, AXM.validFrom)
-        valid_to = graph.value(stmt, AXM.validTo)
-        # Overlap if (valid_from <= end) and (valid_to is None or valid_to >= start)
-        if valid_from and valid_from <= Literal(end):
-            if not valid_to or valid_to >= Literal(start):
-                s = graph.value(stmt, RDF.subject)
-                p = graph.value(stmt, RDF.predicate)
-                o = graph.value(stmt, RDF.object)
-                result.add((s, p, o))
+    for triple in index.valid_during(start, end):
+        result.add(triple)
     return result
 
-def query_interval_transaction_time(graph: Graph, start: str, end: str) -> Graph:
+def query_interval_transaction_time(graph: Graph, start: TimeValue, end: TimeValue) -> Graph:
     """
     Return a subgraph of triples known at any point during [start, end].
 
     Args:
         graph (Graph): The RDF graph.
-        start (str): Interval start (ISO 8601 string).
-        end (str): Interval end (ISO 8601 string).
+        start (TimeValue): Interval start (ISO 8601 string or datetime).
+        end (TimeValue): Interval end (ISO 8601 string or datetime).
 
     Returns:
         Graph: Subgraph of triples known at any point during the interval.
     """
+    start, end = to_epoch(start), to_epoch(end)
+    index = get_temporal_index(graph)
+    if index is None:
+        return _scan_statements(graph, DCTERMS.created, DCTERMS.modified, start, end)
     result = Graph()
-    for stmt in graph.subjects(RDF.type, RDF.Statement):
-        created = graph.value(stmt, DCTERMS.created)
-        modified = graph.value(stmt, DCTERMS.modified)
-        # Overlap if (created <= end) and (modified is None or modified >= start)
-        if created and created <= Literal(end):
-            if not modified or modified >= Literal(start):
-                s = graph.value(stmt, RDF.subject)
-                p = graph.value(stmt, RDF.predicate)
-                o = graph.value(stmt, RDF.object)
-                result.add((s, p, o))
-    return result 
\ No newline at end of file
+    for triple in index.known_during(start, end):
+        result.add(triple)
+    return result
@@ -0,0 +1,355 @@
+"""In-memory indexes over reified temporal statements in AxiusMEM™."""
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+from rdflib.graph import ModificationException
+from rdflib.namespace import RDF
+from rdflib.store import Store
+from .utils import LRUCache
+
+# Pending inserts/removals are folded into the tree once they exceed this many
+# entries, or 1/32 of the indexed intervals, whichever is larger.
+_MIN_REBUILD_THRESHOLD = 256
+
+
+class _Node:
+    """A node of a centered interval tree."""
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start  # [(start, key)] sorted by start ascending
+        self.by_end = by_end      # [(end, key)] sorted by end descending, open ends first
+        self.left = left
+        self.right = right
+
+
+def _end_sort_key(item):
+    end = item[0]
+    return (end is None, end)
+
+
+def _build_tree(items: List[Tuple[Any, Any, Hashable]]) -> Optional[_Node]:
+    """Build a centered interval tree from a list of (start, end, key) tuples."""
+    if not items:
+        return None
+    endpoints = sorted([start for start, _, _ in items] + [end for _, end, _ in items if end is not None])
+    center = endpoints[len(endpoints) // 2]
+    here, left, right = [], [], []
+    for item in items:
+        start, end, _ = item
+        if end is not None and end < center:
+            left.append(item)
+        elif start > center:
+            right.append(item)
+        else:
+            here.append(item)
+    by_start = sorted(((start, key) for start, _, key in here), key=lambda i: i[0])
+    by_end = sorted(((end, key) for _, end, key in here), key=_end_sort_key, reverse=True)
+    return _Node(center, by_start, by_end, _build_tree(left), _build_tree(right))
+
+
+class IntervalIndex:
+    """
+    Index of closed intervals ``[start, end]`` answering stabbing and overlap queries in O(log n + k).
+
+    Intervals are keyed by a hashable key (e.g. a reification node); an ``end`` of None means the
+    interval is open-ended. Bounds may be of any mutually comparable type.
+
+    The index is a centered interval tree built over a snapshot of the intervals. Inserts made since
+    the last build are kept in a pending table and removals are tombstoned, so writes are O(1); the
+    tree is rebuilt lazily on the next query once the pending changes grow past a fraction of the
+    index size.
+
+    Example:
+        >>> index = IntervalIndex()
+        >>> index.add("a", "2024-01-01", "2024-12-31")
+        >>> list(index.stab("2024-06-01"))
+        ['a']
+    """
+    def __init__(self):
+        self._intervals: Dict[Hashable, Tuple[Any, Any]] = {}
+        self._pending: Dict[Hashable, Tuple[Any, Any]] = {}
+        self._removed = set()
+        self._tree: Optional[_Node] = None
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __contains__(self, key) -> bool:
+        return key in self._intervals
+
+    def get(self, key) -> Optional[Tuple[Any, Any]]:
+        """Return the (start, end) interval stored for key, or None."""
+        return self._intervals.get(key)
+
+    def add(self, key, start, end=None) -> None:
+        """
+        Index the interval ``[start, end]`` under key, replacing any interval already stored for it.
+
+        Args:
+            key (Hashable): Identifier for the interval.
+            start: Interval start.
+            end: Interval end, or None for open-ended.
+        """
+        if key in self._intervals:
+            self.remove(key)
+        self._intervals[key] = (start, end)
+        self._pending[key] = (start, end)
+
+    def remove(self, key) -> None:
+        """Remove the interval stored under key (no-op if absent)."""
+        if self._intervals.pop(key, None) is None:
+            return
+        if self._pending.pop(key, None) is None:
+            self._removed.add(key)
+
+    def clear(self) -> None:
+        """Remove all intervals."""
+        self._intervals.clear()
+        self._pending.clear()
+        self._removed.clear()
+        self._tree = None
+
+    def stab(self, point) -> Iterator[Hashable]:
+        """Yield the keys of all intervals containing point."""
+        return self.overlap(point, point)
+
+    def overlap(self, start, end) -> Iterator[Hashable]:
+        """Yield the keys of all intervals overlapping ``[start, end]``."""
+        self._maybe_rebuild()
+        removed = self._removed
+        stack = [self._tree]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if end < node.center:
+                for s, key in node.by_start:
+                    if s > end:
+                        break
+                    if key not in removed:
+                        yield key
+                stack.append(node.left)
+            elif start > node.center:
+                for e, key in node.by_end:
+                    if e is not None and e < start:
+                        break
+                    if key not in removed:
+                        yield key
+                stack.append(node.right)
+            else:
+                for _, key in node.by_start:
+                    if key not in removed:
+                        yield key
+                stack.append(node.left)
+                stack.append(node.right)
+        for key, (s, e) in list(self._pending.items()):
+            if s <= end and (e is None or e >= start):
+                yield key
+
+    def _maybe_rebuild(self) -> None:
+        threshold = max(_MIN_REBUILD_THRESHOLD, len(self._intervals) // 32)
+        if self._tree is None and self._pending or len(self._pending) + len(self._removed) > threshold:
+            self._tree = _build_tree([(s, e, key) for key, (s, e) in self._intervals.items()])
+            self._pending.clear()
+            self._removed.clear()
+
+
+class TemporalIndex:
+    """
+    Index of the reified temporal statements in a graph, keyed by statement node.
+
+    Maps each statement node to its (subject, predicate, object) triple and back, and keeps one
+    :class:`IntervalIndex` over ``axm:validFrom``/``axm:validTo`` and one over
+    ``dcterms:created``/``dcterms:modified``. The triples known as of a transaction time are
+    cached in a bounded LRU cache that is cleared whenever transaction time data changes.
+    The temporal helpers in :mod:`axiusmem.temporal` keep it current; see
+    :func:`axiusmem.temporal.attach_temporal_index`.
+
+    Args:
+        as_of_cache_size (int): Maximum number of as-of snapshots cached (0 disables the cache).
+    """
+    def __init__(self, as_of_cache_size: int = 128):
+        self.statements: Dict[Hashable, Tuple] = {}
+        self.by_triple: Dict[Tuple, Set[Hashable]] = {}
+        self.valid_time = IntervalIndex()
+        self.transaction_time = IntervalIndex()
+        self.as_of_cache = LRUCache(as_of_cache_size)
+        self.stale = False
+
+    def _register(self, stmt, triple: Tuple) -> None:
+        triple = tuple(triple)
+        self.statements[stmt] = triple
+        self.by_triple.setdefault(triple, set()).add(stmt)
+
+    def add_valid_time(self, stmt, triple: Tuple, valid_from, valid_to=None) -> None:
+        """Index the valid time interval of a statement node."""
+        self._register(stmt, triple)
+        self.valid_time.add(stmt, valid_from, valid_to)
+
+    def add_transaction_time(self, stmt, triple: Tuple, transaction_from, transaction_to=None) -> None:
+        """Index the transaction time interval of a statement node."""
+        self._register(stmt, triple)
+        self.transaction_time.add(stmt, transaction_from, transaction_to)
+        self.as_of_cache.clear()
+
+    def add_statements(self, statements, valid_time: Optional[Tuple] = None, transaction_time: Optional[Tuple] = None) -> None:
+        """
+        Index many statement nodes sharing the same intervals.
+
+        Args:
+            statements (Iterable[Tuple]): (statement node, triple) pairs.
+            valid_time (Optional[Tuple]): (start, end) valid time interval, or None.
+            transaction_time (Optional[Tuple]): (start, end) transaction time interval, or None.
+        """
+        register = self._register
+        for stmt, triple in statements:
+            register(stmt, triple)
+            if valid_time is not None:
+                self.valid_time.add(stmt, *valid_time)
+            if transaction_time is not None:
+                self.transaction_time.add(stmt, *transaction_time)
+        if transaction_time is not None:
+            self.as_of_cache.clear()
+
+    def statements_for(self, triple: Tuple) -> Set[Hashable]:
+        """Return the statement nodes reifying a triple."""
+        return set(self.by_triple.get(tuple(triple), ()))
+
+    def open_transactions(self, triple: Tuple) -> List[Hashable]:
+        """Return the statement nodes of a triple whose transaction time interval is still open."""
+        intervals = self.transaction_time
+        return [
+            stmt for stmt in self.by_triple.get(tuple(triple), ())
+            if stmt in intervals and intervals.get(stmt)[1] is None
+        ]
+
+    def discard(self, stmt) -> None:
+        """Drop a statement node from the index."""
+        triple = self.statements.pop(stmt, None)
+        if triple is not None:
+            stmts = self.by_triple.get(triple)
+            stmts.discard(stmt)
+            if not stmts:
+                del self.by_triple[triple]
+        self.valid_time.remove(stmt)
+        if stmt in self.transaction_time:
+            self.transaction_time.remove(stmt)
+            self.as_of_cache.clear()
+
+    def invalidate(self) -> None:
+        """Mark the index as out of date with its graph; it is rebuilt on next use."""
+        self.stale = True
+        self.as_of_cache.clear()
+
+    def valid_during(self, start, end) -> Iterator[Tuple]:
+        """Yield the triples of statements whose valid time overlaps ``[start, end]``."""
+        statements = self.statements
+        for stmt in self.valid_time.overlap(start, end):
+            yield statements[stmt]
+
+    def known_during(self, start, end) -> Iterator[Tuple]:
+        """Yield the triples of statements whose transaction time overlaps ``[start, end]``."""
+        statements = self.statements
+        for stmt in self.transaction_time.overlap(start, end):
+            yield statements[stmt]
+
+    def known_as_of(self, transaction_time) -> Tuple[Tuple, ...]:
+        """Return the distinct triples known at a transaction time, serving repeats from the cache."""
+        triples = self.as_of_cache.get(transaction_time)
+        if triples is None:
+            triples = tuple(set(self.known_during(transaction_time, transaction_time)))
+            self.as_of_cache.put(transaction_time, triples)
+        return triples
+
+
+class TemporalView(Store):
+    """
+    Read-only rdflib store exposing the temporal statements of a graph that fall in a time interval.
+
+    Nothing is copied: each triple pattern is answered on demand by looking up candidate statement
+    nodes through the base graph's ``rdf:subject``/``rdf:object``/``rdf:predicate`` triples (or
+    through the interval index for fully unbound patterns) and filtering them by the interval, so
+    SPARQL evaluation only pays for the triples it touches. Wrap it in an ``rdflib.Graph``; see
+    :func:`axiusmem.temporal.temporal_view`.
+
+    Args:
+        graph (Graph): The base RDF graph holding the reified statements.
+        index (TemporalIndex): The temporal index attached to the base graph.
+        start (int): Interval start as an integer epoch.
+        end (int): Interval end as an integer epoch.
+        dimension (str): "valid" for valid time or "transaction" for transaction time.
+    """
+    def __init__(self, graph, index: TemporalIndex, start: int, end: int, dimension: str = "valid"):
+        super().__init__()
+        if dimension not in ("valid", "transaction"):
+            raise ValueError(f"Unknown temporal dimension: {dimension}")
+        self.graph = graph
+        self.index = index
+        self.intervals = index.valid_time if dimension == "valid" else index.transaction_time
+        self.start = start
+        self.end = end
+        self._namespaces: Dict[str, Any] = {}
+
+    def _in_interval(self, stmt) -> bool:
+        interval = self.intervals.get(stmt)
+        return interval is not None and interval[0] <= self.end and (interval[1] is None or interval[1] >= self.start)
+
+    def _matching(self, pattern) -> Iterator[Tuple]:
+        s, p, o = pattern
+        statements = self.index.statements
+        if s is None and p is None and o is None:
+            for stmt in self.intervals.overlap(self.start, self.end):
+                yield statements[stmt]
+            return
+        if s is not None:
+            candidates = self.graph.subjects(RDF.subject, s)
+        elif o is not None:
+            candidates = self.graph.subjects(RDF.object, o)
+        else:
+            candidates = self.graph.subjects(RDF.predicate, p)
+        for stmt in candidates:
+            triple = statements.get(stmt)
+            if triple is None or not self._in_interval(stmt):
+                continue
+            if (s is None or triple[0] == s) and (p is None or triple[1] == p) and (o is None or triple[2] == o):
+                yield triple
+
+    def triples(self, triple_pattern, context=None):
+        seen = set()
+        for triple in self._matching(triple_pattern):
+            if triple not in seen:
+                seen.add(triple)
+                yield triple, iter(())
+
+    def __len__(self, context=None) -> int:
+        return sum(1 for _ in self.triples((None, None, None)))
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def add(self, triple, context=None, quoted=False):
+        raise ModificationException()
+
+    def addN(self, quads):
+        raise ModificationException()
+
+    def remove(self, triple, context=None):
+        raise ModificationException()
+
+    def bind(self, prefix, namespace, override=True):
+        self._namespaces[prefix] = namespace
+
+    def namespace(self, prefix):
+        return self._namespaces.get(prefix) or self.graph.store.namespace(prefix)
+
+    def prefix(self, namespace):
+        for prefix, ns in self._namespaces.items():
+            if ns == namespace:
+                return prefix
+        return self.graph.store.prefix(namespace)
+
+    def namespaces(self):
+        yield from self._namespaces.items()
+        for prefix, ns in self.graph.store.namespaces():
+            if prefix not in self._namespaces:
+                yield prefix, ns
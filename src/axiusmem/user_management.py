@@ -1,14 +1,185 @@
+import asyncio
+import os
+import time
 import rdflib
 from rdflib import URIRef, Literal, Namespace, RDF
 import bcrypt
 import uuid
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock, RLock
+from typing import Dict, List, Optional, Set, Tuple
 
 AXM = Namespace("https://axius.info/axiusmem/")  # AxiusMEM™ namespace
 
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt (slow by design)."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+
+def verify_password(password: str, pw_hash: str) -> bool:
+    """Check a password against a bcrypt hash (slow by design)."""
+    return bcrypt.checkpw(password.encode(), pw_hash.encode())
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification in a dedicated, bounded process pool.
+
+    bcrypt takes hundreds of milliseconds per call on purpose; running it on the event loop or the
+    request threadpool lets a burst of logins hold up every other request. The pool is started on
+    first use, and at most max_pending calls may be queued or running: beyond that,
+    :class:`PasswordHasherBusy` is raised at once instead of queueing more work.
+
+    Args:
+        workers (int): Worker processes; 0 hashes in a thread of the default executor instead.
+        max_pending (int): Calls allowed in the pool at once (running or queued).
+
+    Example:
+        >>> hasher = PasswordHasher(workers=2)
+        >>> pw_hash = await hasher.hash("secret")
+        >>> await hasher.verify("secret", pw_hash)
+        True
+    """
+    def __init__(self, workers: int = 2, max_pending: int = 32):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._pool = None
+        self._lock = Lock()
+
+    @classmethod
+    def from_env(cls) -> "PasswordHasher":
+        """
+        Build a hasher from the environment.
+
+        Reads:
+            AXIUSMEM_HASH_WORKERS: worker processes (default: 2, capped at the CPU count; 0 for no pool)
+            AXIUSMEM_HASH_QUEUE: calls allowed in the pool at once (default: 32)
+        """
+        workers = int(os.getenv("AXIUSMEM_HASH_WORKERS", min(2, os.cpu_count() or 1)))
+        return cls(workers=workers, max_pending=int(os.getenv("AXIUSMEM_HASH_QUEUE", 32)))
+
+    async def _run(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy("Too many password hashing requests in progress")
+            self.pending += 1
+            if self._pool is None and self.workers > 0:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            pool = self._pool
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, pw_hash: Optional[str]) -> bool:
+        """Check a password; False without hashing if there is no stored hash."""
+        if not pw_hash:
+            return False
+        return await self._run(verify_password, password, pw_hash)
+
+    def close(self):
+        """Shut the worker processes down."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+class LoginThrottle:
+    """
+    Per-user limit on login attempts: at most max_attempts per window seconds.
+
+    Checked before any password hashing, so a flood of logins for one account is refused cheaply
+    instead of occupying the hashing pool. Successful and failed attempts both count.
+
+    Args:
+        max_attempts (int): Attempts allowed per user and window; 0 disables throttling.
+        window (float): Window length in seconds.
+    """
+    def __init__(self, max_attempts: int = 10, window: float = 60.0):
+        self.max_attempts = max_attempts
+        self.window = window
+        self.throttled = 0
+        self._attempts: Dict[str, Tuple[float, int]] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def from_env(cls) -> "LoginThrottle":
+        """
+        Build a throttle from the environment.
+
+        Reads:
+            AXIUSMEM_LOGIN_ATTEMPTS: attempts allowed per user and window (default: 10; 0 disables)
+            AXIUSMEM_LOGIN_WINDOW: window length in seconds (default: 60)
+        """
+        return cls(int(os.getenv("AXIUSMEM_LOGIN_ATTEMPTS", 10)), float(os.getenv("AXIUSMEM_LOGIN_WINDOW", 60)))
+
+    def attempt(self, username: str) -> float:
+        """
+        Record a login attempt.
+
+        Returns:
+            float: 0 if the attempt may proceed, otherwise the seconds until the user's window resets.
+        """
+        if self.max_attempts <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            start, count = self._attempts.get(username, (now, 0))
+            if now - start >= self.window:
+                start, count = now, 0
+            if count >= self.max_attempts:
+                self.throttled += 1
+                return start + self.window - now
+            self._attempts[username] = (start, count + 1)
+            if len(self._attempts) > 10000:
+                # Forget users whose window has passed, so unknown usernames cannot grow the table forever
+                self._attempts = {u: a for u, a in self._attempts.items() if now - a[0] < self.window}
+            return 0.0
+
 class UserManager:
+    """
+    Users, password hashes and roles stored in an RDF graph.
+
+    Users and their roles are also kept in an in-memory index, loaded from the graph on creation
+    and updated by ``create_user``, ``assign_role`` and ``delete_user``, so that ``has_user``,
+    ``get_user_roles`` and ``is_admin`` are dict lookups instead of graph walks. Call
+    :meth:`reload_index` after changing users in the graph directly.
+
+    Args:
+        graph (rdflib.Graph): The graph holding the users.
+    """
     def __init__(self, graph: rdflib.Graph):
         self.graph = graph
+        self._lock = RLock()
+        self._users: Dict[str, None] = {}
+        self._roles: Dict[str, Set[str]] = {}
+        self.reload_index()
+
+    def reload_index(self):
+        """Rebuild the user/role index from the graph."""
+        with self._lock:
+            self._users = {self._name(u): None for u in self.graph.subjects(RDF.type, AXM.User)}
+            roles = {}
+            for user_uri, role_uri in self.graph.subject_objects(AXM.hasRole):
+                roles.setdefault(self._name(user_uri), set()).add(self._name(role_uri))
+            self._roles = roles
+
+    @staticmethod
+    def _name(uri) -> str:
+        return str(uri).split("/")[-1]
 
     def _user_uri(self, username: str) -> URIRef:
         return AXM[f"user/{username}"]
@@ -17,10 +188,15 @@ class UserManager:
         return AXM[f"role/{role}"]
 
     def create_user(self, username: str, password: str, roles: Optional[List[str]] = None) -> URIRef:
+        if self.has_user(username):
+            raise ValueError("User already exists")
+        return self.create_user_with_hash(username, hash_password(password), roles)
+
+    def create_user_with_hash(self, username: str, pw_hash: str, roles: Optional[List[str]] = None) -> URIRef:
+        """Create a user from a password hash computed elsewhere (e.g. by a :class:`PasswordHasher`)."""
         user_uri = self._user_uri(username)
         if (user_uri, RDF.type, AXM.User) in self.graph:
             raise ValueError("User already exists")
-        pw_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
         self.graph.add((user_uri, RDF.type, AXM.User))
         self.graph.add((user_uri, AXM.hasPasswordHash, Literal(pw_hash)))
         if roles:
@@ -28,27 +204,44 @@ class UserManager:
                 role_uri = self._role_uri(role)
                 self.graph.add((role_uri, RDF.type, AXM.Role))
                 self.graph.add((user_uri, AXM.hasRole, role_uri))
+        with self._lock:
+            self._users[username] = None
+            self._roles.setdefault(username, set()).update(roles or ())
         return user_uri
 
     def authenticate_user(self, username: str, password: str) -> bool:
-        user_uri = self._user_uri(username)
-        pw_hash = self.graph.value(user_uri, AXM.hasPasswordHash)
+        pw_hash = self.password_hash(username)
         if not pw_hash:
             return False
-        return bcrypt.checkpw(password.encode(), str(pw_hash).encode())
+        return verify_password(password, pw_hash)
+
+    def password_hash(self, username: str) -> Optional[str]:
+        """The stored password hash of a user, or None."""
+        pw_hash = self.graph.value(self._user_uri(username), AXM.hasPasswordHash)
+        return str(pw_hash) if pw_hash else None
+
+    def set_password_hash(self, username: str, pw_hash: str):
+        """Replace a user's password hash."""
+        self.graph.set((self._user_uri(username), AXM.hasPasswordHash, Literal(pw_hash)))
 
     def assign_role(self, username: str, role: str):
         user_uri = self._user_uri(username)
         role_uri = self._role_uri(role)
         self.graph.add((role_uri, RDF.type, AXM.Role))
         self.graph.add((user_uri, AXM.hasRole, role_uri))
+        with self._lock:
+            self._roles.setdefault(username, set()).add(role)
 
     def get_user_roles(self, username: str) -> List[str]:
-        user_uri = self._user_uri(username)
-        return [str(role).split("/")[-1] for role in self.graph.objects(user_uri, AXM.hasRole)]
+        return sorted(self._roles.get(username, ()))
+
+    def has_user(self, username: str) -> bool:
+        """True if the user exists (constant time)."""
+        return username in self._users
 
     def list_users(self) -> List[str]:
-        return [str(u).split("/")[-1] for u in self.graph.subjects(RDF.type, AXM.User)]
+        with self._lock:
+            return list(self._users)
 
     def delete_user(self, username: str):
         user_uri = self._user_uri(username)
@@ -57,9 +250,12 @@ class UserManager:
         for s, p in self.graph.subject_predicates(user_uri):
             self.graph.remove((s, p, user_uri))
         self.graph.remove((user_uri, None, None))
+        with self._lock:
+            self._users.pop(username, None)
+            self._roles.pop(username, None)
 
     def is_admin(self, username: str) -> bool:
-        return "admin" in self.get_user_roles(username)
+        return "admin" in self._roles.get(username, ())
 
     def is_agent(self, username: str) -> bool:
-        return "agent" in self.get_user_roles(username) 
\ No newline at end of file
+        return "agent" in self._roles.get(username, ()) 
\ No newline at end of file
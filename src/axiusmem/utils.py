@@ -1,4 +1,9 @@
 """General utilities for AxiusMEM™."""
+import asyncio
+import time
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Hashable, Optional
 
 def validate_data_against_ontology(graph, data):
     """
@@ -58,4 +63,144 @@ def attach_provenance(triple, source, timestamp, agent):
         >>> attach_provenance((s, p, o), source='api', timestamp='2024-07-01', agent='agent-001')
     """
     # Placeholder: attach provenance info to a triple
-    pass 
\ No newline at end of file
+    pass
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded mapping that evicts the least recently used entry.
+
+    Args:
+        maxsize (int): Maximum number of entries kept.
+        ttl (float, optional): Seconds an entry stays valid after it is stored (no expiry if None).
+
+    Example:
+        >>> cache = LRUCache(maxsize=2, ttl=30)
+        >>> cache.put("a", 1)
+        >>> cache.get("a")
+        1
+    """
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry):
+        return entry[1] is not None and entry[1] <= time.monotonic()
+
+    def get(self, key, default=None):
+        """Return the value cached for key (marking it most recently used), or default."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if self._expired(entry):
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """Cache value under key, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[Any, Any], bool]) -> int:
+        """Remove the entries for which predicate(key, value) is true; returns how many were removed."""
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(key, value)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key (across threads) into one execution.
+
+    The first caller for a key runs the function; callers arriving while it runs wait for it and
+    get the same result, or the same exception. Once it finishes, the next call runs again.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(("repo", query), lambda: adapter.sparql_select(query))
+    """
+    def __init__(self):
+        self._flights = {}
+        self._lock = Lock()
+        # Calls answered by another caller's execution
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the run already in flight for key, and return its result."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of :class:`SingleFlight`, for coroutines on one event loop.
+
+    The shared call runs as its own task, so a caller being cancelled does not cancel it for the
+    other callers.
+    """
+    def __init__(self):
+        self._tasks = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]) -> Any:
+        """Await fn(), or the call already in flight for key, and return its result."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._tasks.pop(key, None) if self._tasks.get(key) is done else None)
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
@@ -0,0 +1,265 @@
+import asyncio
+import os
+import threading
+import time
+import httpx
+import pytest
+import rdflib
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+from axiusmem.adapters.bulk import asend_chunks, iter_ntriples_chunks, ntriples_line, ntriples_term, send_chunks
+from axiusmem.adapters.jena_adapter import AsyncJenaAdapter, JenaAdapter
+from axiusmem.graphdb_adapter import GraphDBAdapter
+
+EX = "http://example.org/"
+
+
+@pytest.mark.parametrize("term, position, expected", [
+    (URIRef(EX + "a b"), "object", "<http://example.org/a\\u0020b>"),
+    (BNode("b0"), "subject", "_:b0"),
+    (Literal('say "hi"\nbye \\'), "object", '"say \\"hi\\"\\nbye \\\\"'),
+    (Literal("chat", lang="fr"), "object", '"chat"@fr'),
+    (Literal(42), "object", f'"42"^^<{XSD.integer}>'),
+    ("_:b1", "subject", "_:b1"),
+    (EX + "s", "subject", f"<{EX}s>"),
+    (EX + "o", "object", f"<{EX}o>"),
+    ('it\'s "quoted"', "object", '"it\'s \\"quoted\\""'),
+])
+def test_ntriples_term(term, position, expected):
+    assert ntriples_term(term, position) == expected
+
+
+def test_ntriples_chunks_round_trip():
+    triples = [(URIRef(EX + f"s{i}"), URIRef(EX + "p"), Literal(f'value "{i}"\n')) for i in range(5)]
+    chunks = list(iter_ntriples_chunks(iter(triples), chunk_size=2))
+    assert len(chunks) == 3
+    graph = rdflib.Graph()
+    for chunk in chunks:
+        graph.parse(data=chunk.decode("utf-8"), format="nt")
+    assert set(graph) == set(triples)
+    assert ntriples_line((EX + "s", EX + "p", "o")) == f'<{EX}s> <{EX}p> "o" .\n'
+    with pytest.raises(ValueError):
+        list(iter_ntriples_chunks(triples, chunk_size=0))
+
+
+def test_send_chunks_bounds_concurrency():
+    lock = threading.Lock()
+    in_flight, peak, sent = 0, 0, []
+    def send(chunk):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+            sent.append(chunk)
+    assert send_chunks(send, (bytes([i]) for i in range(12)), max_in_flight=3) == 12
+    assert sorted(sent) == [bytes([i]) for i in range(12)]
+    assert 1 < peak <= 3
+
+
+def test_send_chunks_reraises_and_stops():
+    sent = []
+    def send(chunk):
+        if chunk == b"2":
+            raise RuntimeError("rejected")
+        sent.append(chunk)
+    with pytest.raises(RuntimeError):
+        send_chunks(send, (str(i).encode() for i in range(100)), max_in_flight=2)
+    assert len(sent) < 99
+
+
+def test_asend_chunks_bounds_concurrency():
+    in_flight, peak = 0, 0
+    async def send(chunk):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+    assert asyncio.run(asend_chunks(send, (b"x" for _ in range(20)), max_in_flight=4)) == 20
+    assert peak == 4
+
+
+def test_graphdb_and_jena_post_ntriples_chunks():
+    calls = []
+    class FakeResponse:
+        status_code = 204
+        text = ""
+        def raise_for_status(self):
+            pass
+    class FakeSession:
+        def post(self, url, **kwargs):
+            calls.append((url, kwargs))
+            return FakeResponse()
+    triples = [(EX + f"s{i}", EX + "p", f'"{i}"') for i in range(5)]
+    graphdb = GraphDBAdapter("http://graphdb:7200", repository="repo")
+    graphdb.session = FakeSession()
+    assert graphdb.add_triples_to_named_graph(EX + "g", triples, chunk_size=2) is True
+    jena = JenaAdapter(dataset="ds")
+    jena.session = FakeSession()
+    jena.base_url = "http://fuseki:3030/ds"
+    assert jena.add_triples_to_named_graph(EX + "g", triples, chunk_size=2, max_in_flight=1) is True
+    assert [url for url, _ in calls] == ["http://graphdb:7200/repositories/repo/statements"] * 3 + ["http://fuseki:3030/ds/data"] * 3
+    assert all(kwargs["params"] == {"context": f"<{EX}g>"} for _, kwargs in calls[:3])
+    assert all(kwargs["params"] == {"graph": EX + "g"} for _, kwargs in calls[3:])
+    assert all(kwargs["headers"]["Content-Type"] == "application/n-triples" for _, kwargs in calls)
+    assert b'"\\"4\\""' in calls[-1][1]["data"]
+
+
+def test_async_jena_posts_ntriples_chunks():
+    bodies = []
+    def handler(request):
+        assert request.url.params["graph"] == EX + "g"
+        bodies.append(request.content)
+        return httpx.Response(200)
+    async def run():
+        adapter = AsyncJenaAdapter(host="fuseki", dataset="ds")
+        adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        result = await adapter.add_triples_to_named_graph(EX + "g", [(EX + "s", EX + "p", f"v{i}") for i in range(3)], chunk_size=1)
+        await adapter.close()
+        return result
+    assert asyncio.run(run()) is True
+    assert sorted(bodies) == [f'<{EX}s> <{EX}p> "v{i}" .\n'.encode() for i in range(3)]
+
+
+def _write_ntriples(path, count):
+    path.write_text("".join(f'<{EX}s{i}> <{EX}p> "v{i}" .\n' for i in range(count)))
+    return str(path)
+
+
+def test_upload_segments_and_gzip_stream(tmp_path):
+    import gzip
+    from axiusmem.adapters.bulk import iter_file_range, upload_segments
+    path = _write_ntriples(tmp_path / "data.nt", 100)
+    segments = upload_segments(path, "application/n-triples", segment_size=500)
+    assert len(segments) > 1 and segments[0][0] == 0 and segments[-1][1] == os.path.getsize(path)
+    assert all(a[1] == b[0] for a, b in zip(segments, segments[1:]))
+    assert upload_segments(path, "text/turtle", segment_size=500) == [(0, os.path.getsize(path))]
+    # Segmenting is opt-in
+    assert upload_segments(path, "application/n-triples") == [(0, os.path.getsize(path))]
+    data = open(path, "rb").read()
+    start, end = segments[1]
+    assert b"".join(iter_file_range(path, start, end, read_size=7)) == data[start:end]
+    assert gzip.decompress(b"".join(iter_file_range(path, 0, len(data), compress=True, read_size=64))) == data
+
+
+
+def test_segmenting_refuses_blank_nodes(tmp_path):
+    from axiusmem.adapters.bulk import has_blank_nodes, upload_segments
+    path = tmp_path / "data.nt"
+    path.write_text(f'<{EX}s> <{EX}p> "not _:a label" .\n<{EX}_:s> <{EX}p> <{EX}o> .\n')
+    assert not has_blank_nodes(str(path))
+    path.write_text(f'<{EX}s> <{EX}p> "x" .\n<{EX}s> <{EX}p>_:b1 .\n')
+    assert has_blank_nodes(str(path))
+    with pytest.raises(ValueError):
+        upload_segments(str(path), "application/n-triples", segment_size=10)
+    assert upload_segments(str(path), "application/n-triples") == [(0, os.path.getsize(path))]
+
+def test_graphdb_bulk_load_streams_and_retries_failed_segment(tmp_path, monkeypatch):
+    import gzip
+    import requests
+    from axiusmem.adapters.resilience import DEFAULT_POLICY
+    monkeypatch.setattr(DEFAULT_POLICY, "base_delay", 0)
+    path = _write_ntriples(tmp_path / "data.nt", 100)
+    received, attempts = [], []
+    class FakeResponse:
+        status_code = 204
+        def raise_for_status(self):
+            pass
+    class FakeSession:
+        def post(self, url, data=None, headers=None, **kwargs):
+            assert not isinstance(data, bytes) and headers["Content-Encoding"] == "gzip"
+            body = gzip.decompress(b"".join(data))
+            attempts.append(body)
+            if len(attempts) == 2:
+                raise requests.exceptions.ConnectTimeout("connect")
+            received.append(body)
+            return FakeResponse()
+    adapter = GraphDBAdapter("http://graphdb:7200", repository="repo")
+    adapter.session = FakeSession()
+    progress = []
+    assert adapter.bulk_load(path, "application/n-triples", compress=True, segment_size=1000,
+                             progress=lambda done, total: progress.append((done, total))) is True
+    assert b"".join(received) == open(path, "rb").read()
+    assert attempts[1] == attempts[2] and len(attempts) == len(received) + 1
+    assert progress[-1] == (os.path.getsize(path), os.path.getsize(path))
+    assert len(progress) == len(received)
+
+
+
+def test_chunk_uploads_are_not_resent_after_reaching_the_server(tmp_path, monkeypatch):
+    import requests
+    from axiusmem.adapters.resilience import DEFAULT_POLICY
+    monkeypatch.setattr(DEFAULT_POLICY, "base_delay", 0)
+    DEFAULT_POLICY.reset()
+    path = _write_ntriples(tmp_path / "data.nt", 10)
+    attempts = []
+    class FakeSession:
+        def post(self, url, **kwargs):
+            attempts.append(url)
+            raise requests.exceptions.ReadTimeout("read")
+    adapter = JenaAdapter(host="fuseki", dataset="ds")
+    adapter.session = FakeSession()
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        adapter.bulk_load(path, "application/n-triples")
+    # The breaker is named after the dataset URL even before connect()
+    assert attempts == ["http://fuseki:3030/ds/data"]
+    assert "http://fuseki:3030/ds data" in DEFAULT_POLICY.breakers()
+    DEFAULT_POLICY.reset()
+
+def test_async_jena_bulk_load_streams_segments(tmp_path):
+    path = _write_ntriples(tmp_path / "data.nt", 50)
+    bodies = []
+    async def handler(request):
+        bodies.append(await request.aread())
+        return httpx.Response(200)
+    async def run():
+        adapter = AsyncJenaAdapter(host="fuseki", dataset="ds")
+        adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        result = await adapter.bulk_load(path, "application/n-triples", segment_size=400)
+        await adapter.close()
+        return result
+    assert asyncio.run(run()) is True
+    assert len(bodies) > 1 and b"".join(bodies) == open(path, "rb").read()
+
+
+def test_graphdb_transaction_protocol():
+    calls = []
+    class FakeResponse:
+        def __init__(self, status_code, headers=None):
+            self.status_code = status_code
+            self.headers = headers or {}
+        def raise_for_status(self):
+            pass
+    class FakeSession:
+        def post(self, url, **kwargs):
+            calls.append(("POST", url, kwargs))
+            return FakeResponse(201, {"Location": "http://graphdb:7200/repositories/repo/transactions/tx-1"})
+        def put(self, url, **kwargs):
+            calls.append(("PUT", url, kwargs))
+            return FakeResponse(200)
+        def delete(self, url, **kwargs):
+            calls.append(("DELETE", url, kwargs))
+            return FakeResponse(204)
+    adapter = GraphDBAdapter("http://graphdb:7200", repository="repo")
+    adapter.session = FakeSession()
+    triples = [(EX + f"s{i}", EX + "p", f"v{i}") for i in range(5)]
+    with adapter.transaction() as tx_id:
+        assert tx_id == "tx-1"
+        adapter.transaction_add(tx_id, triples, graph_uri=EX + "g", chunk_size=2)
+        adapter.transaction_remove(tx_id, triples[:1])
+        adapter.transaction_update(tx_id, "CLEAR GRAPH <http://example.org/old>")
+    tx_url = "http://graphdb:7200/repositories/repo/transactions/tx-1"
+    assert [(method, url) for method, url, _ in calls[1:]] == [("PUT", tx_url)] * 6
+    assert [kwargs["params"] for _, _, kwargs in calls[1:]] == (
+        [{"action": "ADD", "context": f"<{EX}g>"}] * 3 + [{"action": "DELETE"}, {"action": "UPDATE"}, {"action": "COMMIT"}]
+    )
+    assert calls[4][2]["data"] == f'<{EX}s0> <{EX}p> "v0" .\n'.encode()
+    assert calls[5][2]["headers"]["Content-Type"] == "application/sparql-update"
+    calls.clear()
+    with pytest.raises(RuntimeError):
+        with adapter.transaction() as tx_id:
+            raise RuntimeError("ingest failed")
+    assert [method for method, _, _ in calls] == ["POST", "DELETE"]
@@ -0,0 +1,133 @@
+import asyncio
+import time
+import pytest
+from axiusmem.adapters.base import AsyncBaseTriplestoreAdapter, BaseTriplestoreAdapter, get_triplestore_adapter_from_env
+from axiusmem.adapters.cache import (
+    ALL_GRAPHS, AsyncCachingAdapter, CachingAdapter, QueryCache, normalize_query, query_graphs,
+)
+from axiusmem.adapters.rdflib_adapter import RDFLibAdapter
+from axiusmem.utils import LRUCache
+
+G = "http://example.org/g"
+H = "http://example.org/h"
+
+
+def test_normalize_query_keeps_literals_and_iris():
+    assert normalize_query("SELECT ?s\n  WHERE { ?s ?p 'a  b' } # comment\n") == "SELECT ?s WHERE { ?s ?p 'a  b' }"
+    assert normalize_query("SELECT * WHERE { ?s <http://x#y>   ?o }") == "SELECT * WHERE { ?s <http://x#y> ?o }"
+    assert normalize_query('ASK { ?s ?p """a\n  # b""" }') == 'ASK { ?s ?p """a\n  # b""" }'
+
+
+@pytest.mark.parametrize("query, graphs", [
+    ("SELECT * WHERE { ?s ?p ?o }", {ALL_GRAPHS}),
+    (f"SELECT * WHERE {{ GRAPH <{G}> {{ ?s ?p '}}' }} }} LIMIT 1", {G}),
+    (f"SELECT * {{ GRAPH <{G}> {{ ?s ?p ?o }} ?a ?b ?c }}", {ALL_GRAPHS}),
+    (f"SELECT * WHERE {{ GRAPH <{G}> {{ GRAPH ?x {{ ?s ?p ?o }} }} }}", {ALL_GRAPHS}),
+    (f"SELECT * FROM <{G}> FROM NAMED <{H}> WHERE {{ ?s ?p ?o }}", {G, H}),
+    ("SELECT * WHERE { GRAPH ?g { ?s ?p ?o } }", {ALL_GRAPHS}),
+])
+def test_query_graphs(query, graphs):
+    assert query_graphs(query) == graphs
+
+
+def test_lru_cache_ttl_and_discard_where():
+    cache = LRUCache(maxsize=2, ttl=0.05)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1 and "b" in cache
+    assert cache.discard_where(lambda key, value: value == 2) == 1 and "b" not in cache
+    time.sleep(0.06)
+    assert cache.get("a") is None and len(cache) == 0
+
+
+class CountingAdapter(RDFLibAdapter):
+    def __init__(self, repository=None):
+        super().__init__(repository=repository)
+        self.selects = 0
+
+    def sparql_select(self, query, **kwargs):
+        self.selects += 1
+        return super().sparql_select(query, **kwargs)
+
+
+def test_caching_adapter_hits_and_invalidates_per_graph():
+    inner = CountingAdapter()
+    adapter = CachingAdapter(inner, maxsize=10, ttl=None)
+    assert isinstance(adapter, BaseTriplestoreAdapter)
+    adapter.add_triples_to_named_graph(G, [("http://example.org/s", "http://example.org/p", "1")])
+    in_g = f"SELECT ?o WHERE {{ GRAPH <{G}> {{ ?s ?p ?o }} }}"
+    in_h = f"SELECT ?o WHERE {{ GRAPH <{H}> {{ ?s ?p ?o }} }}"
+    everything = "SELECT ?o WHERE { ?s ?p ?o }"
+    for query in (in_g, in_h, everything):
+        adapter.sparql_select(query)
+    assert adapter.sparql_select(in_g.replace(" ", "  ")) == [{"o": {"type": "literal", "value": "1"}}]
+    assert inner.selects == 3
+    assert adapter.cache_stats() == {"hits": 1, "misses": 3, "entries": 3}
+    adapter.add_triples_to_named_graph(H, [("http://example.org/s", "http://example.org/p", "2")])
+    adapter.sparql_select(in_g)
+    assert inner.selects == 3
+    assert len(adapter.sparql_select(in_h)) == 1 and len(adapter.sparql_select(everything)) == 2
+    assert inner.selects == 5
+    adapter.sparql_update(f'INSERT DATA {{ GRAPH <{G}> {{ <http://example.org/s> <http://example.org/p> "3" }} }}')
+    assert len(adapter.sparql_select(in_g)) == 2
+    adapter.clear_named_graph(G)
+    assert adapter.sparql_select(in_g) == []
+    assert adapter.list_named_graphs() == inner.list_named_graphs()
+    assert adapter.store == "Memory"
+
+
+def test_shared_cache_is_keyed_by_repository():
+    cache = QueryCache(maxsize=10, ttl=None)
+    first, second = CountingAdapter("one"), CountingAdapter("two")
+    a, b = CachingAdapter(first, cache=cache), CachingAdapter(second, cache=cache)
+    a.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+    b.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+    assert first.selects == second.selects == 1
+    a.sparql_update("CLEAR ALL")
+    b.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+    assert second.selects == 1
+
+
+def test_result_fetched_during_write_is_not_stored():
+    cache = QueryCache(maxsize=10, ttl=None)
+    key = cache.key("repo", "select", "SELECT * WHERE { ?s ?p ?o }", {})
+    hit, _, generation = cache.lookup(key)
+    assert not hit
+    cache.invalidate("repo")
+    cache.store(key, frozenset([ALL_GRAPHS]), ["stale"], generation)
+    assert cache.lookup(key)[0] is False
+
+
+def test_async_caching_adapter():
+    class FakeAsyncAdapter(AsyncBaseTriplestoreAdapter):
+        repository = "repo"
+        calls = 0
+        async def sparql_select(self, query, **kwargs):
+            FakeAsyncAdapter.calls += 1
+            return [{"n": {"type": "literal", "value": str(self.calls)}}]
+        async def add_triples_to_named_graph(self, graph_uri, triples, **kwargs):
+            return True
+        connect = close = sparql_update = bulk_load = test_connection = None
+        begin_transaction = commit_transaction = rollback_transaction = None
+        list_named_graphs = create_named_graph = delete_named_graph = clear_named_graph = None
+        get_triples_from_named_graph = None
+    async def run():
+        adapter = AsyncCachingAdapter(FakeAsyncAdapter(), ttl=None)
+        first = await adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+        assert await adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }") is first
+        await adapter.add_triples_to_named_graph(G, [])
+        return await adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+    assert asyncio.run(run())[0]["n"]["value"] == "2"
+
+
+def test_factory_wraps_adapter_when_cache_configured(monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "graphdb")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://graphdb:7200")
+    monkeypatch.delenv("TRIPLESTORE_CACHE_SIZE", raising=False)
+    assert not isinstance(get_triplestore_adapter_from_env(), CachingAdapter)
+    monkeypatch.setenv("TRIPLESTORE_CACHE_SIZE", "500")
+    monkeypatch.setenv("TRIPLESTORE_CACHE_TTL", "5")
+    adapter = get_triplestore_adapter_from_env(repository="repo")
+    assert isinstance(adapter, CachingAdapter) and adapter.repository == "repo"
+    assert adapter.cache.results.maxsize == 500 and adapter.cache.results.ttl == 5
+    assert isinstance(get_triplestore_adapter_from_env(asynchronous=True), AsyncCachingAdapter)
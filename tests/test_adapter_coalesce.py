@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from axiusmem.adapters.base import AsyncDelegatingAdapter, BaseTriplestoreAdapter, get_triplestore_adapter_from_env
+from axiusmem.adapters.cache import CachingAdapter
+from axiusmem.adapters.coalesce import AsyncCoalescingAdapter, CoalescingAdapter
+from axiusmem.adapters.rdflib_adapter import RDFLibAdapter
+from axiusmem.utils import SingleFlight
+
+QUERY = "SELECT ?o WHERE { ?s ?p ?o }"
+
+
+class SlowAdapter(RDFLibAdapter):
+    def __init__(self, repository="repo"):
+        super().__init__(repository=repository)
+        self.selects = 0
+
+    def sparql_select(self, query, **kwargs):
+        self.selects += 1
+        time.sleep(0.05)
+        if "fail" in query:
+            raise RuntimeError("triplestore error")
+        return super().sparql_select(query, **kwargs)
+
+
+def test_single_flight_runs_again_after_completion():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+    assert flight.coalesced == 0
+
+
+def test_concurrent_identical_queries_share_one_request():
+    inner = SlowAdapter()
+    adapter = CoalescingAdapter(inner)
+    assert isinstance(adapter, BaseTriplestoreAdapter)
+    adapter.add_triples_to_named_graph("http://example.org/g", [("http://example.org/s", "http://example.org/p", "x")])
+    with ThreadPoolExecutor(8) as pool:
+        # Formatting differences still coalesce
+        results = list(pool.map(adapter.sparql_select, [QUERY, QUERY.replace(" ", "  ")] * 4))
+    assert inner.selects == 1
+    assert all(result == [{"o": {"type": "literal", "value": "x"}}] for result in results)
+    assert adapter.coalesce_stats() == {"coalesced": 7}
+    # Different queries and repositories are not merged
+    other = CoalescingAdapter(SlowAdapter(repository="other"))
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda a: a.sparql_select(QUERY), [adapter, other]))
+    assert inner.selects == 2
+
+
+def test_coalesced_callers_share_the_exception():
+    inner = SlowAdapter()
+    adapter = CoalescingAdapter(inner)
+    barrier = threading.Barrier(4)
+    def call(_):
+        barrier.wait()
+        with pytest.raises(RuntimeError):
+            adapter.sparql_select("SELECT * WHERE { ?s ?p 'fail' }")
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(call, range(4)))
+    assert inner.selects == 1
+
+
+
+def test_query_after_a_write_does_not_join_an_earlier_flight():
+    read, release = threading.Event(), threading.Event()
+    class StalledAdapter(RDFLibAdapter):
+        selects = 0
+        def sparql_select(self, query, **kwargs):
+            self.selects += 1
+            result = super().sparql_select(query, **kwargs)
+            if self.selects == 1:
+                # The first query has read the store, but its response is still on the way
+                read.set()
+                release.wait(5)
+            return result
+    adapter = CoalescingAdapter(StalledAdapter(repository="repo"))
+    with ThreadPoolExecutor(2) as pool:
+        before = pool.submit(adapter.sparql_select, QUERY)
+        assert read.wait(5)
+        adapter.add_triples_to_named_graph("http://example.org/g", [("http://example.org/s", "http://example.org/p", "x")])
+        # Sent after the write finished: must see it, not wait for the pre-write flight
+        after = pool.submit(adapter.sparql_select, QUERY).result(timeout=5)
+        release.set()
+        assert before.result(timeout=5) == []
+    assert after == [{"o": {"type": "literal", "value": "x"}}]
+    assert adapter.coalesce_stats() == {"coalesced": 0}
+
+class FakeAsyncAdapter(AsyncDelegatingAdapter):
+    repository = "repo"
+
+    def __init__(self):
+        super().__init__(None)
+        self.selects = 0
+
+    async def sparql_select(self, query, **kwargs):
+        self.selects += 1
+        await asyncio.sleep(0.01)
+        return [{"query": query}]
+
+
+def test_async_concurrent_identical_queries_share_one_request():
+    inner = FakeAsyncAdapter()
+    adapter = AsyncCoalescingAdapter(inner)
+    async def run():
+        callers = [asyncio.ensure_future(adapter.sparql_select(QUERY)) for _ in range(5)]
+        await asyncio.sleep(0)
+        # A cancelled caller does not cancel the shared request
+        callers[0].cancel()
+        results = await asyncio.gather(*callers[1:])
+        return results + [await adapter.sparql_select("ASK { ?s ?p ?o }")]
+    results = asyncio.run(run())
+    assert results[:4] == [[{"query": QUERY}]] * 4
+    assert inner.selects == 2
+    assert adapter.coalesce_stats() == {"coalesced": 4}
+
+
+def test_factory_coalesces_network_adapters(monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "graphdb")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://graphdb:7200")
+    monkeypatch.setenv("TRIPLESTORE_CACHE_SIZE", "10")
+    adapter = get_triplestore_adapter_from_env(repository="repo")
+    assert isinstance(adapter, CachingAdapter) and isinstance(adapter.adapter, CoalescingAdapter)
+    assert adapter.repository == "repo" and adapter.coalesce_stats() == {"coalesced": 0}
+    assert isinstance(get_triplestore_adapter_from_env(repository="repo", asynchronous=True).adapter, AsyncCoalescingAdapter)
+    monkeypatch.setenv("TRIPLESTORE_COALESCE", "false")
+    monkeypatch.delenv("TRIPLESTORE_CACHE_SIZE")
+    assert type(get_triplestore_adapter_from_env(repository="repo")).__name__ == "GraphDBAdapter"
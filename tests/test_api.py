@@ -1,8 +1,11 @@
+import json
 import os
+import time
 import pytest
 from fastapi.testclient import TestClient
 from axiusmem.api import create_app
-from axiusmem.adapters.base import get_triplestore_adapter_from_env
+from axiusmem.adapters.base import AdapterRegistry, get_triplestore_adapter_from_env
+from axiusmem.adapters.resilience import CircuitOpenError
 import rdflib
 
 # Add triplestore-specific decorators
@@ -180,11 +183,13 @@ def test_metrics_endpoint_admin_and_forbidden(client):
         # Admin access
         admin_token = get_token(client, "admin", "adminpw")
         headers = {"Authorization": f"Bearer {admin_token}"}
-        resp = client.get("/metrics", headers=headers)
+        resp = client.get("/metrics", headers={**headers, "Accept": "application/json"})
         assert resp.status_code == 200
         data = resp.json()
         assert "uptime_seconds" in data
         assert "total_requests" in data
+        assert data["cache"] == {"hits": 0, "misses": 0, "entries": 0}
+        assert data["coalesced_queries"] == 0
         # Unauthenticated
         resp = client.get("/metrics")
         assert resp.status_code == 401 or resp.status_code == 403
@@ -261,25 +266,20 @@ def test_sparql_invalid_query(client):
         # Invalid query should return error
         bad_query = "THIS IS NOT SPARQL"
         resp = client.get("/sparql", params={"query": bad_query})
-        assert resp.status_code in (400, 500, 501) 
+        assert resp.status_code in (400, 500, 501)
+
 
-def test_error_response_retry(monkeypatch, client):
-    from tenacity import RetryError
-    class DummyAttempt:
-        def exception(self):
-            return "Simulated retry failure"
+def test_error_response_circuit_open(monkeypatch, client):
     app, graph = client()
     with TestClient(app) as client:
         class MockAdapter:
             def sparql_select(self, query):
-                raise RetryError(DummyAttempt())
+                raise CircuitOpenError("graphdb:select", 12.4)
         monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", lambda *args, **kwargs: MockAdapter())
         resp = client.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"})
-        if resp.status_code != 503:
-            print("Response status:", resp.status_code)
-            print("Response content:", resp.content)
         assert resp.status_code == 503
-        assert "retries" in resp.json()["detail"]
+        assert resp.headers["Retry-After"] == "12"
+        assert "retry in 12s" in resp.json()["detail"]
 
 
 def test_error_response_500(monkeypatch, client):
@@ -312,6 +312,11 @@ def test_admin_enforcement_all_endpoints(client):
             (client.get, "/users/", {}),
             (client.get, "/metrics", {}),
             (client.get, "/tasks", {}),
+            (client.get, "/tasks/taskid", {}),
+            (client.delete, "/tasks/taskid", {}),
+            (client.post, "/tasks/bulk_load", {"json": {"rdf_path": "data.ttl"}}),
+            (client.post, f"/tasks/graphs/{graph_uri}/clear", {}),
+            (client.post, f"/tasks/graphs/{graph_uri}/export", {}),
             (client.get, "/graphs/", {}),
             (client.post, "/graphs/", {"params": {"graph_uri": graph_uri}}),
             (client.delete, f"/graphs/{graph_uri}", {}),
@@ -325,4 +330,315 @@ def test_admin_enforcement_all_endpoints(client):
         ]
         for method, url, kwargs in endpoints:
             resp = method(url, headers=agent_headers, **kwargs)
-            assert resp.status_code == 403, f"Endpoint {url} did not return 403 for agent user" 
\ No newline at end of file
+            assert resp.status_code == 403, f"Endpoint {url} did not return 403 for agent user" 
+def test_adapters_reused_per_repository_and_closed_on_shutdown(monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_REPOSITORIES", "other")
+    app = create_app(graph=rdflib.Graph())
+    built = []
+    class MockAdapter:
+        def __init__(self, repository):
+            self.repository = repository
+            self.closed = False
+        def sparql_select(self, query):
+            return [{"repo": self.repository}]
+        def close(self):
+            self.closed = True
+    def factory(repository=None, **kwargs):
+        built.append(MockAdapter(repository))
+        return built[-1]
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", factory)
+    with TestClient(app) as client:
+        for _ in range(3):
+            assert client.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"}).status_code == 200
+        resp = client.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }", "repository": "other"})
+        assert resp.json() == {"results": [{"repo": "other"}]}
+        assert [adapter.repository for adapter in built] == [None, "other"]
+    assert all(adapter.closed for adapter in built)
+
+
+def test_repository_registry_is_allow_listed_and_bounded(monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_REPOSITORIES", "a,b,c")
+    monkeypatch.setenv("TRIPLESTORE_MAX_REPOSITORIES", "2")
+    app = create_app(graph=rdflib.Graph())
+    built = []
+    class MockAdapter:
+        def __init__(self, repository):
+            self.repository = repository
+            self.closed = False
+        def sparql_select(self, query):
+            return []
+        async def close(self):
+            self.closed = True
+    def factory(repository=None, **kwargs):
+        built.append(MockAdapter(repository))
+        return built[-1]
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", factory)
+    query = "SELECT * WHERE { ?s ?p ?o }"
+    with TestClient(app) as client_instance:
+        assert client_instance.get("/sparql", params={"query": query, "repository": "unlisted"}).status_code == 404
+        assert client_instance.get("/health", params={"repository": "unlisted"}).status_code == 404
+        for repository in ("a", "b", "a", "c"):
+            assert client_instance.get("/sparql", params={"query": query, "repository": repository}).status_code == 200
+        # "b" was the least recently used adapter: it was closed to make room for "c"
+        assert [(adapter.repository, adapter.closed) for adapter in built] == [("a", False), ("b", True), ("c", False)]
+        assert len(app.state.adapters) == 2
+
+
+def test_evicted_adapter_is_closed_once_its_leases_end():
+    closed = []
+    class MockAdapter:
+        def __init__(self, repository):
+            self.repository = repository
+        def close(self):
+            closed.append(self.repository)
+    registry = AdapterRegistry(MockAdapter, maxsize=1)
+    with registry.lease("a") as adapter:
+        registry.get("b")
+        # "a" was evicted while a request was using it: it stays open until the lease ends
+        assert closed == [] and adapter.repository == "a"
+    assert closed == ["a"]
+    registry.get("c")
+    assert closed == ["a", "b"]
+    registry.close()
+    assert closed == ["a", "b", "c"]
+
+
+def test_only_the_configured_repository_is_accepted_by_default(monkeypatch):
+    monkeypatch.delenv("TRIPLESTORE_REPOSITORIES", raising=False)
+    monkeypatch.setenv("TRIPLESTORE_REPOSITORY", "main")
+    app = create_app(graph=rdflib.Graph())
+    class MockAdapter:
+        def sparql_select(self, query):
+            return []
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", lambda *args, **kwargs: MockAdapter())
+    query = "SELECT * WHERE { ?s ?p ?o }"
+    with TestClient(app) as client_instance:
+        assert client_instance.get("/sparql", params={"query": query}).status_code == 200
+        assert client_instance.get("/sparql", params={"query": query, "repository": "main"}).status_code == 200
+        assert client_instance.get("/sparql", params={"query": query, "repository": "other"}).status_code == 404
+        assert client_instance.get("/health", params={"repository": "other"}).status_code == 404
+
+
+def test_sparql_stream(monkeypatch, client):
+    app, graph = client()
+    rows = [{"s": {"type": "uri", "value": f"http://example.org/{i}"}} for i in range(3)]
+    class MockAdapter:
+        def sparql_select_iter(self, query):
+            yield from rows
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", lambda *args, **kwargs: MockAdapter())
+    with TestClient(app) as client:
+        resp = client.get("/sparql", params={"query": "SELECT ?s WHERE { ?s ?p ?o }", "stream": "true"})
+        assert resp.status_code == 200
+        assert resp.json() == {"results": rows}
+
+
+def test_sparql_stream_error_before_first_row(monkeypatch, client):
+    app, graph = client()
+    class MockAdapter:
+        def sparql_select_iter(self, query):
+            raise RuntimeError("Simulated failure")
+            yield
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", lambda *args, **kwargs: MockAdapter())
+    with TestClient(app) as client:
+        resp = client.get("/sparql", params={"query": "SELECT ?s WHERE { ?s ?p ?o }", "stream": "true"})
+        assert resp.status_code == 500
+        assert "Simulated failure" in resp.json()["detail"]
+
+
+def test_rdflib_backend_serves_sparql_and_transactions(monkeypatch, client):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.delenv("TRIPLESTORE_PATH", raising=False)
+    app, graph = client()
+    with TestClient(app) as client_instance:
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        resp = client_instance.post("/transactions/begin", headers=headers)
+        assert resp.status_code == 200
+        tx_id = resp.json()["tx_id"]
+        app.state.adapters.get().add_triples_to_named_graph("urn:example:g", [("http://example.org/s", "http://example.org/p", "o")])
+        assert client_instance.post(f"/transactions/{tx_id}/commit", headers=headers).status_code == 200
+        resp = client_instance.get("/sparql", params={"query": "SELECT ?o WHERE { ?s ?p ?o }"})
+        assert resp.json()["results"] == [{"o": {"type": "literal", "value": "o"}}]
+
+
+def test_metrics_report_result_cache(monkeypatch, client):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.setenv("TRIPLESTORE_CACHE_SIZE", "100")
+    app, graph = client()
+    with TestClient(app) as client_instance:
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        for _ in range(3):
+            assert client_instance.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"}).status_code == 200
+        cache = client_instance.get("/metrics", headers={**headers, "Accept": "application/json"}).json()["cache"]
+        assert cache == {"hits": 2, "misses": 1, "entries": 1}
+
+
+def test_transaction_scoped_writes(monkeypatch, client):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.delenv("TRIPLESTORE_PATH", raising=False)
+    app, graph = client()
+    query = {"query": "SELECT ?o WHERE { ?s ?p ?o }"}
+    with TestClient(app) as client_instance:
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        tx_id = client_instance.post("/transactions/begin", headers=headers).json()["tx_id"]
+        triples = {"triples": [["http://example.org/s", "http://example.org/p", "a"], ["http://example.org/s", "http://example.org/p", "b"]],
+                   "graph_uri": "urn:example:g"}
+        assert client_instance.post(f"/transactions/{tx_id}/add", json=triples, headers=headers).status_code == 200
+        removed = {"triples": [["http://example.org/s", "http://example.org/p", "b"]], "graph_uri": "urn:example:g"}
+        assert client_instance.post(f"/transactions/{tx_id}/remove", json=removed, headers=headers).status_code == 200
+        update = {"update": 'INSERT DATA { GRAPH <urn:example:g> { <http://example.org/s> <http://example.org/p> "c" } }'}
+        assert client_instance.post(f"/transactions/{tx_id}/update", json=update, headers=headers).status_code == 200
+        assert client_instance.post(f"/transactions/{tx_id}/commit", headers=headers).status_code == 200
+        values = sorted(row["o"]["value"] for row in client_instance.get("/sparql", params=query).json()["results"])
+        assert values == ["a", "c"]
+        # Writes in a rolled back transaction are discarded
+        tx_id = client_instance.post("/transactions/begin", headers=headers).json()["tx_id"]
+        assert client_instance.post(f"/transactions/{tx_id}/update", json={"update": "CLEAR ALL"}, headers=headers).status_code == 200
+        assert client_instance.post(f"/transactions/{tx_id}/rollback", headers=headers).status_code == 200
+        assert len(client_instance.get("/sparql", params=query).json()["results"]) == 2
+        assert client_instance.post("/transactions/unknown/update", json={"update": "CLEAR ALL"}, headers=headers).status_code == 500
+
+
+def test_cached_token_rejected_after_user_deleted(client):
+    app, graph = client()
+    with TestClient(app) as client_instance:
+        admin_headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        client_instance.post("/users/", params={"username": "bob", "password": "pw", "roles": ["agent"]}, headers=admin_headers)
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'bob', 'pw')}"}
+        assert client_instance.get("/me", headers=headers).status_code == 200
+        assert client_instance.get("/me", headers=headers).status_code == 200
+        client_instance.delete("/users/bob", headers=admin_headers)
+        assert client_instance.get("/me", headers=headers).status_code == 401
+        assert client_instance.get("/me", headers={"Authorization": "Bearer not-a-token"}).status_code == 401
+
+
+def test_login_throttled_and_admin_hash_kept_on_restart(monkeypatch):
+    monkeypatch.setenv("AXIUSMEM_LOGIN_ATTEMPTS", "2")
+    graph = rdflib.Graph()
+    with TestClient(create_app(graph=graph)) as client_instance:
+        pw_hash = graph.value(predicate=rdflib.URIRef("https://axius.info/axiusmem/hasPasswordHash"))
+        assert client_instance.post("/token", data={"username": "admin", "password": "wrong"}).status_code == 400
+        assert client_instance.post("/token", data={"username": "admin", "password": "adminpw"}).status_code == 200
+        resp = client_instance.post("/token", data={"username": "admin", "password": "adminpw"})
+        assert resp.status_code == 429 and int(resp.headers["Retry-After"]) >= 1
+    # Restarting with the same admin password does not re-hash it
+    with TestClient(create_app(graph=graph)):
+        assert graph.value(predicate=rdflib.URIRef("https://axius.info/axiusmem/hasPasswordHash")) == pw_hash
+
+
+def test_bulk_load_and_export_run_as_background_tasks(monkeypatch, client, tmp_path):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.delenv("TRIPLESTORE_PATH", raising=False)
+    monkeypatch.setenv("AXIUSMEM_EXPORT_DIR", str(tmp_path))
+    monkeypatch.setenv("AXIUSMEM_IMPORT_DIR", str(tmp_path))
+    data = tmp_path / "data.nq"
+    data.write_text('<http://example.org/s> <http://example.org/p> "a" <urn:example:g> .\n'
+                    '<http://example.org/s> <http://example.org/p> "b"@en <urn:example:g> .\n')
+    app, graph = client()
+
+    def wait(client_instance, resp, headers):
+        assert resp.status_code == 202
+        task_id = resp.json()["task_id"]
+        for _ in range(200):
+            task = client_instance.get(f"/tasks/{task_id}", headers=headers).json()
+            if task["state"] not in ("queued", "running"):
+                return task
+            time.sleep(0.01)
+        raise AssertionError("task did not finish")
+
+    with TestClient(app) as client_instance:
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        body = {"rdf_path": str(data), "rdf_format": "application/n-quads"}
+        task = wait(client_instance, client_instance.post("/tasks/bulk_load", json=body, headers=headers), headers)
+        assert task["state"] == "succeeded" and task["progress"]["fraction"] == 1.0
+        task = wait(client_instance, client_instance.post("/tasks/graphs/urn:example:g/export", headers=headers), headers)
+        assert task["state"] == "succeeded" and task["result"]["triples"] == 2
+        exported = rdflib.Graph().parse(task["result"]["path"], format="nt")
+        assert {str(o) for o in exported.objects()} == {"a", "b"}
+        # Finished tasks are no longer live, but are kept for their result
+        assert client_instance.get("/tasks", headers=headers).json()["tasks"] == []
+        assert len(client_instance.get("/tasks", params={"include_finished": True}, headers=headers).json()["tasks"]) == 2
+        task = wait(client_instance, client_instance.post("/tasks/graphs/urn:example:g/clear", headers=headers), headers)
+        assert task["state"] == "succeeded"
+        assert client_instance.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"}).json()["results"] == []
+        assert client_instance.post("/tasks/bulk_load", json={"rdf_path": str(tmp_path / "missing.ttl")}, headers=headers).status_code == 400
+        # Only files in the import directory can be loaded, and outside paths are not probed
+        (tmp_path / "link.nq").symlink_to("/etc/hostname")
+        for outside in ("/etc/hostname", "../../etc/hostname", "link.nq", "/no/such/file"):
+            resp = client_instance.post("/tasks/bulk_load", json={"rdf_path": outside}, headers=headers)
+            assert resp.status_code == 400 and resp.json()["detail"] == "rdf_path must name a file in the import directory."
+        assert client_instance.post("/tasks/bulk_load", json={"rdf_path": "data.nq", "rdf_format": "application/n-quads"}, headers=headers).status_code == 202
+        monkeypatch.delenv("AXIUSMEM_IMPORT_DIR")
+        assert client_instance.post("/tasks/bulk_load", json=body, headers=headers).status_code == 403
+        assert client_instance.get("/tasks/unknown", headers=headers).status_code == 404
+
+
+
+def test_running_graph_clear_cannot_be_cancelled(monkeypatch, client):
+    import threading
+    from axiusmem.adapters.rdflib_adapter import RDFLibAdapter
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.delenv("TRIPLESTORE_PATH", raising=False)
+    started, stop = threading.Event(), threading.Event()
+    def blocking_clear(self, graph_uri):
+        started.set()
+        stop.wait(5)
+        return True
+    monkeypatch.setattr(RDFLibAdapter, "clear_named_graph", blocking_clear)
+    app, graph = client()
+    with TestClient(app) as client_instance:
+        headers = {"Authorization": f"Bearer {get_token(client_instance, 'admin', 'adminpw')}"}
+        task_id = client_instance.post("/tasks/graphs/urn:example:g/clear", headers=headers).json()["task_id"]
+        assert started.wait(5)
+        resp = client_instance.delete(f"/tasks/{task_id}", headers=headers)
+        assert resp.status_code == 409
+        stop.set()
+        for _ in range(200):
+            task = client_instance.get(f"/tasks/{task_id}", headers=headers).json()
+            if task["state"] != "running":
+                break
+            time.sleep(0.01)
+        assert task["state"] == "succeeded" and task["progress"]["fraction"] == 1.0
+
+def test_sparql_content_negotiation_streams_formats(monkeypatch, client):
+    from axiusmem.api import negotiate_media_type, SPARQL_MEDIA_TYPES
+    assert negotiate_media_type(None, SPARQL_MEDIA_TYPES) == "application/json"
+    assert negotiate_media_type("text/html, */*", SPARQL_MEDIA_TYPES) == "application/json"
+    assert negotiate_media_type("text/csv;q=0.5, application/ndjson", SPARQL_MEDIA_TYPES) == "application/x-ndjson"
+    app, graph = client()
+    rows = [{"s": {"type": "uri", "value": "http://example.org/1"}, "o": {"type": "literal", "value": 'say "hi", twice'}},
+            {"s": {"type": "bnode", "value": "b0"}}]
+    class MockAdapter:
+        def sparql_select_iter(self, query):
+            yield from rows
+    monkeypatch.setattr("axiusmem.api.get_triplestore_adapter_from_env", lambda *args, **kwargs: MockAdapter())
+    params = {"query": "SELECT ?s ?o WHERE { ?s ?p ?o }"}
+    with TestClient(app) as client_instance:
+        resp = client_instance.get("/sparql", params=params, headers={"Accept": "application/x-ndjson"})
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line) for line in resp.text.splitlines()] == rows
+        resp = client_instance.get("/sparql", params=params, headers={"Accept": "text/csv"})
+        assert resp.text == 's,o\r\nhttp://example.org/1,"say ""hi"", twice"\r\n_:b0,\r\n'
+        resp = client_instance.get("/sparql", params=params, headers={"Accept": "application/sparql-results+json"})
+        assert resp.json() == {"head": {"vars": ["s", "o"]}, "results": {"bindings": rows}}
+        assert client_instance.get("/sparql", params={**params, "stream": "true"}).json() == {"results": rows}
+
+
+def test_sparql_streams_through_default_wrapped_async_adapter(monkeypatch, client):
+    import httpx
+    from axiusmem.adapters.coalesce import AsyncCoalescingAdapter
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "graphdb")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://graphdb:7200")
+    monkeypatch.delenv("TRIPLESTORE_COALESCE", raising=False)
+    monkeypatch.delenv("TRIPLESTORE_CACHE_SIZE", raising=False)
+    body = b'?s\n<http://example.org/a>\n<http://example.org/b>\n'
+    app, graph = client()
+    params = {"query": "SELECT ?s WHERE { ?s ?p ?o }"}
+    with TestClient(app) as client_instance:
+        adapter = app.state.adapters.get()
+        assert isinstance(adapter, AsyncCoalescingAdapter)
+        adapter.adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+        resp = client_instance.get("/sparql", params=params, headers={"Accept": "application/x-ndjson"})
+        assert resp.status_code == 200
+        assert [json.loads(line)["s"]["value"] for line in resp.text.splitlines()] == ["http://example.org/a", "http://example.org/b"]
+        resp = client_instance.get("/sparql", params={**params, "stream": "true"})
+        assert len(resp.json()["results"]) == 2
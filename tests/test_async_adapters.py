@@ -0,0 +1,109 @@
+import asyncio
+import httpx
+import pytest
+from urllib.parse import parse_qs
+from axiusmem.adapters.base import AsyncBaseTriplestoreAdapter, get_triplestore_adapter_from_env
+from axiusmem.adapters.coalesce import AsyncCoalescingAdapter
+from axiusmem.adapters.jena_adapter import AsyncJenaAdapter
+from axiusmem.graphdb_adapter import AsyncGraphDBAdapter
+
+BINDINGS = [{"s": {"type": "uri", "value": "http://example.org/s"}}]
+
+
+def _mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_graphdb_select_update_and_transactions():
+    requests = []
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/repositories/repo":
+            return httpx.Response(200, json={"results": {"bindings": BINDINGS}})
+        if request.url.path == "/repositories/repo/statements":
+            return httpx.Response(204)
+        if request.url.path == "/repositories/repo/transactions":
+            return httpx.Response(201, json={"transactionId": "tx1"})
+        return httpx.Response(200)
+    async def run():
+        adapter = AsyncGraphDBAdapter("http://graphdb:7200", repository="repo")
+        adapter.client = _mock_client(handler)
+        assert await adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }") == BINDINGS
+        assert await adapter.sparql_update("CLEAR ALL") is True
+        assert await adapter.begin_transaction() == "tx1"
+        assert await adapter.commit_transaction("tx1") is True
+        await adapter.close()
+        assert adapter.client is None
+    asyncio.run(run())
+    assert parse_qs(requests[0].content.decode())["query"] == ["SELECT * WHERE { ?s ?p ?o }"]
+    assert requests[1].content == b"CLEAR ALL"
+
+
+def test_async_jena_concurrent_selects():
+    in_flight, peak = 0, 0
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"head": {}, "results": {"bindings": BINDINGS}})
+    async def run():
+        adapter = AsyncJenaAdapter(host="fuseki", dataset="ds")
+        adapter.client = _mock_client(handler)
+        results = await asyncio.gather(*(adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }") for _ in range(50)))
+        await adapter.close()
+        return results
+    results = asyncio.run(run())
+    assert all(r["results"]["bindings"] == BINDINGS for r in results)
+    assert peak == 50
+    with pytest.raises(NotImplementedError):
+        asyncio.run(AsyncJenaAdapter(host="fuseki", dataset="ds").begin_transaction())
+
+
+def test_factory_builds_async_adapters(monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "graphdb")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://graphdb:7200")
+    adapter = get_triplestore_adapter_from_env(repository="repo", asynchronous=True)
+    # Network adapters come wrapped in request coalescing
+    assert isinstance(adapter, AsyncCoalescingAdapter)
+    assert isinstance(adapter.adapter, AsyncGraphDBAdapter)
+    assert isinstance(adapter, AsyncBaseTriplestoreAdapter)
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "jena")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://fuseki:3030")
+    assert isinstance(get_triplestore_adapter_from_env(repository="ds", asynchronous=True).adapter, AsyncJenaAdapter)
+
+
+def test_async_select_iter_streams_tsv():
+    body = b'?s\n<http://example.org/a>\n<http://example.org/b>\n'
+    def handler(request):
+        assert request.headers["accept"] == "text/tab-separated-values"
+        return httpx.Response(200, content=body)
+    async def run():
+        adapter = AsyncGraphDBAdapter("http://graphdb:7200", repository="repo")
+        adapter.client = _mock_client(handler)
+        rows = [row async for row in adapter.sparql_select_iter("SELECT ?s WHERE { ?s ?p ?o }")]
+        await adapter.close()
+        return rows
+    assert [row["s"]["value"] for row in asyncio.run(run())] == ["http://example.org/a", "http://example.org/b"]
+
+
+def test_async_graphdb_transaction_context_manager():
+    requests = []
+    def handler(request):
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, headers={"Location": "http://graphdb:7200/repositories/repo/transactions/tx-9"})
+        return httpx.Response(200)
+    async def run():
+        adapter = AsyncGraphDBAdapter("http://graphdb:7200", repository="repo")
+        adapter.client = _mock_client(handler)
+        async with adapter.transaction() as tx_id:
+            await adapter.transaction_add(tx_id, [("http://example.org/s", "http://example.org/p", "o")])
+            await adapter.transaction_update(tx_id, "CLEAR ALL")
+        await adapter.close()
+    asyncio.run(run())
+    assert [request.url.params.get("action") for request in requests[1:]] == ["ADD", "UPDATE", "COMMIT"]
+    assert all(request.url.path == "/repositories/repo/transactions/tx-9" for request in requests[1:])
+    with pytest.raises(NotImplementedError):
+        asyncio.run(AsyncJenaAdapter(host="fuseki", dataset="ds").transaction_update("tx", "CLEAR ALL"))
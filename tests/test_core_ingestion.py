@@ -35,4 +35,26 @@ def test_delete_triple(monkeypatch):
     mem.add_triples([triple])
     mem.delete_triple(triple, transaction_time={"from": "2024-06-01"})
     g = mem.get_graph()
-    assert (EX.Alice, EX.knows, EX.Bob) not in g 
\ No newline at end of file
+    assert (EX.Alice, EX.knows, EX.Bob) not in g
+
+def test_add_triples_bitemporal_is_compact():
+    mem = AxiusMEM()
+    before = len(mem.get_graph())
+    mem.add_triples([(EX.Alice, EX.knows, EX.Bob)], valid_time={"from": "2024-01-01"}, transaction_time={"from": "2024-01-01"})
+    g = mem.get_graph()
+    assert len(list(g.subjects(rdflib.RDF.type, rdflib.RDF.Statement))) == 1
+    assert len(g) - before == 7
+
+def test_delete_triple_closes_open_transaction_interval():
+    from axiusmem.temporal import DCTERMS, get_temporal_index, query_as_of
+    mem = AxiusMEM()
+    triple = (EX.Alice, EX.knows, EX.Bob)
+    mem.add_triples([triple], valid_time={"from": "2024-01-01"}, transaction_time={"from": "2024-01-01"})
+    mem.update_triple(triple, (EX.Alice, EX.knows, EX.Carol), transaction_time={"from": "2024-06-01"})
+    g = mem.get_graph()
+    stmts = get_temporal_index(g).statements_for(triple)
+    assert len(stmts) == 1
+    assert g.value(next(iter(stmts)), DCTERMS.modified) is not None
+    assert triple in query_as_of(g, "2024-03-01")
+    assert triple not in query_as_of(g, "2024-07-01")
+    assert (EX.Alice, EX.knows, EX.Carol) in query_as_of(g, "2024-07-01")
@@ -1,3 +1,4 @@
+from datetime import datetime
 import rdflib
 import pytest
 from axiusmem.core import AxiusMEM
@@ -47,7 +48,7 @@ def test_update(mem_with_data):
     DELETE DATA { <http://example.org/Alice> <http://example.org/knows> <http://example.org/Bob> }
     """
     mem_with_data.update(delete_query)
-    assert (EX.Alice, EX.knows, EX.Bob) not in g 
+    assert (EX.Alice, EX.knows, EX.Bob) not in g
 
 def test_select_point_in_time():
     mem = AxiusMEM()
@@ -79,7 +80,7 @@ def test_select_as_of():
     assert {"s": EX.Alice, "o": EX.Bob} not in results
     # Should not find triple after interval
     results, df = mem.select_as_of(query, "2025-01-01")
-    assert {"s": EX.Alice, "o": EX.Bob} not in results 
+    assert {"s": EX.Alice, "o": EX.Bob} not in results
 
 def test_select_interval_valid_time():
     mem = AxiusMEM()
@@ -121,7 +122,7 @@ def test_select_interval_transaction_time():
     # Interval overlaps both
     results, df = mem.select_interval_transaction_time(query, "2024-06-01", "2024-07-15")
     assert {"s": EX.Alice, "o": EX.Bob} in results
-    assert {"s": EX.Bob, "o": EX.Charlie} in results 
+    assert {"s": EX.Bob, "o": EX.Charlie} in results
 
 def test_path_query_point_in_time():
     mem = AxiusMEM()
@@ -176,4 +177,16 @@ def test_aggregate_interval_valid_time():
     assert results[0]["count"].toPython() == 1
     # Both triples in overlapping interval
     results, df = mem.aggregate_interval_valid_time(query, "2024-06-01", "2024-07-15")
-    assert results[0]["count"].toPython() == 2 
\ No newline at end of file
+    assert results[0]["count"].toPython() == 2
+
+def test_select_accepts_datetimes():
+    mem = AxiusMEM()
+    mem.add_triples([(EX.Alice, EX.knows, EX.Bob)], valid_time={"from": datetime(2024, 1, 1), "to": "2024-12-31"},
+                    transaction_time={"from": datetime(2024, 1, 1)})
+    query = "SELECT ?s ?o WHERE { ?s <http://example.org/knows> ?o . }"
+    results, df = mem.select_point_in_time(query, datetime(2024, 6, 1, 12, 30))
+    assert {"s": EX.Alice, "o": EX.Bob} in results
+    results, df = mem.select_as_of(query, datetime(2023, 6, 1))
+    assert results == []
+    results, df = mem.select_interval_valid_time(query, datetime(2024, 12, 31), datetime(2025, 1, 31))
+    assert {"s": EX.Alice, "o": EX.Bob} in results
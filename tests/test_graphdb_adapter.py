@@ -4,7 +4,6 @@ load_dotenv()
 import pytest
 from axiusmem.adapters.base import get_triplestore_adapter_from_env
 import tempfile
-import tenacity
 import requests
 from unittest.mock import patch
 
@@ -268,17 +267,17 @@ def always_fail(*args, **kwargs):
 
 @graphdb_only
 def test_graphdb_retry_on_network_failure():
-    """Test that GraphDBAdapter methods retry and raise RetryError on repeated network failure."""
+    """Test that GraphDBAdapter methods retry and raise RequestException on repeated network failure."""
     adapter = get_triplestore_adapter_from_env()
     repo_id = os.getenv("TRIPLESTORE_REPOSITORY", "testrepo")
     with patch.object(adapter.session, "post", side_effect=always_fail):
-        with pytest.raises(tenacity.RetryError):
+        with pytest.raises(requests.exceptions.RequestException):
             adapter.sparql_select(repo_id, "SELECT * WHERE { ?s ?p ?o } LIMIT 1")
     with patch.object(adapter.session, "post", side_effect=always_fail):
-        with pytest.raises(tenacity.RetryError):
+        with pytest.raises(requests.exceptions.RequestException):
             adapter.sparql_update(repo_id, "INSERT DATA { <urn:test:s> <urn:test:p> 'fail' }")
     with patch.object(adapter.session, "post", side_effect=always_fail):
-        with pytest.raises(tenacity.RetryError):
+        with pytest.raises(requests.exceptions.RequestException):
             adapter.bulk_load(repo_id, "docs/axiusmem_ontology.ttl")
 
 @jena_only
@@ -0,0 +1,90 @@
+import rdflib
+import pytest
+from rdflib.compare import isomorphic
+from axiusmem.core import AxiusMEM
+from axiusmem.ingest import iter_triple_batches
+
+EX = rdflib.Namespace("http://example.org/")
+
+TURTLE = '''@prefix ex: <http://example.org/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+# a comment ending in a dot.
+ex:Alice ex:knows ex:Bob , ex:Carol ;
+    ex:age 42 ;
+    ex:height 1.75 .
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+ex:Bob foaf:name """Bob
+spans . lines.""" ;
+    ex:address [ ex:city "Paris" ; ex:zip "75001" ] .
+_:x ex:knows _:y .
+_:y ex:knows _:x .
+ex:Carol ex:list ( 1 2 3 ) ; ex:since "2024-01-01"^^xsd:date .
+'''
+
+def _read(path, fmt, **kwargs):
+    g = rdflib.Graph()
+    for batch in iter_triple_batches(str(path), format=fmt, **kwargs):
+        for triple in batch:
+            g.add(triple)
+    return g
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_turtle_chunks_match_full_parse(tmp_path, chunk_size):
+    path = tmp_path / "data.ttl"
+    path.write_text(TURTLE, encoding="utf-8")
+    expected = rdflib.Graph().parse(str(path), format="turtle")
+    assert isomorphic(_read(path, "turtle", batch_size=3, chunk_size=chunk_size), expected)
+
+def test_turtle_syntax_error(tmp_path):
+    path = tmp_path / "bad.ttl"
+    path.write_text("@prefix ex: <http://example.org/> .\nex:a ex:b ex:c .\nex:a ex:b ;; .\n", encoding="utf-8")
+    with pytest.raises(Exception):
+        _read(path, "turtle", chunk_size=8)
+
+def test_ntriples_and_nquads_batches(tmp_path):
+    lines = [f"<http://example.org/s{i}> <http://example.org/p> \"{i}\" ." for i in range(25)]
+    nt = tmp_path / "data.nt"
+    nt.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    nq = tmp_path / "data.nq"
+    nq.write_text("\n".join(line[:-1] + "<http://example.org/g> ." for line in lines), encoding="utf-8")
+    seen = []
+    batches = list(iter_triple_batches(str(nt), format="nt", batch_size=10, progress=lambda n, b: seen.append((n, b))))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert seen[-1] == (25, nt.stat().st_size)
+    assert batches[0][0] == (EX.s0, EX.p, rdflib.Literal("0"))
+    assert set(_read(nq, "nquads")) == {t for batch in batches for t in batch}
+
+def test_bulk_load_streams_with_temporal_data(tmp_path):
+    path = tmp_path / "data.nt"
+    path.write_text("".join(f"<http://example.org/s{i}> <http://example.org/p> <http://example.org/o> .\n" for i in range(30)))
+    mem = AxiusMEM()
+    progress = []
+    loaded = mem.bulk_load(str(path), format="nt", valid_time={"from": "2024-01-01"}, batch_size=8, progress=lambda n, b: progress.append(n))
+    assert loaded == 30
+    assert progress == [8, 16, 24, 30]
+    result = mem.select_point_in_time("SELECT ?s WHERE { ?s <http://example.org/p> ?o }", "2024-06-01")
+    assert len(result[0]) == 30
+
+def _without_bnodes(triples):
+    return [tuple(None if isinstance(term, rdflib.BNode) else term for term in triple) for triple in triples]
+
+@pytest.mark.parametrize("fmt", ["nt", "nquads"])
+def test_parallel_parse_matches_serial(tmp_path, fmt):
+    graph = " <http://example.org/g>" if fmt == "nquads" else ""
+    lines = []
+    for i in range(200):
+        lines.append(f"<http://example.org/s{i}> <http://example.org/p> _:b{i % 7}{graph} .")
+        lines.append(f"_:b{i % 7} <http://example.org/label> \"node {i}\"@en{graph} .")
+    path = tmp_path / f"data.{fmt}"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    serial = [t for batch in iter_triple_batches(str(path), format=fmt, batch_size=50) for t in batch]
+    seen = []
+    batches = list(iter_triple_batches(str(path), format=fmt, batch_size=50, workers=2, segment_size=512,
+                                       progress=lambda n, b: seen.append((n, b))))
+    parallel = [t for batch in batches for t in batch]
+    assert [len(batch) for batch in batches] == [50] * 8
+    assert seen[-1] == (400, path.stat().st_size)
+    assert _without_bnodes(parallel) == _without_bnodes(serial)
+    # Blank node labels map to the same node in every segment
+    assert len({o for _, p, o in parallel if p == EX.p}) == 7
+    assert isomorphic(_read(path, fmt), _read(path, fmt, workers=2, segment_size=512))
@@ -0,0 +1,81 @@
+import threading
+import pytest
+import requests
+from fastapi.testclient import TestClient
+import rdflib
+from axiusmem import metrics
+from axiusmem.adapters.resilience import DEFAULT_POLICY, guarded
+from axiusmem.api import create_app
+
+
+def test_counter_sums_per_thread_shards():
+    counter = metrics.Counter("test_total", "Test.", ["kind"])
+    def work():
+        for _ in range(1000):
+            counter.inc(kind="a")
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(2, kind="b")
+    assert counter.values() == {("a",): 4000.0, ("b",): 2.0}
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = metrics.MetricsRegistry()
+    histogram = metrics.Histogram("test_seconds", "Test latency.", ["path"], registry, buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, path='/a"b')
+    with pytest.raises(ValueError):
+        metrics.Histogram("test_seconds", "Again.", registry=registry)
+    assert registry.render().splitlines() == [
+        "# HELP test_seconds Test latency.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{path="/a\\"b",le="0.1"} 1',
+        'test_seconds_bucket{path="/a\\"b",le="1"} 3',
+        'test_seconds_bucket{path="/a\\"b",le="+Inf"} 4',
+        'test_seconds_sum{path="/a\\"b"} 4.25',
+        'test_seconds_count{path="/a\\"b"} 4',
+    ]
+
+
+class FakeAdapter:
+    url = "http://metrics-store"
+
+    @guarded("query")
+    def sparql_select(self, fail=False):
+        if fail:
+            raise requests.exceptions.HTTPError("400 error")
+        return []
+
+
+def test_guarded_adapter_calls_are_timed_and_errors_counted(monkeypatch):
+    monkeypatch.setattr(DEFAULT_POLICY, "base_delay", 0)
+    before = metrics.ADAPTER_LATENCY.totals().get(("FakeAdapter", "sparql_select"), [0] * 16)[-1]
+    adapter = FakeAdapter()
+    adapter.sparql_select()
+    with pytest.raises(requests.exceptions.HTTPError):
+        adapter.sparql_select(fail=True)
+    assert metrics.ADAPTER_LATENCY.totals()[("FakeAdapter", "sparql_select")][-1] == before + 2
+    assert metrics.ADAPTER_ERRORS.value(adapter="FakeAdapter", method="sparql_select", error="HTTPError") >= 1
+    assert metrics.ADAPTER_IN_FLIGHT.value(adapter="FakeAdapter") == 0
+    DEFAULT_POLICY.reset()
+
+
+def test_metrics_endpoint_serves_prometheus_text(monkeypatch):
+    monkeypatch.setenv("AXIUSMEM_ADMIN_PASSWORD", "adminpw")
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    with TestClient(create_app(graph=rdflib.Graph())) as client:
+        token = client.post("/token", data={"username": "admin", "password": "adminpw"}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"}).status_code == 200
+        resp = client.get("/metrics", headers=headers)
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = resp.text
+        assert 'axiusmem_http_requests_total{method="GET",path="/sparql",status="200"}' in text
+        assert 'axiusmem_http_request_duration_seconds_bucket{method="GET",path="/sparql",le="+Inf"}' in text
+        assert "# TYPE axiusmem_http_requests_in_flight gauge" in text
+        assert 'axiusmem_auth_total{result="success"} 1' in text
+        assert "axiusmem_sparql_cache_hits_total 0" in text
+        assert "uptime_seconds" in client.get("/metrics", headers={**headers, "Accept": "application/json"}).json()
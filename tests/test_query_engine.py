@@ -1,6 +1,7 @@
 import rdflib
 import pytest
-from axiusmem.query_engine import sparql_select, sparql_construct, sparql_update
+from axiusmem.query_engine import rewrite_temporal_query, sparql_select, sparql_construct, sparql_update
+from axiusmem.temporal import AXM, add_transaction_time, add_valid_time
 
 EX = rdflib.Namespace("http://example.org/")
 
@@ -44,4 +45,58 @@ def test_sparql_update(sample_graph):
     DELETE DATA { <http://example.org/Alice> <http://example.org/knows> <http://example.org/Bob> }
     """
     sparql_update(sample_graph, delete_query)
-    assert (EX.Alice, EX.knows, EX.Bob) not in sample_graph 
\ No newline at end of file
+    assert (EX.Alice, EX.knows, EX.Bob) not in sample_graph
+
+@pytest.fixture
+def temporal_graph():
+    g = rdflib.Graph()
+    add_valid_time(g, (EX.Alice, EX.knows, EX.Bob), "2024-01-01", "2024-06-30")
+    add_valid_time(g, (EX.Bob, EX.knows, EX.Charlie), "2024-07-01")
+    # Two overlapping statements for the same triple must not duplicate solutions
+    add_valid_time(g, (EX.Bob, EX.knows, EX.Charlie), "2024-08-01")
+    add_transaction_time(g, (EX.Alice, EX.knows, EX.Bob), "2024-01-01", "2024-03-01")
+    add_transaction_time(g, (EX.Bob, EX.knows, EX.Charlie), "2024-02-01")
+    return g
+
+@pytest.mark.parametrize("kwargs, expected", [
+    ({"valid_time": "2024-03-01"}, {(EX.Alice, EX.Bob)}),
+    ({"valid_time": "2024-09-01"}, {(EX.Bob, EX.Charlie)}),
+    ({"valid_interval": ("2024-06-15", "2024-07-15")}, {(EX.Alice, EX.Bob), (EX.Bob, EX.Charlie)}),
+    ({"as_of": "2024-02-15"}, {(EX.Alice, EX.Bob), (EX.Bob, EX.Charlie)}),
+    ({"as_of": "2024-04-01"}, {(EX.Bob, EX.Charlie)}),
+    ({"valid_time": "2024-03-01", "as_of": "2024-04-01"}, set()),
+    ({"transaction_interval": ("2023-01-01", "2024-01-15")}, {(EX.Alice, EX.Bob)}),
+])
+def test_rewrite_temporal_query_matches_local_semantics(temporal_graph, kwargs, expected):
+    query = "SELECT ?s ?o WHERE { ?s <http://example.org/knows> ?o }"
+    results, df = sparql_select(temporal_graph, rewrite_temporal_query(query, **kwargs))
+    rows = [(r["s"], r["o"]) for r in results]
+    assert len(rows) == len(set(rows))
+    assert set(rows) == expected
+
+def test_rewrite_temporal_query_ground_pattern_and_errors(temporal_graph):
+    query = "SELECT (COUNT(*) AS ?n) WHERE { <http://example.org/Alice> <http://example.org/knows> <http://example.org/Bob> }"
+    results, df = sparql_select(temporal_graph, rewrite_temporal_query(query, valid_time="2024-03-01"))
+    assert results[0]["n"].toPython() == 1
+    results, df = sparql_select(temporal_graph, rewrite_temporal_query(query, valid_time="2024-09-01"))
+    assert results[0]["n"].toPython() == 0
+    with pytest.raises(ValueError):
+        rewrite_temporal_query(query)
+    with pytest.raises(ValueError):
+        rewrite_temporal_query("SELECT ?o WHERE { ?s <http://example.org/knows>+ ?o }", valid_time="2024-03-01")
+    with pytest.raises(ValueError):
+        rewrite_temporal_query("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }", valid_time="2024-03-01")
+
+def test_rewrite_temporal_query_matches_plain_string_timestamps():
+    g = rdflib.Graph()
+    stmt = rdflib.BNode()
+    g.add((stmt, rdflib.RDF.subject, EX.Alice))
+    g.add((stmt, rdflib.RDF.predicate, EX.knows))
+    g.add((stmt, rdflib.RDF.object, EX.Bob))
+    g.add((stmt, AXM.validFrom, rdflib.Literal("2024-01-01T00:00:00Z")))
+    g.add((stmt, AXM.validTo, rdflib.Literal("2024-06-30T00:00:00Z")))
+    query = "SELECT ?o WHERE { <http://example.org/Alice> <http://example.org/knows> ?o }"
+    results, df = sparql_select(g, rewrite_temporal_query(query, valid_time="2024-03-01"))
+    assert [r["o"] for r in results] == [EX.Bob]
+    results, df = sparql_select(g, rewrite_temporal_query(query, valid_time="2024-09-01"))
+    assert results == []
@@ -0,0 +1,123 @@
+import pytest
+from rdflib import Literal, URIRef
+from axiusmem.adapters.base import get_triplestore_adapter_from_env
+from axiusmem.adapters.rdflib_adapter import RDFLibAdapter
+
+EX = "http://example.org/"
+
+
+@pytest.fixture
+def adapter():
+    adapter = RDFLibAdapter()
+    yield adapter
+    adapter.close()
+
+
+def test_select_ask_and_update(adapter):
+    assert adapter.test_connection()
+    assert adapter.sparql_update(f'INSERT DATA {{ GRAPH <{EX}g> {{ <{EX}a> <{EX}p> "chat"@fr , 42 }} }}')
+    rows = adapter.sparql_select(f"SELECT ?o WHERE {{ <{EX}a> <{EX}p> ?o }} ORDER BY ?o")
+    assert {"type": "literal", "value": "chat", "xml:lang": "fr"} in [row["o"] for row in rows]
+    assert {"type": "literal", "value": "42", "datatype": "http://www.w3.org/2001/XMLSchema#integer"} in [row["o"] for row in rows]
+    assert adapter.sparql_select("ASK { ?s ?p ?o }") == {"head": {}, "boolean": True}
+    assert adapter.sparql_select(f"SELECT ?s ?x WHERE {{ ?s ?p ?o OPTIONAL {{ ?s <{EX}none> ?x }} }} LIMIT 1") == [{"s": {"type": "uri", "value": EX + "a"}}]
+    with pytest.raises(ValueError):
+        adapter.sparql_select("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+
+
+def test_named_graphs(adapter):
+    adapter.create_named_graph(EX + "empty")
+    adapter.add_triples_to_named_graph(EX + "g", [(EX + "s", EX + "p", 'say "hi"'), (URIRef(EX + "s"), URIRef(EX + "q"), Literal(1))])
+    assert set(adapter.list_named_graphs()) == {EX + "empty", EX + "g"}
+    rows = adapter.get_triples_from_named_graph(EX + "g", f"?s <{EX}p> ?o")
+    assert rows[0]["o"] == {"type": "literal", "value": 'say "hi"'}
+    adapter.clear_named_graph(EX + "g")
+    assert adapter.get_triples_from_named_graph(EX + "g", "?s ?p ?o") == []
+    adapter.delete_named_graph(EX + "empty")
+    assert EX + "empty" not in adapter.list_named_graphs()
+
+
+def test_bulk_load(adapter, tmp_path):
+    path = tmp_path / "data.ttl"
+    path.write_text(f'<{EX}a> <{EX}p> "x" .\n')
+    assert adapter.bulk_load(str(path), "text/turtle", graph_uri=EX + "g")
+    assert adapter.get_triples_from_named_graph(EX + "g", "?s ?p ?o")[0]["o"]["value"] == "x"
+    quads = tmp_path / "data.nq"
+    quads.write_text(f'<{EX}b> <{EX}p> "y" <{EX}h> .\n')
+    adapter.bulk_load(str(quads), "application/n-quads")
+    assert EX + "h" in adapter.list_named_graphs()
+
+
+def test_transactions_commit_and_rollback(adapter):
+    adapter.add_triples_to_named_graph(EX + "g", [(EX + "a", EX + "p", "kept")])
+    tx_id = adapter.begin_transaction()
+    adapter.transaction_add(tx_id, [(EX + "b", EX + "p", "discarded")], EX + "h")
+    adapter.transaction_update(tx_id, f"DELETE WHERE {{ GRAPH <{EX}g> {{ ?s ?p ?o }} }}")
+    # Buffered writes are not visible before commit
+    assert [row["o"]["value"] for row in adapter.sparql_select("SELECT ?o WHERE { ?s ?p ?o }")] == ["kept"]
+    # Writes made by other clients meanwhile survive the rollback
+    adapter.add_triples_to_named_graph(EX + "g", [(EX + "c", EX + "p", "concurrent")])
+    assert adapter.rollback_transaction(tx_id)
+    rows = adapter.sparql_select("SELECT ?o WHERE { ?s ?p ?o } ORDER BY ?o")
+    assert [row["o"]["value"] for row in rows] == ["concurrent", "kept"]
+    assert EX + "h" not in adapter.list_named_graphs()
+    tx_id, other = adapter.begin_transaction(), adapter.begin_transaction()
+    adapter.transaction_add(tx_id, [(EX + "b", EX + "p", "added")], EX + "h")
+    adapter.transaction_remove(other, [(EX + "c", EX + "p", "concurrent")])
+    assert adapter.commit_transaction(tx_id) and adapter.commit_transaction(other)
+    with pytest.raises(KeyError):
+        adapter.commit_transaction(tx_id)
+    rows = adapter.sparql_select("SELECT ?o WHERE { ?s ?p ?o } ORDER BY ?o")
+    assert [row["o"]["value"] for row in rows] == ["added", "kept"]
+
+
+def test_failed_commit_leaves_no_trace(adapter):
+    adapter.add_triples_to_named_graph(EX + "g", [(EX + "a", EX + "p", "kept")])
+    with pytest.raises(Exception):
+        adapter.transaction_update(adapter.begin_transaction(), "NOT SPARQL")
+    tx_id = adapter.begin_transaction()
+    adapter.transaction_remove(tx_id, [(EX + "a", EX + "p", "kept")], EX + "g")
+    adapter.transaction_add(tx_id, [(EX + "b", EX + "p", "new")], EX + "h")
+    # Fails at commit: LOAD of a missing file
+    adapter.transaction_update(tx_id, f"INSERT DATA {{ GRAPH <{EX}i> {{ <{EX}c> <{EX}p> 1 }} }} ; LOAD <file:///no/such/file.ttl>")
+    with pytest.raises(Exception):
+        adapter.commit_transaction(tx_id)
+    assert [row["o"]["value"] for row in adapter.sparql_select("SELECT ?o WHERE { ?s ?p ?o }")] == ["kept"]
+    assert set(adapter.list_named_graphs()) == {EX + "g"}
+    tx_id = adapter.begin_transaction()
+    adapter.transaction_update(tx_id, f"CLEAR ALL ; DROP GRAPH <{EX}g> ; LOAD <file:///no/such/file.ttl>")
+    with pytest.raises(Exception):
+        adapter.commit_transaction(tx_id)
+    assert adapter.get_triples_from_named_graph(EX + "g", "?s ?p ?o")[0]["o"]["value"] == "kept"
+
+
+def test_commit_does_not_scan_the_dataset(adapter, monkeypatch):
+    adapter.add_triples_to_named_graph(EX + "g", [(EX + "a", EX + "p", "kept")])
+    tx_id = adapter.begin_transaction()
+    adapter.transaction_update(tx_id, f"INSERT DATA {{ GRAPH <{EX}h> {{ <{EX}b> <{EX}p> 1 }} }}")
+    def scan(*args):
+        raise AssertionError("full dataset scan")
+    monkeypatch.setattr(adapter.dataset, "quads", scan)
+    assert adapter.commit_transaction(tx_id)
+    monkeypatch.undo()
+    assert set(adapter.list_named_graphs()) == {EX + "g", EX + "h"}
+
+
+def test_missing_store_plugin():
+    adapter = RDFLibAdapter(path="/tmp/axiusmem-store", store="NoSuchStore")
+    with pytest.raises(ValueError):
+        adapter.connect()
+    assert adapter.test_connection() is False
+
+
+def test_factory_selects_rdflib(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "rdflib")
+    monkeypatch.delenv("TRIPLESTORE_PATH", raising=False)
+    monkeypatch.delenv("TRIPLESTORE_STORE", raising=False)
+    adapter = get_triplestore_adapter_from_env(asynchronous=True)
+    assert isinstance(adapter, RDFLibAdapter) and adapter.path is None and adapter.store == "Memory"
+    monkeypatch.setenv("TRIPLESTORE_PATH", str(tmp_path))
+    adapter = get_triplestore_adapter_from_env(repository="repo")
+    assert adapter.path == str(tmp_path / "repo") and adapter.store == "BerkeleyDB"
+    monkeypatch.setenv("TRIPLESTORE_REPOSITORY", "fallback")
+    assert get_triplestore_adapter_from_env().path == str(tmp_path / "fallback")
@@ -0,0 +1,191 @@
+import asyncio
+import httpx
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from axiusmem.adapters.jena_adapter import AsyncJenaAdapter
+from axiusmem.adapters.resilience import (
+    DEFAULT_POLICY, CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy, guarded, is_retryable,
+)
+from axiusmem.api import create_app
+from axiusmem.graphdb_adapter import AsyncGraphDBAdapter
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    monkeypatch.setattr(DEFAULT_POLICY, "base_delay", 0)
+    DEFAULT_POLICY.reset()
+    yield DEFAULT_POLICY
+    DEFAULT_POLICY.reset()
+
+
+@pytest.mark.parametrize("exc, idempotent, expected", [
+    (requests.exceptions.ConnectTimeout("connect"), False, True),
+    (requests.exceptions.ReadTimeout("read"), True, True),
+    (requests.exceptions.ReadTimeout("read"), False, False),
+    (http_error(503), True, True),
+    (http_error(503), False, False),
+    (http_error(400), True, False),
+    (http_error(404), True, False),
+    (http_error(500), True, False),
+    (httpx.ConnectError("refused"), False, True),
+    (httpx.ReadTimeout("read"), True, True),
+    (ValueError("bad"), True, False),
+])
+def test_is_retryable(exc, idempotent, expected):
+    assert is_retryable(exc, idempotent) is expected
+
+
+def test_circuit_breaker_opens_and_probes(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("axiusmem.adapters.resilience.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker("ep", failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.before_call()
+    assert info.value.retry_after == 10
+    clock[0] += 10
+    breaker.before_call()  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_success()
+    breaker.before_call()
+    assert breaker.snapshot() == {"state": "closed", "failures": 0, "rejected": 2}
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, min_tokens=1)
+    assert budget.withdraw() and not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw() and budget.exhausted == 1
+
+
+class FakeAdapter:
+    url = "http://store"
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    @guarded("query")
+    def select(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "rows"
+
+    @guarded("query")
+    def list_things(self):
+        return self.select()
+
+    @guarded("update", idempotent=False)
+    def update(self):
+        self.calls += 1
+        raise self.errors.pop(0)
+
+
+def test_guarded_retries_once_per_call_without_stacking(policy):
+    adapter = FakeAdapter([requests.exceptions.ConnectionError("reset")] * 2)
+    assert adapter.select() == "rows" and adapter.calls == 3
+    adapter = FakeAdapter([requests.exceptions.ConnectionError("reset")] * 10)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        adapter.list_things()
+    # The nested guarded call does not retry on its own: 3 attempts, not 9
+    assert adapter.calls == 3
+
+
+def test_guarded_does_not_retry_client_errors_or_unsafe_updates(policy):
+    adapter = FakeAdapter([http_error(400)])
+    with pytest.raises(requests.exceptions.HTTPError):
+        adapter.select()
+    assert adapter.calls == 1
+    adapter = FakeAdapter([requests.exceptions.ReadTimeout("read")])
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        adapter.update()
+    assert adapter.calls == 1
+    adapter = FakeAdapter([requests.exceptions.ConnectTimeout("connect"), requests.exceptions.ReadTimeout("read")])
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        adapter.update()
+    assert adapter.calls == 2
+
+
+def test_breaker_fails_fast_after_repeated_failures():
+    policy = RetryPolicy(max_attempts=1, failure_threshold=3, reset_timeout=60)
+    calls = []
+    def fail():
+        calls.append(1)
+        raise requests.exceptions.ConnectionError("down")
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            policy.call("http://store query", fail)
+    with pytest.raises(CircuitOpenError):
+        policy.call("http://store query", fail)
+    assert len(calls) == 3
+    # Other endpoints keep their own breaker
+    assert policy.call("http://other query", lambda: "ok") == "ok"
+    assert policy.breakers()["http://store query"]["state"] == "open"
+
+
+def test_async_adapter_retries_gateway_errors(policy):
+    statuses = [503, 200]
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"head": {}, "results": {"bindings": []}})
+    async def run():
+        adapter = AsyncJenaAdapter(host="fuseki", dataset="ds")
+        adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        result = await adapter.sparql_select("SELECT * WHERE { ?s ?p ?o }")
+        await adapter.close()
+        return result
+    assert asyncio.run(run())["results"]["bindings"] == []
+    assert statuses == []
+    assert policy.breakers() == {"http://fuseki:3030/ds query": {"state": "closed", "failures": 0, "rejected": 0}}
+
+
+
+def test_streamed_select_retries_opening_the_stream(policy):
+    statuses = [503, 503, 200]
+    def handler(request):
+        return httpx.Response(statuses.pop(0), content=b"?s\n<http://example.org/a>\n")
+    async def run():
+        rows = []
+        for adapter in (AsyncGraphDBAdapter("http://graphdb:7200", repository="repo"), AsyncJenaAdapter(host="fuseki", dataset="ds")):
+            adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            rows.append([row async for row in adapter.sparql_select_iter("SELECT ?s WHERE { ?s ?p ?o }")])
+            statuses[:] = [200]
+            await adapter.close()
+        return rows
+    assert asyncio.run(run()) == [[{"s": {"type": "uri", "value": "http://example.org/a"}}]] * 2
+    assert policy.breakers()["http://graphdb:7200 query"]["failures"] == 0
+    statuses[:] = [400]
+    async def rejected():
+        adapter = AsyncJenaAdapter(host="fuseki", dataset="ds")
+        adapter.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return [row async for row in adapter.sparql_select_iter("SELECT")]
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(rejected())
+    assert statuses == []
+
+def test_api_reports_breakers_and_maps_open_circuit_to_503(policy, monkeypatch):
+    monkeypatch.setenv("TRIPLESTORE_TYPE", "graphdb")
+    monkeypatch.setenv("TRIPLESTORE_URL", "http://graphdb:7200")
+    monkeypatch.setenv("TRIPLESTORE_COALESCE", "false")
+    breaker, _ = policy.endpoint("http://graphdb:7200 query")
+    for _ in range(policy.failure_threshold):
+        breaker.record_failure()
+    with TestClient(create_app()) as client:
+        async def unreachable(self):
+            return False
+        monkeypatch.setattr(AsyncGraphDBAdapter, "test_connection", unreachable)
+        assert client.get("/health").json()["circuit_breakers"] == {"http://graphdb:7200 query": "open"}
+        resp = client.get("/sparql", params={"query": "SELECT * WHERE { ?s ?p ?o }"})
+        assert resp.status_code == 503
+        assert int(resp.headers["Retry-After"]) >= 1
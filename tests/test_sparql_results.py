@@ -0,0 +1,62 @@
+import pytest
+from axiusmem.adapters.sparql_results import XSD, iter_lines, iter_tsv_bindings, parse_tsv_term, result_bindings
+
+@pytest.mark.parametrize("field, expected", [
+    ("", None),
+    ("<http://example.org/a>", {"type": "uri", "value": "http://example.org/a"}),
+    ("_:b0", {"type": "bnode", "value": "b0"}),
+    ('"chat"@fr', {"type": "literal", "value": "chat", "xml:lang": "fr"}),
+    ('"a\\tb\\nc \\"q\\""', {"type": "literal", "value": 'a\tb\nc "q"'}),
+    ('"2024-01-01"^^<http://www.w3.org/2001/XMLSchema#date>', {"type": "literal", "value": "2024-01-01", "datatype": XSD + "date"}),
+    ("42", {"type": "literal", "value": "42", "datatype": XSD + "integer"}),
+    ("-1.5", {"type": "literal", "value": "-1.5", "datatype": XSD + "decimal"}),
+    ("1.0E6", {"type": "literal", "value": "1.0E6", "datatype": XSD + "double"}),
+    ("true", {"type": "literal", "value": "true", "datatype": XSD + "boolean"}),
+])
+def test_parse_tsv_term(field, expected):
+    assert parse_tsv_term(field) == expected
+
+def test_parse_tsv_term_invalid():
+    with pytest.raises(ValueError):
+        parse_tsv_term("not a term")
+
+def test_iter_tsv_bindings_across_chunk_boundaries():
+    body = '?s\t?o\n<http://example.org/a>\t"x y"\n<http://example.org/b>\t\r\n'
+    chunks = [body[i:i + 5] for i in range(0, len(body), 5)]
+    assert list(iter_lines(["a\nb", "c\n", "d"])) == ["a", "bc", "d"]
+    assert list(iter_tsv_bindings(chunks)) == [
+        {"s": {"type": "uri", "value": "http://example.org/a"}, "o": {"type": "literal", "value": "x y"}},
+        {"s": {"type": "uri", "value": "http://example.org/b"}},
+    ]
+
+def test_result_bindings():
+    rows = [{"s": {"type": "uri", "value": "http://example.org/a"}}]
+    assert result_bindings(rows) == rows
+    assert result_bindings({"head": {"vars": ["s"]}, "results": {"bindings": rows}}) == rows
+    assert result_bindings({"head": {}, "boolean": True}) == []
+
+def test_graphdb_and_jena_select_iter_stream_tsv():
+    from axiusmem.graphdb_adapter import GraphDBAdapter
+    from axiusmem.adapters.jena_adapter import JenaAdapter
+    calls = []
+    class FakeResponse:
+        encoding = None
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+        def raise_for_status(self):
+            pass
+        def iter_content(self, chunk_size, decode_unicode):
+            yield "?s\n<http://example.org/a>\n"
+            yield "<http://example.org/b>\n"
+    class FakeSession:
+        def post(self, url, **kwargs):
+            calls.append(kwargs)
+            return FakeResponse()
+    for adapter in (GraphDBAdapter("http://graphdb:7200", repository="repo"), JenaAdapter(dataset="ds")):
+        adapter.session = FakeSession()
+        adapter.base_url = "http://fuseki:3030/ds"
+        rows = list(adapter.sparql_select_iter("SELECT ?s WHERE { ?s ?p ?o }"))
+        assert [row["s"]["value"] for row in rows] == ["http://example.org/a", "http://example.org/b"]
+    assert all(call["stream"] and call["headers"]["Accept"] == "text/tab-separated-values" for call in calls)
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import pytest
+from axiusmem.tasks import TaskCancelled, TaskManager, TaskNotCancellable, TaskQueueFull
+
+
+def test_tasks_run_with_bounded_workers_and_report_progress():
+    async def run():
+        manager = TaskManager(workers=1)
+        gate = asyncio.Event()
+        async def job(task):
+            task.report(1, 2, "half way")
+            await gate.wait()
+            task.report(2)
+            return "ok"
+        first, second = manager.submit("a", job), manager.submit("b", job, x=1)
+        await asyncio.sleep(0.01)
+        states = [first.state, second.state]
+        progress = first.to_dict()["progress"]
+        gate.set()
+        await asyncio.sleep(0.01)
+        return states, progress, first, second, manager
+    states, progress, first, second, manager = asyncio.run(run())
+    assert states == ["running", "queued"]
+    assert progress == {"done": 1, "total": 2, "fraction": 0.5, "message": "half way"}
+    assert first.result == "ok" and second.state == "succeeded" and second.params == {"x": 1}
+    assert manager.list() == [] and len(manager.list(include_finished=True)) == 2
+
+
+def test_cancel_running_queued_and_threaded_tasks():
+    async def run():
+        manager = TaskManager(workers=1)
+        started = threading.Event()
+        stop = threading.Event()
+        def blocking(task):
+            started.set()
+            stop.wait()
+            task.report(1)  # raises once cancelled
+        async def threaded(task):
+            await asyncio.to_thread(blocking, task)
+        async def forever(task):
+            await asyncio.sleep(60)
+        running = manager.submit("threaded", threaded)
+        queued = manager.submit("forever", forever)
+        await asyncio.to_thread(started.wait)
+        manager.cancel(queued.id)
+        manager.cancel(running.id)
+        await asyncio.sleep(0.01)
+        stop.set()
+        return running, queued, manager
+    running, queued, manager = asyncio.run(run())
+    assert running.state == "cancelled" and queued.state == "cancelled" and queued.started_at is None
+    with pytest.raises(TaskCancelled):
+        running.report(2)
+    assert manager.cancel("unknown") is None
+
+
+def test_failed_tasks_queue_limit_and_retention():
+    async def run():
+        manager = TaskManager(workers=1, max_pending=1, max_retained=1)
+        async def fail(task):
+            raise ValueError("bad input")
+        task = manager.submit("fail", fail)
+        with pytest.raises(TaskQueueFull):
+            manager.submit("fail", fail)
+        await asyncio.sleep(0.01)
+        later = manager.submit("fail", fail)
+        await asyncio.sleep(0.01)
+        return task, later, manager
+    task, later, manager = asyncio.run(run())
+    assert task.state == "failed" and task.error == "bad input"
+    # Only the most recent finished task is retained
+    assert manager.get(task.id) is None and manager.get(later.id) is later
+    assert manager.counts()["failed"] == 1
+
+
+def test_uninterruptible_block_refuses_cancellation():
+    async def run():
+        manager = TaskManager(workers=1)
+        started = threading.Event()
+        stop = threading.Event()
+        def blocking():
+            started.set()
+            stop.wait()
+        async def job(task):
+            with task.uninterruptible():
+                await asyncio.to_thread(blocking)
+            return "done"
+        task = manager.submit("clear", job)
+        await asyncio.to_thread(started.wait)
+        with pytest.raises(TaskNotCancellable):
+            manager.cancel(task.id)
+        stop.set()
+        await manager.shutdown()
+        # Cancelled before the block starts: the block never runs
+        queued = manager.submit("clear", job)
+        manager.cancel(queued.id)
+        await asyncio.sleep(0.01)
+        return task, queued
+    task, queued = asyncio.run(run())
+    assert task.state == "succeeded" and task.result == "done"
+    assert queued.state == "cancelled"
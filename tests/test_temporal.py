@@ -1,6 +1,12 @@
+from datetime import datetime, timezone
 import rdflib
 import pytest
-from axiusmem.temporal import add_valid_time, add_transaction_time, query_point_in_time, query_as_of
+from rdflib.compare import isomorphic
+from axiusmem.temporal import (
+    AXM, add_bitemporal, add_temporal_triples, add_transaction_time, add_valid_time, attach_temporal_index,
+    close_transaction_time, compact_reification, get_temporal_index, invalidate_temporal_index, query_as_of,
+    query_interval_transaction_time, query_interval_valid_time, query_point_in_time, temporal_view, to_epoch,
+)
 
 EX = rdflib.Namespace("http://example.org/")
 
@@ -50,4 +56,170 @@ def test_transaction_time_open_interval():
     assert (EX.Alice, EX.knows, EX.Bob) in query_as_of(g, "2024-06-01")
     assert (EX.Alice, EX.knows, EX.Bob) in query_as_of(g, "2025-01-01")
     # Should not retrieve triple for a transaction time before transaction_from
-    assert (EX.Alice, EX.knows, EX.Bob) not in query_as_of(g, "2023-12-31") 
\ No newline at end of file
+    assert (EX.Alice, EX.knows, EX.Bob) not in query_as_of(g, "2023-12-31")
+
+def test_indexed_queries_match_scan():
+    scanned = rdflib.Graph()
+    indexed = rdflib.Graph()
+    attach_temporal_index(indexed)
+    for i in range(1, 13):
+        triple = (EX[f"s{i}"], EX.knows, EX[f"o{i}"])
+        valid_to = None if i % 4 == 0 else f"2024-{i:02d}-28"
+        for g in (scanned, indexed):
+            add_valid_time(g, triple, valid_from=f"2024-{i:02d}-01", valid_to=valid_to)
+    for time in ("2023-12-31", "2024-03-15", "2024-08-28", "2025-01-01"):
+        assert set(query_point_in_time(indexed, time)) == set(query_point_in_time(scanned, time))
+    for start, end in (("2024-02-15", "2024-05-02"), ("2024-12-29", "2025-06-01")):
+        assert set(query_interval_valid_time(indexed, start, end)) == set(query_interval_valid_time(scanned, start, end))
+
+def test_attach_index_to_existing_graph_and_invalidate():
+    g = rdflib.Graph()
+    add_valid_time(g, (EX.Alice, EX.knows, EX.Bob), valid_from="2024-01-01")
+    index = attach_temporal_index(g)
+    assert get_temporal_index(g) is index
+    assert (EX.Alice, EX.knows, EX.Bob) in query_point_in_time(g, "2024-06-01")
+    # Reified statements added behind the index's back are picked up after invalidation
+    other = rdflib.Graph()
+    add_valid_time(other, (EX.Bob, EX.knows, EX.Carol), valid_from="2024-01-01")
+    g += other
+    invalidate_temporal_index(g)
+    assert (EX.Bob, EX.knows, EX.Carol) in query_point_in_time(g, "2024-06-01")
+    assert get_temporal_index(g) is not index
+    # Rebuilding keeps the index settings
+    attach_temporal_index(g, as_of_cache_size=3)
+    invalidate_temporal_index(g)
+    assert get_temporal_index(g).as_of_cache.maxsize == 3
+
+def test_as_of_snapshot_cache_invalidated_on_write():
+    g = rdflib.Graph()
+    index = attach_temporal_index(g, as_of_cache_size=2)
+    add_transaction_time(g, (EX.Alice, EX.knows, EX.Bob), transaction_from="2024-01-01")
+    assert set(query_as_of(g, "2024-06-01")) == {(EX.Alice, EX.knows, EX.Bob)}
+    assert to_epoch("2024-06-01") in index.as_of_cache
+    # A repeat query is served from the cache
+    assert set(query_as_of(g, "2024-06-01")) == {(EX.Alice, EX.knows, EX.Bob)}
+    # A transaction time write invalidates cached snapshots
+    add_transaction_time(g, (EX.Bob, EX.knows, EX.Carol), transaction_from="2024-02-01", transaction_to="2024-03-01")
+    assert to_epoch("2024-06-01") not in index.as_of_cache
+    assert set(query_as_of(g, "2024-02-15")) == {(EX.Alice, EX.knows, EX.Bob), (EX.Bob, EX.knows, EX.Carol)}
+    assert set(query_as_of(g, "2024-06-01")) == {(EX.Alice, EX.knows, EX.Bob)}
+    assert set(query_interval_transaction_time(g, "2023-01-01", "2024-01-15")) == {(EX.Alice, EX.knows, EX.Bob)}
+    # The cache is bounded
+    query_as_of(g, "2024-07-01")
+    assert len(index.as_of_cache) == 2
+
+def test_timestamps_normalized_to_xsd_datetime():
+    g = rdflib.Graph()
+    stmt = add_valid_time(g, (EX.Alice, EX.knows, EX.Bob), valid_from="2024-01-01", valid_to="2024-06-30T12:00:00Z")
+    valid_from = g.value(stmt, AXM.validFrom)
+    assert valid_from.datatype == rdflib.XSD.dateTime
+    assert str(valid_from) == "2024-01-01T00:00:00+00:00"
+    assert str(g.value(stmt, AXM.validTo)) == "2024-06-30T12:00:00+00:00"
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_mixed_precision_and_timezones(indexed):
+    g = rdflib.Graph()
+    if indexed:
+        attach_temporal_index(g)
+    triple = (EX.Alice, EX.knows, EX.Bob)
+    add_valid_time(g, triple, valid_from="2024-01-01T00:00:00Z", valid_to="2024-01-01T10:00:00+05:00")
+    # Date-only and full datetimes denote the same instant
+    assert triple in query_point_in_time(g, "2024-01-01")
+    # 10:00+05:00 is 05:00Z, so 06:00Z is after the interval even though "06" < "10" lexically
+    assert triple not in query_point_in_time(g, "2024-01-01T06:00:00Z")
+    assert triple in query_point_in_time(g, datetime(2024, 1, 1, 4, 59, tzinfo=timezone.utc))
+    assert triple in query_point_in_time(g, datetime(2024, 1, 1, 4, 59))
+
+def test_invalid_timestamp_rejected():
+    g = rdflib.Graph()
+    with pytest.raises(ValueError):
+        add_valid_time(g, (EX.Alice, EX.knows, EX.Bob), valid_from="last tuesday")
+
+def test_temporal_view_filters_without_copying():
+    g = rdflib.Graph()
+    add_valid_time(g, (EX.Alice, EX.knows, EX.Bob), valid_from="2024-01-01", valid_to="2024-06-30")
+    add_valid_time(g, (EX.Bob, EX.knows, EX.Carol), valid_from="2024-07-01")
+    add_transaction_time(g, (EX.Carol, EX.knows, EX.Dave), transaction_from="2024-01-01")
+    view = temporal_view(g, "2024-03-01")
+    assert set(view) == {(EX.Alice, EX.knows, EX.Bob)}
+    assert len(view) == 1
+    assert set(view.triples((EX.Alice, None, None))) == {(EX.Alice, EX.knows, EX.Bob)}
+    assert set(view.triples((None, None, EX.Carol))) == set()
+    assert set(view.triples((None, EX.knows, None))) == {(EX.Alice, EX.knows, EX.Bob)}
+    # Later writes through the temporal helpers are visible
+    add_valid_time(g, (EX.Dave, EX.knows, EX.Erin), valid_from="2024-02-01")
+    assert (EX.Dave, EX.knows, EX.Erin) in view
+    interval = temporal_view(g, "2024-06-15", "2024-07-15")
+    assert set(interval.subjects(EX.knows, None)) == {EX.Alice, EX.Bob, EX.Dave}
+    as_of = temporal_view(g, "2024-06-01", dimension="transaction")
+    assert set(as_of) == {(EX.Carol, EX.knows, EX.Dave)}
+    with pytest.raises(Exception):
+        view.add((EX.Alice, EX.knows, EX.Carol))
+    results = view.query("SELECT ?o WHERE { <http://example.org/Alice> <http://example.org/knows> ?o }")
+    assert [row.o for row in results] == [EX.Bob]
+
+def test_add_bitemporal_uses_one_statement_node():
+    g = rdflib.Graph()
+    attach_temporal_index(g)
+    triple = (EX.Alice, EX.knows, EX.Bob)
+    stmt = add_bitemporal(g, triple, "2024-01-01", "2024-02-01", valid_to="2024-12-31")
+    assert list(g.subjects(rdflib.RDF.type, rdflib.RDF.Statement)) == [stmt]
+    assert len(g) == 7
+    assert triple in query_point_in_time(g, "2024-06-01")
+    assert triple not in query_point_in_time(g, "2025-06-01")
+    assert triple in query_as_of(g, "2024-06-01")
+    assert triple not in query_as_of(g, "2024-01-15")
+    assert triple in query_interval_valid_time(g, "2024-12-01", "2025-01-01")
+
+def test_compact_reification_merges_legacy_nodes():
+    g = rdflib.Graph()
+    index = attach_temporal_index(g)
+    alice, bob = (EX.Alice, EX.knows, EX.Bob), (EX.Bob, EX.knows, EX.Carol)
+    add_valid_time(g, alice, "2024-01-01", "2024-06-30")
+    add_transaction_time(g, alice, "2024-01-02")
+    add_valid_time(g, alice, "2024-07-01")
+    add_transaction_time(g, alice, "2024-07-02")
+    add_valid_time(g, bob, "2024-03-01")
+    before = {time: (set(query_point_in_time(g, time)), set(query_as_of(g, time)))
+              for time in ("2024-01-01", "2024-01-05", "2024-07-01", "2024-08-01")}
+    assert compact_reification(g) == 2
+    assert len(set(g.subjects(rdflib.RDF.type, rdflib.RDF.Statement))) == 3
+    # The index was updated in place, not invalidated and rebuilt
+    assert not index.stale and get_temporal_index(g) is index
+    assert len(index.statements) == 3
+    for time, (valid, known) in before.items():
+        assert set(query_point_in_time(g, time)) == valid
+        assert set(query_as_of(g, time)) == known
+    assert compact_reification(g) == 0
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_close_transaction_time(indexed):
+    g = rdflib.Graph()
+    if indexed:
+        attach_temporal_index(g)
+    triple = (EX.Alice, EX.knows, EX.Bob)
+    add_transaction_time(g, triple, "2024-01-01")
+    add_transaction_time(g, triple, "2024-08-01")
+    add_transaction_time(g, (EX.Alice, EX.knows, EX.Carol), "2024-01-01")
+    assert len(close_transaction_time(g, triple, "2024-06-01")) == 1
+    assert triple in query_as_of(g, "2024-05-01")
+    assert triple not in query_as_of(g, "2024-07-01")
+    assert triple in query_as_of(g, "2024-09-01")
+    assert (EX.Alice, EX.knows, EX.Carol) in query_as_of(g, "2024-07-01")
+    assert close_transaction_time(g, triple, "2024-06-01") == []
+
+def test_add_temporal_triples_matches_per_triple_helpers():
+    triples = [(EX[f"s{i}"], EX.knows, EX[f"o{i}"]) for i in range(5)]
+    batched, single = rdflib.Graph(), rdflib.Graph()
+    attach_temporal_index(batched)
+    stmts = add_temporal_triples(batched, triples, valid_from="2024-01-01", valid_to="2024-06-30", transaction_from="2024-01-02")
+    for triple in triples:
+        single.add(triple)
+        add_bitemporal(single, triple, "2024-01-01", "2024-01-02", valid_to="2024-06-30")
+    assert len(stmts) == 5
+    assert isomorphic(batched, single)
+    assert set(query_point_in_time(batched, "2024-03-01")) == set(triples)
+    assert set(query_as_of(batched, "2024-03-01")) == set(triples)
+    plain = rdflib.Graph()
+    assert add_temporal_triples(plain, triples) == []
+    assert set(plain) == set(triples)
@@ -0,0 +1,62 @@
+import random
+import pytest
+from axiusmem.temporal_index import IntervalIndex, TemporalIndex
+
+def brute_force_overlap(intervals, start, end):
+    return {key for key, (s, e) in intervals.items() if s <= end and (e is None or e >= start)}
+
+def test_interval_index_matches_brute_force():
+    rng = random.Random(42)
+    index = IntervalIndex()
+    intervals = {}
+    for key in range(2000):
+        s = rng.randint(0, 10000)
+        e = None if rng.random() < 0.1 else s + rng.randint(0, 500)
+        index.add(key, s, e)
+        intervals[key] = (s, e)
+    # Mix removals and re-inserts so pending entries and tombstones are exercised
+    for key in rng.sample(range(2000), 300):
+        index.remove(key)
+        del intervals[key]
+    for key in rng.sample(sorted(intervals), 100):
+        s = rng.randint(0, 10000)
+        index.add(key, s, s + 10)
+        intervals[key] = (s, s + 10)
+    for _ in range(200):
+        a = rng.randint(-100, 10600)
+        b = a + rng.choice([0, 0, 5, 200])
+        assert set(index.overlap(a, b)) == brute_force_overlap(intervals, a, b)
+        assert set(index.stab(a)) == brute_force_overlap(intervals, a, a)
+
+def test_interval_index_closed_bounds_and_open_end():
+    index = IntervalIndex()
+    index.add("closed", "2024-01-01", "2024-12-31")
+    index.add("open", "2024-06-01")
+    assert set(index.stab("2024-01-01")) == {"closed"}
+    assert set(index.stab("2024-12-31")) == {"closed", "open"}
+    assert set(index.stab("2030-01-01")) == {"open"}
+    assert set(index.stab("2023-12-31")) == set()
+    index.remove("open")
+    assert "open" not in index
+    assert len(index) == 1
+
+def test_temporal_index_valid_during():
+    index = TemporalIndex()
+    index.add_valid_time("stmt1", ("s", "p", "o1"), "2024-01-01", "2024-06-30")
+    index.add_valid_time("stmt2", ("s", "p", "o2"), "2024-07-01")
+    assert list(index.valid_during("2024-03-01", "2024-03-01")) == [("s", "p", "o1")]
+    assert set(index.valid_during("2024-06-01", "2024-07-15")) == {("s", "p", "o1"), ("s", "p", "o2")}
+    index.discard("stmt1")
+    assert list(index.valid_during("2024-03-01", "2024-03-01")) == []
+
+def test_temporal_index_triple_lookup():
+    index = TemporalIndex()
+    index.add_valid_time("stmt1", ("s", "p", "o"), 1)
+    index.add_transaction_time("stmt1", ("s", "p", "o"), 1)
+    index.add_transaction_time("stmt2", ("s", "p", "o"), 2, 3)
+    assert index.statements_for(("s", "p", "o")) == {"stmt1", "stmt2"}
+    assert index.open_transactions(("s", "p", "o")) == ["stmt1"]
+    index.discard("stmt1")
+    index.discard("stmt2")
+    assert index.statements_for(("s", "p", "o")) == set()
+    assert index.by_triple == {}
@@ -32,4 +32,45 @@ def test_list_and_delete_users(user_manager):
     users = user_manager.list_users()
     assert set(users) == {"dave", "eve"}
     user_manager.delete_user("dave")
-    assert user_manager.list_users() == ["eve"] 
\ No newline at end of file
+    assert user_manager.list_users() == ["eve"] 
+
+def test_index_tracks_changes_and_reloads_from_graph(user_manager):
+    user_manager.create_user("frank", "pw", roles=["agent"])
+    user_manager.assign_role("frank", "admin")
+    assert user_manager.has_user("frank") and user_manager.is_admin("frank")
+    user_manager.delete_user("frank")
+    assert not user_manager.has_user("frank") and not user_manager.is_admin("frank")
+    user_manager.create_user("grace", "pw", roles=["admin"])
+    # A new manager over the same graph rebuilds the index from it
+    reloaded = UserManager(user_manager.graph)
+    assert reloaded.list_users() == ["grace"] and reloaded.get_user_roles("grace") == ["admin"]
+
+
+def test_login_throttle_limits_attempts_per_user(monkeypatch):
+    from axiusmem.user_management import LoginThrottle
+    clock = [0.0]
+    monkeypatch.setattr("axiusmem.user_management.time.monotonic", lambda: clock[0])
+    throttle = LoginThrottle(max_attempts=2, window=60)
+    assert throttle.attempt("alice") == 0 and throttle.attempt("alice") == 0
+    clock[0] = 15
+    assert throttle.attempt("alice") == 45
+    assert throttle.attempt("bob") == 0
+    clock[0] = 60
+    assert throttle.attempt("alice") == 0
+    assert throttle.throttled == 1
+
+
+def test_password_hasher_verifies_and_bounds_pending_calls():
+    import asyncio
+    from axiusmem.user_management import PasswordHasher, PasswordHasherBusy
+    async def run():
+        hasher = PasswordHasher(workers=1)
+        pw_hash = await hasher.hash("secret")
+        results = [await hasher.verify("secret", pw_hash), await hasher.verify("wrong", pw_hash), await hasher.verify("secret", None)]
+        hasher.close()
+        full = PasswordHasher(workers=0, max_pending=1)
+        outcomes = await asyncio.gather(full.hash("a"), full.hash("b"), return_exceptions=True)
+        return results, outcomes, full.rejected
+    results, outcomes, rejected = asyncio.run(run())
+    assert results == [True, False, False]
+    assert isinstance(outcomes[1], PasswordHasherBusy) and rejected == 1